@@ -12,6 +12,11 @@ import re
 from tools.disclosure_routing_tools import DisclosureRouter  # 🆕 공시 라우팅 도구
 from tools.llm_qualitative_analysis_tools import LLMQualitativeAnalyzer  # 🆕 LLM 정성 분석 도구 (실제 뉴스+공시 기반)
 from tools.scoring_missing_data_tools import ScoringWithMissingData  # 🆕 결측값 처리 도구
+from tools.concurrency import get_max_workers, parallel_map
+from concurrent.futures import ThreadPoolExecutor
+from tools.metrics import bind_context
+from tools.budget import low_priority
+from contextlib import nullcontext
 
 
 class FinancialAnalyzerAgent:
@@ -54,11 +59,12 @@ class FinancialAnalyzerAgent:
             # 1.     ( )
             target_companies = self._select_target_companies_from_suppliers(state)
             
-            # 2.    (70%)
-            qualitative_analysis = self._perform_qualitative_analysis(target_companies, state)
-            
-            # 3.    (30%)
-            quantitative_analysis = self._perform_quantitative_analysis(target_companies, state)
+            # 2~3. 정성 분석(70%, 웹 검색 + LLM)과 정량 분석(30%, 재무 API)은 서로 독립적이므로 동시 실행
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                qualitative_future = pool.submit(bind_context(self._perform_qualitative_analysis), target_companies, state)
+                quantitative_future = pool.submit(bind_context(self._perform_quantitative_analysis), target_companies, state)
+                qualitative_analysis = qualitative_future.result()
+                quantitative_analysis = quantitative_future.result()
             
             # 4.    
             investment_scores = self._calculate_investment_scores(
@@ -102,8 +108,8 @@ class FinancialAnalyzerAgent:
         suppliers = state.get('suppliers', [])
         supplier_companies = []
         for supplier in suppliers:
-            company_name = supplier.get('company', '')
-            confidence = supplier.get('overall_confidence', 0.0)
+            company_name = supplier.get('name', supplier.get('company', ''))
+            confidence = supplier.get('confidence_score', supplier.get('overall_confidence', 0.0))
             if company_name:
                 supplier_companies.append({
                     'name': company_name,
@@ -137,7 +143,9 @@ class FinancialAnalyzerAgent:
         
         #  6:   ( 30  )
         #    /     
-        final_companies = [item['name'] for item in deduplicated[:30]]
+        # 상한은 config['max_target_companies'] (기본 30)
+        max_companies = state.get('config', {}).get('max_target_companies', 30)
+        final_companies = [item['name'] for item in deduplicated[:max_companies]]
         
         print(f"   :  {len(final_companies)} ")
         print(f"   OEM: {len([c for c in deduplicated if c['source'] == 'oem'])}")
@@ -152,9 +160,7 @@ class FinancialAnalyzerAgent:
         -    
         -   
         """
-        qualitative_results = {}
-        
-        for company in companies:
+        def analyze_one(company: str) -> Dict[str, Any]:
             try:
                 # 1.      ( )
                 analyst_sentiment_analysis = self._analyze_analyst_sentiment(company, state)
@@ -170,7 +176,7 @@ class FinancialAnalyzerAgent:
                     analyst_sentiment_analysis, market_trend_analysis, supplier_relationship_analysis
                 )
                 
-                qualitative_results[company] = {
+                return {
                     'analyst_sentiment_analysis': analyst_sentiment_analysis,
                     'market_trend_analysis': market_trend_analysis,
                     'supplier_relationship_analysis': supplier_relationship_analysis,
@@ -180,12 +186,14 @@ class FinancialAnalyzerAgent:
                 
             except Exception as e:
                 print(f"    ({company}): {e}")
-                qualitative_results[company] = {
+                return {
                     'qualitative_score': 0.0,
                     'error': str(e)
                 }
         
-        return qualitative_results
+        # 기업 단위 동시 실행 (웹 검색/LLM 호출 대기 시간 중첩)
+        results = parallel_map(analyze_one, companies, get_max_workers(state))
+        return dict(zip(companies, results))
     
     def _analyze_market_trend_impact(self, company: str, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -343,9 +351,7 @@ class FinancialAnalyzerAgent:
     
     def _perform_quantitative_analysis(self, companies: List[str], state: Dict[str, Any]) -> Dict[str, Any]:
         """  """
-        quantitative_results = {}
-        
-        for company in companies:
+        def analyze_one(company: str) -> Dict[str, Any]:
             try:
                 # DART API    
                 financial_analysis = self.dart_tool.get_company_financial_analysis(company)
@@ -353,13 +359,12 @@ class FinancialAnalyzerAgent:
                 #    
                 if not financial_analysis.get('data_available', False):
                     print(f"   [WARNING] {company} -    ( )")
-                    quantitative_results[company] = {
+                    return {
                         'quantitative_score': None,  # None 
                         'data_available': False,
                         'excluded': True,
                         'reason': financial_analysis.get('error', ' ')
                     }
-                    continue
                 
                 #      
                 financial_metrics_analysis = self._analyze_financial_metrics_from_dart(
@@ -370,7 +375,7 @@ class FinancialAnalyzerAgent:
                     financial_metrics_analysis
                 )
                 
-                quantitative_results[company] = {
+                return {
                     'financial_metrics_analysis': financial_metrics_analysis,
                     'quantitative_score': quantitative_score,
                     'analysis_weight': self.quantitative_weight,
@@ -380,14 +385,16 @@ class FinancialAnalyzerAgent:
                 
             except Exception as e:
                 print(f"    ({company}): {e}")
-                quantitative_results[company] = {
+                return {
                     'quantitative_score': None,
                     'data_available': False,
                     'excluded': True,
                     'error': str(e)
                 }
         
-        return quantitative_results
+        # 기업 단위 동시 실행 (DART/SEC/Yahoo API 대기 시간 중첩)
+        results = parallel_map(analyze_one, companies, get_max_workers(state))
+        return dict(zip(companies, results))
     
     def _analyze_financial_metrics_from_dart(self, financial_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """DART API    """
@@ -555,9 +562,11 @@ class FinancialAnalyzerAgent:
                 f"{company} stock analysis recommendation"
             ]
             
-            for query in search_queries:
+            for i, query in enumerate(search_queries):
                 try:
-                    results = self.web_search_tool.search(query, num_results=3)
+                    # 첫 쿼리 외에는 낮은 우선순위 (예산이 부족해지면 생략)
+                    with (low_priority() if i > 0 else nullcontext()):
+                        results = self.web_search_tool.search(query, num_results=3)
                     
                     for result in results:
                         title = result.get('title', '')
@@ -4,23 +4,36 @@ Collects EV-related news via a bootstrap search and returns a structured result
 expected by the workflow graph.
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 from tools.gnews_tool import GNewsTool
 from tools.dart_tagger import DARTTagger
 from tools.sec_tagger import SECTagger
 from tools.sec_edgar_tools import SECEdgarTool
 from tools.trend_analysis_tools import TrendAnalyzer  # 🆕 트렌드 분석 도구
+from tools.budget import low_priority
+from tools.concurrency import get_max_workers
+from tools.metrics import bind_context
+from tools.dedup import ArticleDeduplicator, article_text, canonicalize_url, deduplicate_articles
+from tools.article_store import DEFAULT_STORE_PATH, get_article_store
+from tools.article_stream import ArticleStream
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+# 예산이 부족해도 유지할 시드 쿼리 수 (최신 트렌드 + 공급망 + 한국 기업)
+PRIORITY_SEED_QUERIES = 11
 
 
 class MarketTrendAgent:
-    def __init__(self, web_search_tool, llm_tool, dart_tool=None):
+    def __init__(self, web_search_tool, llm_tool, dart_tool=None, sec_tool=None, gnews_tool=None, yahoo_tool=None):
         self.web_search_tool = web_search_tool
         self.llm_tool = llm_tool
         self.dart_tool = dart_tool
-        self.gnews_tool = GNewsTool()  # GNews 도구 추가
+        self.gnews_tool = gnews_tool or GNewsTool()  # GNews 도구 추가 (배치 실행 시 공유 인스턴스 주입)
         self.dart_tagger = DARTTagger(dart_tool=dart_tool) if dart_tool else None  # DART Tagger 추가
-        self.sec_tool = SECEdgarTool()  # SEC EDGAR 도구 추가
+        self.sec_tool = sec_tool or SECEdgarTool()  # SEC EDGAR 도구 추가
+        self.yahoo_tool = yahoo_tool  # 없으면 첫 사용 시 생성
         self.sec_tagger = SECTagger(sec_tool=self.sec_tool)  # SEC Tagger 추가
         self.trend_analyzer = TrendAnalyzer()  # 🆕 트렌드 분석기
 
@@ -30,10 +43,12 @@ class MarketTrendAgent:
             print("[MarketTrendAgent] Start")
             print("============================")
 
-            news_articles = self._collect_news_articles_bootstrap(state)
+            # 기사가 도착하는 대로 기업 태깅/키워드 집계, 처음 등장한 기업의 공시 수집은 검색 중에 시작
+            with self._create_article_stream(state) as stream:
+                news_articles = self._collect_news_articles_bootstrap(state, stream)
 
-            # DART 공시 데이터 수집
-            disclosure_data = self._collect_disclosures(news_articles, state)
+                # DART 공시 데이터 수집 (선수집된 기업은 그 결과 사용)
+                disclosure_data = self._collect_disclosures(news_articles, state, stream)
             
             # 공시 데이터를 state에 저장
             state['disclosure_data'] = disclosure_data
@@ -43,8 +58,10 @@ class MarketTrendAgent:
             print("    [트렌드 분석 시작]")
             print("    ========================================")
             
-            # 키워드 추출 (불용어 제거됨) - returns Dict[str, List[Tuple[str, int]]]
-            keywords_with_counts = self.trend_analyzer.extract_keywords(news_articles, top_n=20)
+            # 키워드 추출 (불용어 제거됨, 기사별 집계 합산) - returns Dict[str, List[Tuple[str, int]]]
+            keywords_with_counts = self.trend_analyzer.merge_keyword_counts(
+                stream.keyword_counts(news_articles), top_n=20
+            )
             
             # 튜플 리스트를 문자열 리스트로 변환 (기존 코드와 호환성 유지)
             categorized_keywords = {}
@@ -55,7 +72,8 @@ class MarketTrendAgent:
             # 트렌드 분석 (최소 3개 보장)
             market_trends = self.trend_analyzer.analyze_trends_with_fallback(
                 news_articles,
-                clustering_result=[]  # 기존 군집화 결과 없음
+                clustering_result=[],  # 기존 군집화 결과 없음
+                keywords=keywords_with_counts
             )
             
             print(f"    ✅ {len(market_trends)}개 트렌드 식별")
@@ -105,10 +123,43 @@ class MarketTrendAgent:
                 }
             }
 
-    def _collect_news_articles_bootstrap(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _get_article_store(self, state: Dict[str, Any]):
+        """실행 간 공유하는 기사 저장소 (config의 article_store_path가 비어 있으면 사용 안 함)"""
+        path = state.get('config', {}).get('article_store_path', DEFAULT_STORE_PATH)
+        if not path:
+            return None
+        try:
+            return get_article_store(path)
+        except Exception as e:
+            print(f"    [WARNING] 기사 저장소 열기 실패 ({path}): {e} - 저장소 없이 진행")
+            return None
+
+    def _create_article_stream(self, state: Dict[str, Any]) -> ArticleStream:
+        """뉴스 수집 중 기사별 기업 태깅/키워드 집계 + 새 기업 공시 선수집 (DART/SEC)"""
+        relaxed_mode = state.get('config', {}).get('relaxed_mode', True)
+        extractors = {'sec': self.sec_tagger.extract_company_names}
+        prefetchers = {'sec': lambda company: self._fetch_sec_filings(company, state, relaxed_mode)}
+        if self.dart_tagger:
+            extractors['dart'] = self.dart_tagger.extract_company_names
+            if self.dart_tool:
+                prefetchers['dart'] = lambda company: self._fetch_dart_disclosures(company, state)
+        return ArticleStream(
+            extractors,
+            keyword_counter=self.trend_analyzer.count_article_keywords,
+            prefetchers=prefetchers,
+            max_workers=get_max_workers(state)
+        )
+
+    def _collect_news_articles_bootstrap(self, state: Dict[str, Any],
+                                         stream: Optional[ArticleStream] = None) -> List[Dict[str, Any]]:
         articles: List[Dict[str, Any]] = []
         # config에서 최대 뉴스 개수 가져오기 (기본값: 10)
         max_articles = state.get('config', {}).get('max_news_articles', 10)
+        # 시드 쿼리 수가 고정이므로 기사 수를 늘리려면 쿼리당 결과 수도 늘려야 함
+        results_per_query = state.get('config', {}).get('results_per_query', 5)
+        # 최근 N일 이내 기사만 스트림에서 태깅 (오래된 기사는 아래 필터에서 제외되므로)
+        days_ago = state.get('config', {}).get('days_ago', 7)
+        cutoff_date = datetime.now() - timedelta(days=days_ago)
         
         print("\n    ========================================")
         print("    [웹 서치를 통한 뉴스 수집 시작]")
@@ -156,48 +207,127 @@ class MarketTrendAgent:
                 "battery material shortage news"
             ]
             
-            for i, q in enumerate(seed_queries):
-                if len(articles) >= max_articles:
-                    break
-                    
-                try:
-                    remaining = max_articles - len(articles)
-                    results_needed = min(5, remaining)  # 쿼리당 5개로 대폭 증가
-                    
-                    print(f"    [{i+1}/{len(seed_queries)}] '{q}' 웹 검색 중... (남은 자리: {remaining}개)")
-                    results = self.web_search_tool.search(q, num_results=results_needed)
-                    
-                    if not results:
-                        print(f"    [경고] '{q}': 검색 결과가 없습니다 (웹 서치 실패 또는 정보 없음)")
-                        web_search_failed = True
-                    else:
-                        for r in results:
-                            if len(articles) >= max_articles:
-                                break
-                            articles.append({
-                                'title': r.get('title', ''),
-                                'url': r.get('url', ''),
-                                'content': r.get('content', ''),
-                                'publishedAt': r.get('date'),
-                                'source': 'web_search',
-                                'query': q
-                            })
-                        
-                        print(f"    [OK] {len(results)}개 기사 수집 (총 {len(articles)}개)")
-                    
-                except Exception as e:
-                    print(f"    [경고] '{q}' 웹 검색 실패: {e}")
-                    print(f"    → 해당 검색어에 대한 정보를 가져올 수 없습니다.")
-                    web_search_failed = True
-                    continue
+            # 시드 쿼리를 최대 max_workers개 동시 검색 (제공자별 초당 요청 수는 검색 도구의 공유 속도 제한기가 조절)
+            # 진행 중인 검색이 채울 기사 수까지 고려해 새 검색을 시작하고, 목표 기사 수를 채우면 남은 쿼리는 시작하지 않음
+            # 결과는 완료 순서와 관계없이 시드 쿼리 순서대로 합침 (우선순위 높은 쿼리의 기사가 앞에 옴)
+            # 겹치는 쿼리가 같은 기사/배포 사본을 반복해서 가져오므로 수집 수는 중복을 뺀 기사 수로 셈
+            results_by_query: Dict[int, List[Dict[str, Any]]] = {}
+            collected = 0
+            arrivals = ArticleDeduplicator()
+
+            def accept(i: int, q: str, query_articles: List[Dict[str, Any]], label: str):
+                nonlocal collected
+                results_by_query[i] = query_articles
+                new_count = 0
+                for article in query_articles:
+                    if not arrivals.add(article):
+                        continue
+                    new_count += 1
+                    # 새 기사는 바로 기업 태깅/키워드 집계 (새 기업은 공시 수집 시작)
+                    if stream is not None and self._article_time_weight(article, cutoff_date) is not None:
+                        stream.add(article)
+                collected += new_count
+                print(f"    [OK] '{q}' {len(query_articles)}개 기사 {label} (새 기사 {new_count}개, "
+                      f"총 {min(collected, max_articles)}개)")
+
+            # 기사 저장소: 최근에 검색한 쿼리는 저장된 기사로 대체, 나머지는 검색 후 이전 실행에서 모은 기사와 합침
+            store = self._get_article_store(state)
+            remaining_queries = list(enumerate(seed_queries))
+            if store is not None:
+                # 재검색 주기는 실행 주기(article_store_refresh_hours)를 따르되 수집 기간(days_ago)의 1/4을 넘지 않음
+                # (짧은 기간을 수집할 때 저장된 결과가 기간의 대부분을 놓치지 않도록)
+                refresh_hours = min(state.get('config', {}).get('article_store_refresh_hours', 24), days_ago * 24 / 4)
+                fresh_after = datetime.now() - timedelta(hours=refresh_hours)
+                live_queries = []
+                for i, q in remaining_queries:
+                    last_searched = store.last_searched(q)
+                    if last_searched and last_searched >= fresh_after:
+                        stored = store.query_articles(q, since=cutoff_date)
+                        if stored:
+                            accept(i, q, stored, "저장소에서 조회")
+                            continue
+                    live_queries.append((i, q))
+                if len(live_queries) < len(remaining_queries):
+                    print(f"    [STORE] 최근 {refresh_hours:g}시간 내 검색한 쿼리 "
+                          f"{len(remaining_queries) - len(live_queries)}개는 저장된 기사 사용")
+                remaining_queries = live_queries
+
+            def search_seed(i: int, q: str):
+                print(f"    [{i+1}/{len(seed_queries)}] '{q}' 웹 검색 중...")
+                # 최신 트렌드/공급망/한국 기업 쿼리 이후는 낮은 우선순위 (예산이 부족해지면 생략)
+                with (low_priority() if i >= PRIORITY_SEED_QUERIES else nullcontext()):
+                    return self.web_search_tool.search(q, num_results=results_per_query)
+
+            max_workers = max(1, min(get_max_workers(state), len(seed_queries)))
+            futures = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                while remaining_queries or futures:
+                    while remaining_queries and len(futures) < max_workers and \
+                            collected + len(futures) * results_per_query < max_articles:
+                        i, q = remaining_queries.pop(0)
+                        futures[pool.submit(bind_context(search_seed), i, q)] = (i, q)
+                    if not futures:
+                        break
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, q = futures.pop(future)
+                        try:
+                            results = future.result()
+                        except Exception as e:
+                            print(f"    [경고] '{q}' 웹 검색 실패: {e}")
+                            print(f"    → 해당 검색어에 대한 정보를 가져올 수 없습니다.")
+                            web_search_failed = True
+                            continue
+
+                        if not results:
+                            print(f"    [경고] '{q}': 검색 결과가 없습니다 (웹 서치 실패 또는 정보 없음)")
+                            web_search_failed = True
+                            continue
+
+                        query_articles = [self._to_article(r, q) for r in results]
+                        if store is not None:
+                            # 이전 실행에서 같은 쿼리로 모은 기간 내 기사를 뒤에 붙임 (새 검색 결과 우선)
+                            live_urls = {canonicalize_url(a['url']) for a in query_articles}
+                            earlier = [a for a in store.query_articles(q, since=cutoff_date)
+                                       if canonicalize_url(a['url']) not in live_urls]
+                            store.add_articles(query_articles, query=q)
+                            store.mark_searched(q)
+                            query_articles += earlier
+                        accept(i, q, query_articles, "수집")
+
+            if remaining_queries:
+                print(f"    [INFO] 목표 기사 수({max_articles}개) 도달 - 남은 쿼리 {len(remaining_queries)}개 생략")
+
+            for i in sorted(results_by_query):
+                articles.extend(results_by_query[i])
+            
+            # URL/본문 지문이 같은 기사는 먼저 나온(우선순위 높은 쿼리) 기사만 남김
+            articles = deduplicate_articles(articles)[:max_articles]
         
         # 3. 최근 N일 이내 필터링 (config에서 설정)
-        days_ago = state.get('config', {}).get('days_ago', 7)
         articles = self._filter_recent_articles(articles, days=days_ago)
         
         # 4. 최대 개수 제한
         articles = articles[:max_articles]
         
+        # 4-1. (선택) 검색 스니펫 대신 기사 본문 사용 - 본문이 바뀐 기사는 스트림에서 다시 태깅/집계
+        config = state.get('config', {})
+        if config.get('fetch_full_text') and articles and hasattr(self.web_search_tool, 'enrich_articles'):
+            self.web_search_tool.enrich_articles(articles, config.get('full_text_max_chars', 4000))
+            if stream is not None:
+                for article in articles:
+                    if 'snippet' in article:
+                        stream.add(article)
+        
+        # 4-2. 최종 기사의 본문/추출 기업을 저장소에 반영 (다음 실행에서 재사용)
+        store = self._get_article_store(state)
+        if store is not None and articles:
+            store.add_articles(articles)
+            if stream is not None:
+                store.set_entities({article.get('url', ''): stream.entities(article) for article in articles})
+            print(f"    [STORE] 기사 저장소: {store.stats()['articles']}개 기사")
+        
         # 5. 결과 요약
         print("    ========================================")
         if len(articles) == 0:
@@ -217,48 +347,13 @@ class MarketTrendAgent:
         """
         최근 N일 이내 뉴스만 필터링하고 시간 가중치 부여
         """
-        from datetime import datetime, timedelta
-        
         cutoff_date = datetime.now() - timedelta(days=days)
         recent_articles = []
         
         for article in articles:
-            published_at = article.get('publishedAt', '')
-            if published_at:
-                try:
-                    # ISO 형식 날짜 파싱
-                    if 'T' in published_at:
-                        pub_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    else:
-                        pub_date = datetime.fromisoformat(published_at)
-                    
-                    if pub_date >= cutoff_date:
-                        # 시간 가중치 계산 (최근일수록 높은 가중치)
-                        days_ago = (datetime.now() - pub_date.replace(tzinfo=None)).days
-                        
-                        if days_ago <= 7:
-                            weight = 1.0  # 1주일 이내 - 최고 가중치
-                        elif days_ago <= 14:
-                            weight = 0.8  # 2주 이내
-                        elif days_ago <= 21:
-                            weight = 0.6  # 3주 이내
-                        elif days_ago <= 28:
-                            weight = 0.4  # 4주 이내
-                        else:
-                            weight = 0.2  # 그 이상
-                        
-                        article['time_weight'] = weight
-                        article['days_ago'] = days_ago
-                        recent_articles.append(article)
-                except:
-                    # 날짜 파싱 실패 시 중간 가중치로 포함
-                    article['time_weight'] = 0.5
-                    article['days_ago'] = 15
-                    recent_articles.append(article)
-            else:
-                # 날짜 정보가 없으면 낮은 가중치로 포함
-                article['time_weight'] = 0.3
-                article['days_ago'] = 30
+            weighted = self._article_time_weight(article, cutoff_date)
+            if weighted is not None:
+                article['time_weight'], article['days_ago'] = weighted
                 recent_articles.append(article)
         
         # 시간 가중치 순으로 정렬 (최근 기사가 먼저)
@@ -278,10 +373,59 @@ class MarketTrendAgent:
         
         return recent_articles
 
+    @staticmethod
+    def _to_article(result: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """검색 결과 → 뉴스 기사 형식"""
+        return {
+            'title': result.get('title', ''),
+            'url': result.get('url', ''),
+            'content': result.get('content', ''),
+            'publishedAt': result.get('date'),
+            'source': 'web_search',
+            'query': query
+        }
+
+    @staticmethod
+    def _article_time_weight(article: Dict[str, Any], cutoff_date: datetime) -> Optional[Tuple[float, int]]:
+        """(시간 가중치, 경과 일수), cutoff_date 이전 기사는 None"""
+        published_at = article.get('publishedAt', '')
+        if not published_at:
+            # 날짜 정보가 없으면 낮은 가중치로 포함
+            return 0.3, 30
+        
+        try:
+            # ISO 형식 날짜 파싱
+            if 'T' in published_at:
+                pub_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+            else:
+                pub_date = datetime.fromisoformat(published_at)
+            
+            if pub_date < cutoff_date:
+                return None
+            
+            # 시간 가중치 계산 (최근일수록 높은 가중치)
+            days_ago = (datetime.now() - pub_date.replace(tzinfo=None)).days
+            
+            if days_ago <= 7:
+                weight = 1.0  # 1주일 이내 - 최고 가중치
+            elif days_ago <= 14:
+                weight = 0.8  # 2주 이내
+            elif days_ago <= 21:
+                weight = 0.6  # 3주 이내
+            elif days_ago <= 28:
+                weight = 0.4  # 4주 이내
+            else:
+                weight = 0.2  # 그 이상
+            return weight, days_ago
+        except:
+            # 날짜 파싱 실패 시 중간 가중치로 포함
+            return 0.5, 15
+
     def _collect_disclosures(
         self, 
         news_articles: List[Dict[str, Any]], 
-        state: Dict[str, Any]
+        state: Dict[str, Any],
+        stream: Optional[ArticleStream] = None
     ) -> List[Dict[str, Any]]:
         """
         뉴스 기사에서 기업명을 추출하여 공시 데이터 수집
@@ -295,21 +439,27 @@ class MarketTrendAgent:
         relaxed_mode = state.get('config', {}).get('relaxed_mode', True)
         
         # 1. 뉴스 기사에서 텍스트 추출
-        all_text = ' '.join([
-            f"{article.get('title', '')} {article.get('content', '')}" 
-            for article in news_articles
-        ]) if news_articles else ""
+        has_text = any(article_text(article).strip() for article in news_articles)
         
         # 텍스트가 없으면 기본 기업 리스트 사용
         using_default_list = False
-        if not all_text.strip():
+        if not has_text:
             print("    ⚠️  [경고] 뉴스 기사가 없습니다!")
             print("    → 웹 서치 실패로 인해 뉴스에서 기업을 추출할 수 없습니다.")
             print("    → 대신 기본 기업 리스트를 사용하여 공시를 수집합니다.")
             korean_companies = ['LG에너지솔루션', '삼성SDI', 'SK온', '현대자동차', '기아']
             overseas_companies = ['Tesla', 'GM', 'Ford', 'BMW', 'BYD']
             using_default_list = True
+        elif stream is not None:
+            # 기사가 도착할 때 추출한 기업을 합침 (태거 사전 순서, 전체 텍스트에서 추출한 결과와 동일)
+            korean_companies = stream.companies(
+                'dart', news_articles, order=self.dart_tagger.KOREAN_EV_COMPANIES
+            ) if self.dart_tagger else []
+            overseas_companies = stream.companies(
+                'sec', news_articles, order=self.sec_tagger.OVERSEAS_EV_COMPANIES
+            )
         else:
+            all_text = ' '.join(article_text(article) for article in news_articles)
             # 한국 기업 추출
             korean_companies = self.dart_tagger.extract_company_names(all_text) if self.dart_tagger else []
             # 해외 기업 추출
@@ -351,7 +501,7 @@ class MarketTrendAgent:
         # ==============================================
         if self.dart_tool and self.dart_tagger and korean_companies:
             disclosure_data.extend(
-                self._collect_dart_disclosures(korean_companies, state, relaxed_mode)
+                self._collect_dart_disclosures(korean_companies, state, relaxed_mode, stream)
             )
         
         # ==============================================
@@ -359,7 +509,7 @@ class MarketTrendAgent:
         # ==============================================
         if sec_companies:
             disclosure_data.extend(
-                self._collect_sec_disclosures(sec_companies, state, relaxed_mode)
+                self._collect_sec_disclosures(sec_companies, state, relaxed_mode, stream)
             )
         
         # ==============================================
@@ -387,11 +537,29 @@ class MarketTrendAgent:
         
         return disclosure_data
     
+    def _fetch_dart_disclosures(self, company: str, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """기업 1곳의 최근 DART 공시 (스트림 선수집과 _collect_dart_disclosures 공용)"""
+        days_ago = state.get('config', {}).get('days_ago', 30)
+        return self.dart_tagger.collect_company_disclosures([company], days=days_ago)
+
+    def _fetch_sec_filings(self, company: str, state: Dict[str, Any],
+                           relaxed_mode: bool) -> Optional[List[Dict[str, Any]]]:
+        """기업 1곳의 최근 SEC 공시 (SEC 대상 기업이 아니면 None)"""
+        if company not in self.sec_tagger.classify_companies_by_source([company]).get('SEC', []):
+            return None
+        max_sec_filings = state.get('config', {}).get('max_sec_filings_per_company', 8)
+        return self.sec_tagger.collect_company_filings(
+            [company],
+            max_filings=max_sec_filings,
+            relaxed_mode=relaxed_mode
+        )
+
     def _collect_dart_disclosures(
         self, 
         company_names: List[str], 
         state: Dict[str, Any],
-        relaxed_mode: bool
+        relaxed_mode: bool,
+        stream: Optional[ArticleStream] = None
     ) -> List[Dict[str, Any]]:
         """한국 기업 DART 공시 수집"""
         disclosure_data = []
@@ -407,17 +575,15 @@ class MarketTrendAgent:
             if len(company_names) > 5:
                 print(f"        ... 외 {len(company_names) - 5}개")
             
-            # 각 기업의 최근 공시 수집
-            days_ago = state.get('config', {}).get('days_ago', 30)
+            # 각 기업의 최근 공시 수집 (뉴스 수집 중 선수집된 기업은 그 결과 사용)
             max_disclosures = state.get('config', {}).get('max_disclosures_per_company', 10)
             
             all_disclosures = []
             for company in company_names:
                 try:
-                    company_disclosures = self.dart_tagger.collect_company_disclosures(
-                        [company], 
-                        days=days_ago
-                    )
+                    company_disclosures = stream.prefetched('dart', company) if stream is not None else None
+                    if company_disclosures is None:
+                        company_disclosures = self._fetch_dart_disclosures(company, state)
                     all_disclosures.extend(company_disclosures[:max_disclosures])
                 except Exception as e:
                     if relaxed_mode:
@@ -469,7 +635,8 @@ class MarketTrendAgent:
         self, 
         company_names: List[str], 
         state: Dict[str, Any],
-        relaxed_mode: bool
+        relaxed_mode: bool,
+        stream: Optional[ArticleStream] = None
     ) -> List[Dict[str, Any]]:
         """미국 기업 SEC EDGAR 공시 수집"""
         disclosure_data = []
@@ -485,13 +652,21 @@ class MarketTrendAgent:
             if len(company_names) > 5:
                 print(f"        ... 외 {len(company_names) - 5}개")
             
-            # 각 기업의 최근 공시 수집
-            max_sec_filings = state.get('config', {}).get('max_sec_filings_per_company', 8)
-            overseas_filings = self.sec_tagger.collect_company_filings(
-                company_names,
-                max_filings=max_sec_filings,
-                relaxed_mode=relaxed_mode
-            )
+            # 각 기업의 최근 공시 수집 (뉴스 수집 중 선수집된 기업은 그 결과 사용)
+            if stream is None:
+                max_sec_filings = state.get('config', {}).get('max_sec_filings_per_company', 8)
+                overseas_filings = self.sec_tagger.collect_company_filings(
+                    company_names,
+                    max_filings=max_sec_filings,
+                    relaxed_mode=relaxed_mode
+                )
+            else:
+                overseas_filings = []
+                for company in company_names:
+                    filings = stream.prefetched('sec', company)
+                    if filings is None:
+                        filings = self._fetch_sec_filings(company, state, relaxed_mode)
+                    overseas_filings.extend(filings or [])
             
             # EV 관련 공시만 필터링
             if overseas_filings:
@@ -566,7 +741,9 @@ class MarketTrendAgent:
             
             # Yahoo Finance 도구 import
             from tools.yahoo_finance_tools import YahooFinanceTool
-            yahoo_tool = YahooFinanceTool()
+            if self.yahoo_tool is None:
+                self.yahoo_tool = YahooFinanceTool()
+            yahoo_tool = self.yahoo_tool
             
             for company_name in company_names:
                 try:
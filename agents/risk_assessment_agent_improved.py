@@ -9,6 +9,9 @@ import json
 import math
 import re
 from tools.json_parser import parse_llm_json  # 🆕 강력한 JSON 파서
+from tools.concurrency import get_max_workers, parallel_map
+from tools.budget import low_priority
+from contextlib import nullcontext
 
 
 class RiskAssessmentAgent:
@@ -148,21 +151,22 @@ class RiskAssessmentAgent:
                     }
                 }
             
-            #    
-            risk_results = {}
-            for company in companies:
+            #    (기업 단위 동시 실행)
+            def analyze_one(company: str) -> Dict[str, Any]:
                 try:
                     print(f"    {company}   ...")
-                    risk_analysis = self._analyze_company_risks(company, state)
-                    risk_results[company] = risk_analysis
+                    return self._analyze_company_risks(company, state)
                 except Exception as e:
                     print(f"   [FAIL] {company}   : {e}")
-                    risk_results[company] = {
+                    return {
                         'overall_risk_score': 0.5,
                         'risk_level': 'medium',
                         'error': str(e)
                     }
             
+            results = parallel_map(analyze_one, companies, get_max_workers(state))
+            risk_results = dict(zip(companies, results))
+            
             # 🆕 상대적 리스크 재분류 (최소 1개씩 보장)
             risk_results = self._reclassify_risk_levels_relative(risk_results)
             
@@ -194,9 +198,28 @@ class RiskAssessmentAgent:
                 }
             }
     
+    def prefetch_qualitative_risks(self, state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        정성 리스크 사전 수집 (suppliers만 필요)
+        DAG 실행기에서 재무 분석과 동시에 실행되며,
+        결과는 state['qualitative_risks']로 analyze_risks()에서 재사용
+        """
+        companies = self._extract_companies_from_state(state)
+        
+        print(f"    정성 리스크 사전 수집 대상: {len(companies)}개 기업")
+        
+        results = parallel_map(
+            lambda company: self._analyze_qualitative_risks(company, state),
+            companies,
+            get_max_workers(state)
+        )
+        
+        return dict(zip(companies, results))
+    
     def _extract_companies_from_state(self, state: Dict[str, Any]) -> List[str]:
         """    """
         companies = []
+        priority = {}  # 기업명 → 우선순위 (공급업체 신뢰도, 재무 분석 대상은 1.0)
 
         #
         suppliers = state.get('suppliers', [])
@@ -206,6 +229,8 @@ class RiskAssessmentAgent:
                 #       ( , 1 )
                 if company_name and len(company_name.strip()) > 1 and not company_name.startswith('_'):
                     companies.append(company_name)
+                    confidence = supplier.get('confidence_score', supplier.get('overall_confidence', 0.0)) or 0.0
+                    priority[company_name] = max(priority.get(company_name, 0.0), confidence)
 
         #
         financial_analysis = state.get('financial_analysis', {})
@@ -216,14 +241,19 @@ class RiskAssessmentAgent:
                     company_name = value['company_name']
                     if company_name and len(company_name.strip()) > 1:
                         companies.append(company_name)
+                        priority[company_name] = 1.0
                 # key    (      )
                 elif key in self.listed_companies and len(key) > 1:
                     companies.append(key)
+                    priority[key] = 1.0
 
         #    ( )
         filtered_companies = [c for c in companies if len(c.strip()) > 1 and not c.startswith('_')]
 
-        return list(set(filtered_companies))
+        # 중복 제거 후 우선순위 순 (예산이 부족해져도 중요한 기업의 검색이 먼저 실행됨)
+        unique_companies = list(dict.fromkeys(filtered_companies))
+        unique_companies.sort(key=lambda company: priority.get(company, 0.0), reverse=True)
+        return unique_companies
     
     def _analyze_company_risks(self, company: str, state: Dict[str, Any]) -> Dict[str, Any]:
         """   """
@@ -231,8 +261,12 @@ class RiskAssessmentAgent:
             # 1.    (80%)
             quantitative_risks = self._analyze_quantitative_risks(company, state)
             
-            # 2.    (20%)
-            qualitative_risks = self._analyze_qualitative_risks(company, state)
+            # 2.    (20%) - 사전 수집 결과가 있으면 재사용
+            prefetched_risks = state.get('qualitative_risks', {}) or {}
+            if company in prefetched_risks:
+                qualitative_risks = prefetched_risks[company]
+            else:
+                qualitative_risks = self._analyze_qualitative_risks(company, state)
             
             # 3.    
             overall_risk_score = self._calculate_overall_risk_score(
@@ -626,14 +660,16 @@ class RiskAssessmentAgent:
             ]
             
             risks = []
-            for query in search_queries:
-                #    
-                search_results = self._search_web_risks(query, company, 'governance')
-                
-                # LLM      
-                extracted_risks = self._extract_risks_with_llm(
-                    search_results, company, 'governance'
-                )
+            for i, query in enumerate(search_queries):
+                # 첫 쿼리 외에는 낮은 우선순위 (예산이 부족해지면 생략)
+                with (low_priority() if i > 0 else nullcontext()):
+                    #    
+                    search_results = self._search_web_risks(query, company, 'governance')
+                    
+                    # LLM      
+                    extracted_risks = self._extract_risks_with_llm(
+                        search_results, company, 'governance'
+                    )
                 risks.extend(extracted_risks)
             
             return risks
@@ -652,11 +688,12 @@ class RiskAssessmentAgent:
             ]
             
             risks = []
-            for query in search_queries:
-                search_results = self._search_web_risks(query, company, 'legal')
-                extracted_risks = self._extract_risks_with_llm(
-                    search_results, company, 'legal'
-                )
+            for i, query in enumerate(search_queries):
+                with (low_priority() if i > 0 else nullcontext()):
+                    search_results = self._search_web_risks(query, company, 'legal')
+                    extracted_risks = self._extract_risks_with_llm(
+                        search_results, company, 'legal'
+                    )
                 risks.extend(extracted_risks)
             
             return risks
@@ -675,11 +712,12 @@ class RiskAssessmentAgent:
             ]
             
             risks = []
-            for query in search_queries:
-                search_results = self._search_web_risks(query, company, 'management')
-                extracted_risks = self._extract_risks_with_llm(
-                    search_results, company, 'management'
-                )
+            for i, query in enumerate(search_queries):
+                with (low_priority() if i > 0 else nullcontext()):
+                    search_results = self._search_web_risks(query, company, 'management')
+                    extracted_risks = self._extract_risks_with_llm(
+                        search_results, company, 'management'
+                    )
                 risks.extend(extracted_risks)
             
             return risks
@@ -8,6 +8,8 @@ from config.settings import config, SUPPLIER_RELATIONSHIP_MAPPING
 from datetime import datetime
 import re
 from tools.supplier_scoring_tools import SupplierScorer  # 🆕 공급망 스코어링 도구
+from tools.budget import low_priority
+from contextlib import nullcontext
 
 
 class SupplierMatchingAgent:
@@ -454,10 +456,12 @@ class SupplierMatchingAgent:
             relationships = []
             
             # 각 OEM과의 관계 검색 (API 한도 고려하여 상위 3개만)
-            for oem in major_oems[:3]:
+            for i, oem in enumerate(major_oems[:3]):
                 query = f"{supplier_name} supplier {oem} partnership"
                 try:
-                    results = self.web_search_tool.search(query, num_results=1)
+                    # 첫 OEM 외에는 낮은 우선순위 (예산이 부족해지면 생략)
+                    with (low_priority() if i > 0 else nullcontext()):
+                        results = self.web_search_tool.search(query, num_results=1)
                     
                     if results:
                         content = results[0].get('content', '').lower()
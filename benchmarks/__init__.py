@@ -0,0 +1,5 @@
+"""
+오프라인 벤치마크
+실제 파이프라인(main.run_report)을 로컬 대체 제공자(stand-in)와 합성 코퍼스로 실행하여
+기사/기업 수에 따른 실행 시간, 최대 메모리, 노드별 호출 수를 측정
+"""
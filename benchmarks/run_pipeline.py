@@ -0,0 +1,246 @@
+"""
+전체 파이프라인 오프라인 벤치마크
+
+사용법:
+    python -m benchmarks.run_pipeline                                  # 기본 시나리오 (100/10, 1000/100, 10000/1000)
+    python -m benchmarks.run_pipeline --scenario 500:50 --scenario 2000:200
+    python -m benchmarks.run_pipeline --latency-scale 0.1              # 지연 1/10로 축소 (빠른 확인용)
+
+시나리오마다 별도 프로세스에서 main.run_report를 실행하여 최대 RSS를 분리 측정
+(작업 디렉토리는 임시 폴더이므로 cache/, checkpoints/, outputs/가 저장소에 남지 않음)
+결과: outputs/benchmark_<timestamp>.json
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SCENARIOS = [(100, 10), (1000, 100), (10000, 1000)]
+NEWS_SEED_QUERIES = 21  # MarketTrendAgent 시드 쿼리 수 (기사 수 → 쿼리당 결과 수 계산)
+
+# 결과 표에 표시할 노드별 호출 지표
+CALL_KEYS = ('web_search_calls', 'llm_calls', 'dart_calls', 'sec_calls', 'yahoo_calls', 'http_requests')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="전체 파이프라인 오프라인 벤치마크")
+    parser.add_argument(
+        '--scenario', action='append', metavar='ARTICLES:COMPANIES',
+        help='기사 수:기업 수 (여러 번 지정 가능, 기본: 100:10 1000:100 10000:1000)'
+    )
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='제공자 지연 배율 (0이면 지연 없음)')
+    parser.add_argument('--registry-size', type=int, default=None, help='DART 기업 코드 파일의 법인 수')
+    parser.add_argument('--max-workers', type=int, default=4, help='노드/기업 단위 최대 동시 실행 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep-workdir', action='store_true', help='시나리오 작업 디렉토리(로그, 보고서) 유지')
+    # 내부용: 시나리오 1건 실행 (부모 프로세스가 호출)
+    parser.add_argument('--child', metavar='RESULT_JSON', help=argparse.SUPPRESS)
+    parser.add_argument('--articles', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--companies', type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def parse_scenario(value: str) -> Tuple[int, int]:
+    articles, companies = value.split(':')
+    return int(articles), int(companies)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, resource 모듈이 없는 Windows는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def pad_suppliers(func, corpus, count: int):
+    """
+    공급업체 노드 출력을 합성 기업으로 count개까지 채움
+    공급업체 발견은 알려진 기업명 목록 매칭이므로 코퍼스만으로는 기업 수를 늘릴 수 없음
+    """
+    def supplier_matching_node(state):
+        result = func(state)
+        suppliers = list(result.get('suppliers') or [])
+        existing = {supplier.get('name') for supplier in suppliers}
+        for company in corpus.companies:
+            if len(suppliers) >= count:
+                break
+            if company['name'] not in existing:
+                suppliers.append(corpus.supplier_record(company, len(suppliers) + 1))
+        result['suppliers'] = suppliers
+        return result
+
+    return supplier_matching_node
+
+
+def run_scenario(articles: int, companies: int, args) -> Dict[str, Any]:
+    """시나리오 1건 실행 (자식 프로세스)"""
+    # 기록/재생 어댑터가 대체 어댑터를 덮지 않도록 외부 전송 모드 해제
+    os.environ['HTTP_TRANSPORT_MODE'] = 'off'
+    os.environ['ALPHA_VANTAGE_ENABLED'] = '0'
+
+    import main
+    from benchmarks.stand_ins import DEFAULT_REGISTRY_SIZE, LatencyModel, SyntheticCorpus, create_stand_in_tools
+    from workflow.checkpoint import CheckpointStore
+    from workflow.graph import create_executor
+
+    corpus = SyntheticCorpus(articles, companies, seed=args.seed,
+                             registry_size=args.registry_size or DEFAULT_REGISTRY_SIZE)
+    latency = LatencyModel(scale=args.latency_scale, seed=args.seed)
+
+    config = main.build_config({
+        'max_news_articles': articles,
+        'results_per_query': max(1, math.ceil(articles / NEWS_SEED_QUERIES)),
+        'max_target_companies': companies,
+        'max_workers': args.max_workers,
+        'memo_enabled': False
+    })
+    main.print_config(config)
+
+    start = time.perf_counter()
+    tools = create_stand_in_tools(corpus, latency)
+    setup_time = time.perf_counter() - start
+
+    executor = create_executor(
+        web_search_tool=tools['web_search'],
+        llm_tool=tools['llm'],
+        dart_tool=tools['dart'],
+        sec_tool=tools['sec'],
+        max_workers=config['max_workers'],
+        gnews_tool=tools['gnews'],
+        yahoo_tool=tools['yahoo']
+    )
+    for stage in executor.stages:
+        if stage.name == 'supplier_matching_node':
+            stage.func = pad_suppliers(stage.func, corpus, companies)
+
+    label = f"bench_{articles}_{companies}"
+    final_state = main.run_report(
+        config, tools, None, CheckpointStore(run_id=label), label=label, executor=executor
+    )
+    wall_time = time.perf_counter() - start
+
+    result = {
+        'articles': articles,
+        'companies': companies,
+        'latency_scale': args.latency_scale,
+        'max_workers': args.max_workers,
+        'setup_time': round(setup_time, 3),
+        'wall_time': round(wall_time, 3),
+        'peak_rss_mb': peak_rss_mb(),
+        'completed': final_state is not None
+    }
+    if final_state is not None:
+        metrics = final_state.get('metrics') or {}
+        result.update({
+            'news_articles': len(final_state['news_articles']),
+            'suppliers': len(final_state['suppliers']),
+            'financial_companies': len(final_state.get('financial_analysis') or {}),
+            'errors': [f"{error['agent']}: {error['error'][:200]}" for error in final_state['errors']],
+            'nodes': metrics.get('nodes', {}),
+            'totals': metrics.get('totals', {})
+        })
+    return result
+
+
+def run_child(articles: int, companies: int, args) -> Dict[str, Any]:
+    """시나리오를 별도 프로세스/임시 디렉토리에서 실행"""
+    workdir = tempfile.mkdtemp(prefix=f"evi_bench_{articles}_{companies}_")
+    result_path = os.path.join(workdir, 'result.json')
+    log_path = os.path.join(workdir, 'run.log')
+
+    command = [
+        sys.executable, '-m', 'benchmarks.run_pipeline', '--child', result_path,
+        '--articles', str(articles), '--companies', str(companies),
+        '--latency-scale', str(args.latency_scale), '--max-workers', str(args.max_workers),
+        '--seed', str(args.seed)
+    ]
+    if args.registry_size:
+        command += ['--registry-size', str(args.registry_size)]
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+    env['PYTHONIOENCODING'] = 'utf-8'
+
+    print(f"[벤치마크] 기사 {articles:,}개 / 기업 {companies:,}개 실행 중... (로그: {log_path})")
+    with open(log_path, 'w', encoding='utf-8') as log:
+        completed = subprocess.run(command, cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    if completed.returncode != 0 or not os.path.exists(result_path):
+        print(f"   [FAIL] 종료 코드 {completed.returncode} - 로그 확인: {log_path}")
+        return {'articles': articles, 'companies': companies, 'completed': False, 'log': log_path}
+
+    with open(result_path, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+
+    if args.keep_workdir:
+        result['workdir'] = workdir
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    rss = result.get('peak_rss_mb')
+    print(f"   [OK] {result['wall_time']:.1f}s, 최대 RSS {rss:.0f}MB" if rss is not None
+          else f"   [OK] {result['wall_time']:.1f}s")
+    return result
+
+
+def print_summary(results: List[Dict[str, Any]]) -> None:
+    print("\n" + "=" * 70)
+    print("[벤치마크 결과]")
+    print("=" * 70)
+
+    for result in results:
+        title = f"기사 {result['articles']:,} / 기업 {result['companies']:,}"
+        if not result.get('completed'):
+            print(f"\n{title}: 실패")
+            continue
+
+        rss = result.get('peak_rss_mb')
+        print(f"\n{title}: {result['wall_time']:.1f}s (도구 준비 {result['setup_time']:.1f}s), "
+              f"최대 RSS {f'{rss:.0f}MB' if rss is not None else 'N/A'}")
+        print(f"   수집 기사 {result['news_articles']:,}개, 공급업체 {result['suppliers']:,}개, "
+              f"재무 분석 {result['financial_companies']:,}개, 에러 {len(result['errors'])}건")
+
+        header = f"   {'node':<28}{'wall(s)':>9}{'cpu(s)':>8}" + ''.join(f"{key.replace('_calls', ''):>10}" for key in CALL_KEYS)
+        print(header)
+        for name, values in result['nodes'].items():
+            print(f"   {name:<28}{values.get('wall_time', 0):>9.1f}{values.get('cpu_time', 0):>8.1f}"
+                  + ''.join(f"{int(values.get(key, 0)):>10}" for key in CALL_KEYS))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.child:
+        result = run_scenario(args.articles, args.companies, args)
+        with open(args.child, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        return
+
+    scenarios = [parse_scenario(value) for value in args.scenario] if args.scenario else DEFAULT_SCENARIOS
+    results = [run_child(articles, companies, args) for articles, companies in scenarios]
+    print_summary(results)
+
+    output_dir = os.path.join(REPO_ROOT, "outputs")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'scenarios': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
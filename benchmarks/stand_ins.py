@@ -0,0 +1,483 @@
+"""
+벤치마크용 대체 제공자 (stand-in)
+외부 API 대신 합성 코퍼스에서 응답을 만들고, 제공자별 로그정규 지연을 적용
+
+- DART/SEC/Yahoo/GNews: 실제 도구 클래스를 그대로 쓰고 세션에 StandInAdapter만 장착
+  (응답 파싱, 캐시, 세션 지표, 도구 내부 대기 시간까지 실제 경로로 측정)
+- LLM: 실제 OpenAILLM + OpenAI 클라이언트, httpx 전송 계층만 대체
+- 웹 검색: Tavily는 요청당 결과를 10개로 제한하므로 검색 도구 인터페이스(search/fetch)를 직접 대체
+"""
+
+import hashlib
+import io
+import json
+import math
+import random
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from tools.budget import WEB_SEARCH, spend
+from tools.metrics import record
+
+
+# 제공자별 응답 지연 (중앙값 초, 로그정규 sigma)
+PROVIDER_LATENCY = {
+    'web_search': (0.9, 0.45),
+    'dart': (0.25, 0.5),
+    'sec': (0.3, 0.4),
+    'yahoo': (0.15, 0.5),
+    'gnews': (0.4, 0.4),
+    'llm': (0.5, 0.35),  # 첫 토큰까지
+    'other': (0.2, 0.5)
+}
+LLM_SECONDS_PER_TOKEN = 0.015  # 출력 토큰당 생성 시간
+BYTES_PER_SECOND = 20 * 1024 * 1024  # 응답 본문 전송 속도
+
+# DART 기업 코드 파일의 전체 법인 수 (실제 corpCode.xml은 약 10만 건)
+DEFAULT_REGISTRY_SIZE = 100_000
+
+KNOWN_COMPANIES = [
+    'Tesla', 'BYD', 'Hyundai', 'Kia', 'GM', 'Ford', 'Volkswagen', 'BMW', 'Rivian', 'Nio',
+    'LG Energy Solution', 'Samsung SDI', 'SK On', 'CATL', 'Panasonic', 'Albemarle'
+]
+KOREAN_REGISTRY = ['삼성SDI', 'LG에너지솔루션', '현대자동차', '기아', 'SK이노베이션', 'LG화학', '에코프로비엠', '포스코퓨처엠']
+CATEGORIES = ['Battery', 'Materials', 'Charging', 'Semiconductor', 'Motor', 'Software']
+TOPICS = ['battery supply', 'charging network', 'EV sales', 'solid-state cells', 'lithium prices',
+          'cathode capacity', 'autonomous driving', 'battery recycling']
+OUTLETS = ['Reuters', 'Bloomberg', 'Electrek', 'InsideEVs', 'Korea Herald', 'Nikkei Asia']
+
+TITLE_TEMPLATES = [
+    "{company} expands {topic} as EV demand grows",
+    "{company} reports record quarter on {topic}",
+    "Analysts weigh {company} outlook amid {topic} shift",
+    "{company} signs supply deal for {topic}",
+]
+SENTENCES = [
+    "{company} said it would raise investment in {topic} by {pct}% next year.",
+    "The electric vehicle market grew {pct}% year over year, led by {other}.",
+    "Battery makers including {other} are competing for long-term supply contracts.",
+    "Charging infrastructure spending rose {pct}% as governments extended EV subsidies.",
+    "{company} shares moved {pct}% after the announcement on {topic}.",
+    "Supply chain pressure on lithium and nickel eased, according to {other}.",
+    "Regulators are reviewing new rules that could affect {company} and {other}.",
+]
+
+
+class LatencyModel:
+    """제공자별 로그정규 지연 (seed 고정 시 결정적)"""
+
+    def __init__(self, scale: float = 1.0, seed: int = 0):
+        self.scale = scale
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, provider: str, extra: float = 0.0) -> float:
+        median, sigma = PROVIDER_LATENCY.get(provider, PROVIDER_LATENCY['other'])
+        with self._lock:
+            value = self._rng.lognormvariate(math.log(median), sigma)
+        return (value + extra) * self.scale
+
+    def sleep(self, provider: str, extra: float = 0.0) -> None:
+        delay = self.sample(provider, extra)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _stable_int(*parts: Any) -> int:
+    return int(hashlib.sha1(':'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:12], 16)
+
+
+class SyntheticCorpus:
+    """
+    합성 뉴스/기업 코퍼스
+    기사는 인덱스로부터 결정적으로 생성 (10,000건도 메모리에 미리 만들지 않음)
+    """
+
+    def __init__(self, num_articles: int, num_companies: int, seed: int = 0,
+                 registry_size: int = DEFAULT_REGISTRY_SIZE):
+        self.num_articles = num_articles
+        self.seed = seed
+        self.registry_size = registry_size
+        self.companies = [self._make_company(i) for i in range(num_companies)]
+        self._by_corp_code = {company['corp_code']: company for company in self.companies}
+        self._corp_code_zip: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def _make_company(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(_stable_int(self.seed, 'company', index))
+        category = CATEGORIES[index % len(CATEGORIES)]
+        return {
+            'name': f"Synthetic {category} {index:05d}",
+            'category': category,
+            'corp_code': f"9{index:07d}",
+            'stock_code': f"9{index:05d}",
+            'confidence': round(rng.uniform(0.4, 0.95), 2),
+            'revenue': rng.randint(50, 50_000) * 1_000_000_000
+        }
+
+    # ---------- 뉴스 ----------
+
+    def article(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(_stable_int(self.seed, 'article', index))
+        pool = KNOWN_COMPANIES + [c['name'] for c in self.companies[:50]]
+        company, other = rng.choice(pool), rng.choice(KNOWN_COMPANIES)
+        topic = rng.choice(TOPICS)
+
+        content = ' '.join(
+            rng.choice(SENTENCES).format(company=company, other=other, topic=topic, pct=rng.randint(2, 40))
+            for _ in range(rng.randint(4, 9))
+        )
+        published = (datetime.now() - timedelta(days=index % 28, hours=rng.randint(0, 23)))
+        published = published.isoformat(timespec='seconds')
+
+        return {
+            'title': rng.choice(TITLE_TEMPLATES).format(company=company, topic=topic),
+            'url': f"https://news.example.com/ev/{index}",
+            'content': content,
+            'date': published,
+            'published_date': published,
+            'score': round(rng.uniform(0.5, 0.99), 2),
+            'source': rng.choice(OUTLETS)
+        }
+
+    def search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        """쿼리 해시 위치부터 연속된 기사 (쿼리끼리 일부 겹침)"""
+        if self.num_articles <= 0:
+            return []
+        start = _stable_int(self.seed, 'query', query) % self.num_articles
+        count = min(num_results, self.num_articles)
+        return [self.article((start + i) % self.num_articles) for i in range(count)]
+
+    # ---------- 기업 ----------
+
+    def supplier_record(self, company: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """SupplierMatchingAgent 출력 형식의 공급업체 레코드"""
+        return {
+            'name': company['name'],
+            'category': company['category'],
+            'products': [f"{company['category']} Components"],
+            'oem_relationships': 0,
+            'confidence_score': company['confidence'],
+            'discovery_source': 'Benchmark (Synthetic)',
+            'supplier_id': f"SUP_{index:03d}",
+            'analysis_date': datetime.now().isoformat(),
+            'company_type': 'supplier',
+            'is_listed': True,
+            'ticker': company['stock_code'],
+            'investable': True,
+            'investable_tag': ''
+        }
+
+    def corp_code_zip(self) -> bytes:
+        """DART corpCode.xml (ZIP) - 합성 기업 + 국내 주요 기업 + 나머지 법인"""
+        with self._lock:
+            if self._corp_code_zip is None:
+                rows = []
+                for company in self.companies:
+                    rows.append((company['corp_code'], company['name'], company['stock_code']))
+                for i, name in enumerate(KOREAN_REGISTRY):
+                    rows.append((f"8{i:07d}", name, f"8{i:05d}"))
+                for i in range(max(0, self.registry_size - len(rows))):
+                    # 실제 목록처럼 대부분 비상장 법인
+                    rows.append((f"{i:08d}", f"법인{i:06d}", f"{i % 1_000_000:06d}" if i % 25 == 0 else ' '))
+
+                xml = ['<?xml version="1.0" encoding="UTF-8"?>\n<result>']
+                for corp_code, corp_name, stock_code in rows:
+                    xml.append(
+                        f"<list><corp_code>{corp_code}</corp_code><corp_name>{corp_name}</corp_name>"
+                        f"<stock_code>{stock_code}</stock_code><modify_date>20240101</modify_date></list>"
+                    )
+                xml.append('</result>')
+
+                buffer = io.BytesIO()
+                with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+                    zf.writestr('CORPCODE.xml', '\n'.join(xml))
+                self._corp_code_zip = buffer.getvalue()
+            return self._corp_code_zip
+
+    def revenue_for(self, key: str) -> int:
+        company = self._by_corp_code.get(key)
+        if company:
+            return company['revenue']
+        return random.Random(_stable_int(self.seed, 'revenue', key)).randint(100, 300_000) * 1_000_000_000
+
+
+class StandInAdapter(HTTPAdapter):
+    """
+    requests 세션용 대체 어댑터
+    호스트별로 DART/SEC/Yahoo/GNews 형식의 응답을 합성 코퍼스에서 생성
+    """
+
+    def __init__(self, corpus: SyntheticCorpus, latency: LatencyModel, **kwargs):
+        super().__init__(**kwargs)
+        self.corpus = corpus
+        self.latency = latency
+        self.routes = {
+            'opendart.fss.or.kr': ('dart', self._dart),
+            'data.sec.gov': ('sec', self._sec),
+            'query1.finance.yahoo.com': ('yahoo', self._yahoo),
+            'gnews.io': ('gnews', self._gnews)
+        }
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        params = dict(parse_qsl(parts.query))
+        provider, handler = self.routes.get(parts.hostname, ('other', None))
+
+        if handler is None:
+            status, content = 404, b''
+        else:
+            status, payload = handler(parts.path, params)
+            content = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+
+        self.latency.sleep(provider, extra=len(content) / BYTES_PER_SECOND)
+        return self._build_response(request, status, content)
+
+    def _build_response(self, request, status: int, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if status < 400 else 'Not Found'
+        response.encoding = 'utf-8'
+        return response
+
+    def _dart(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        corp_code = params.get('corp_code', '')
+
+        if path.endswith('/corpCode.xml'):
+            return 200, self.corpus.corp_code_zip()
+
+        if path.endswith('/list.json'):
+            rng = random.Random(_stable_int(self.corpus.seed, 'disclosures', corp_code))
+            today = datetime.now()
+            disclosures = [
+                {
+                    'corp_code': corp_code,
+                    'corp_name': corp_code,
+                    'corp_cls': 'Y',
+                    'report_nm': rng.choice(['주요사항보고서', '분기보고서', '단일판매ㆍ공급계약체결', '유상증자결정']),
+                    'rcept_no': f"{today:%Y%m%d}{i:06d}",
+                    'flr_nm': corp_code,
+                    'rcept_dt': (today - timedelta(days=rng.randint(0, 30))).strftime('%Y%m%d'),
+                    'rm': ''
+                }
+                for i in range(rng.randint(3, 12))
+            ]
+            return 200, {'status': '000', 'message': '정상', 'list': disclosures}
+
+        if path.endswith('/fnlttSinglAcntAll.json'):
+            revenue = self.corpus.revenue_for(corp_code)
+            accounts = [
+                ('매출액', 1.0), ('영업이익', 0.08), ('당기순이익', 0.05), ('자산총계', 1.6),
+                ('자본총계', 0.7), ('부채총계', 0.9), ('유동자산', 0.6), ('유동부채', 0.4),
+                ('영업활동현금흐름', 0.1), ('투자활동현금흐름', -0.07), ('재무활동현금흐름', 0.02)
+            ]
+            rows = [
+                {'account_nm': name, 'thstrm_amount': f"{int(revenue * ratio):,}", 'currency': 'KRW'}
+                for name, ratio in accounts
+            ]
+            return 200, {'status': '000', 'message': '정상', 'list': rows}
+
+        return 404, {'status': '013', 'message': '조회된 데이타가 없습니다.'}
+
+    def _sec(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        cik = path.rsplit('CIK', 1)[-1].replace('.json', '')
+        revenue = self.corpus.revenue_for(cik) // 1000
+        year = datetime.now().year - 1
+
+        if '/companyfacts/' in path:
+            def annual(ratio):
+                return {'units': {'USD': [
+                    {'form': '10-K', 'val': int(revenue * ratio * (1 - 0.1 * i)), 'end': f"{year - i}-12-31", 'fy': year - i}
+                    for i in range(3)
+                ]}}
+
+            us_gaap = {
+                'Revenues': annual(1.0), 'NetIncomeLoss': annual(0.06), 'OperatingIncomeLoss': annual(0.09),
+                'GrossProfit': annual(0.2), 'Assets': annual(1.5), 'StockholdersEquity': annual(0.6),
+                'AssetsCurrent': annual(0.5), 'LiabilitiesCurrent': annual(0.35), 'LongTermDebt': annual(0.3),
+                'NetCashProvidedByUsedInOperatingActivities': annual(0.12)
+            }
+            return 200, {'cik': int(cik or 0), 'entityName': f"CIK{cik}", 'facts': {'us-gaap': us_gaap}}
+
+        if '/submissions/' in path:
+            forms = ['10-K', '10-Q', '8-K', '8-K', '10-Q', '4', '8-K', '10-Q'] * 3
+            today = datetime.now()
+            return 200, {'filings': {'recent': {
+                'form': forms,
+                'filingDate': [(today - timedelta(days=7 * i)).strftime('%Y-%m-%d') for i in range(len(forms))],
+                'accessionNumber': [f"0000000000-{year % 100:02d}-{i:06d}" for i in range(len(forms))],
+                'primaryDocument': [f"doc{i}.htm" for i in range(len(forms))]
+            }}}
+
+        return 404, {}
+
+    def _yahoo(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        symbol = path.rsplit('/', 1)[-1]
+        rng = random.Random(_stable_int(self.corpus.seed, 'price', symbol))
+        price = round(rng.uniform(10, 500), 2)
+
+        if '/quoteSummary/' in path:
+            return 200, {'quoteSummary': {'result': [{'price': {'marketCap': int(price * rng.randint(10**7, 10**9))}}]}}
+
+        meta = {
+            'currency': 'USD', 'exchangeName': 'NMS', 'regularMarketPrice': price,
+            'fiftyTwoWeekHigh': round(price * 1.4, 2), 'fiftyTwoWeekLow': round(price * 0.7, 2),
+            'regularMarketDayHigh': round(price * 1.02, 2), 'regularMarketDayLow': round(price * 0.98, 2)
+        }
+        quote = {'close': [price], 'volume': [rng.randint(10**5, 10**8)]}
+        return 200, {'chart': {'result': [{'meta': meta, 'indicators': {'quote': [quote]}}], 'error': None}}
+
+    def _gnews(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        query = params.get('q') or params.get('category', 'business')
+        results = self.corpus.search(query, int(params.get('max', 10)))
+        articles = [
+            {
+                'title': item['title'], 'description': item['content'][:160], 'content': item['content'],
+                'url': item['url'], 'publishedAt': item['date'], 'source': {'name': item['source']}
+            }
+            for item in results
+        ]
+        return 200, {'totalArticles': len(articles), 'articles': articles}
+
+
+class StandInWebSearchTool:
+    """WebSearchTool 대체 (search/fetch), 요청한 결과 수를 제한 없이 반환"""
+
+    def __init__(self, corpus: SyntheticCorpus, latency: LatencyModel):
+        self.corpus = corpus
+        self.latency = latency
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+        record('web_search_calls')
+        if not spend(WEB_SEARCH):
+            return []
+        results = self.corpus.search(query, num_results)
+        size = sum(len(json.dumps(item)) for item in results)
+        self.latency.sleep('web_search', extra=size / BYTES_PER_SECOND)
+        record('http_requests')
+        record('bytes_downloaded', size)
+        return results
+
+    def fetch(self, url: str) -> str:
+        index = int(url.rsplit('/', 1)[-1]) if url.rsplit('/', 1)[-1].isdigit() else 0
+        article = self.corpus.article(index)
+        self.latency.sleep('web_search')
+        record('http_requests')
+        record('bytes_downloaded', len(article['content']))
+        return article['content']
+
+
+def _llm_completion(prompt: str, max_tokens: int) -> str:
+    """프롬프트 형식에 맞춘 결정적 응답 (JSON 요청이면 JSON)"""
+    rng = random.Random(_stable_int('llm', prompt))
+
+    if 'json' in prompt.lower():
+        return json.dumps({
+            'is_risk': rng.random() < 0.4,
+            'severity': rng.choice(['low', 'medium', 'high']),
+            'category': rng.choice(['supply_chain', 'regulatory', 'market', 'financial']),
+            'description': 'Synthetic assessment generated for benchmarking.',
+            'confidence': round(rng.uniform(0.3, 0.9), 2)
+        })
+
+    target_tokens = min(max_tokens, max(20, int(rng.lognormvariate(math.log(180), 0.5))))
+    words = []
+    while len(words) * 4 // 3 < target_tokens:
+        words.extend(rng.choice(SENTENCES).format(
+            company=rng.choice(KNOWN_COMPANIES), other=rng.choice(KNOWN_COMPANIES),
+            topic=rng.choice(TOPICS), pct=rng.randint(2, 40)
+        ).split())
+    return ' '.join(words)
+
+
+def create_stand_in_llm_client(latency: LatencyModel):
+    """OpenAI 클라이언트용 httpx.Client (chat.completions 응답 합성)"""
+    import httpx
+
+    class StandInLLMTransport(httpx.BaseTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.read() or b'{}')
+            prompt = '\n'.join(str(m.get('content', '')) for m in payload.get('messages', []))
+            text = _llm_completion(prompt, payload.get('max_tokens') or 1000)
+            tokens_in, tokens_out = max(1, len(prompt) // 4), max(1, len(text) // 4)
+
+            latency.sleep('llm', extra=tokens_out * LLM_SECONDS_PER_TOKEN)
+            body = {
+                'id': f"chatcmpl-{_stable_int(prompt):x}",
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': payload.get('model', 'stand-in'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': text},
+                    'finish_reason': 'stop'
+                }],
+                'usage': {'prompt_tokens': tokens_in, 'completion_tokens': tokens_out,
+                          'total_tokens': tokens_in + tokens_out}
+            }
+            return httpx.Response(200, json=body, request=request)
+
+    return httpx.Client(transport=StandInLLMTransport())
+
+
+def _mount(session: requests.Session, adapter: HTTPAdapter) -> None:
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+
+def create_stand_in_tools(corpus: SyntheticCorpus, latency: LatencyModel) -> Dict[str, Any]:
+    """main.create_tools()와 같은 키의 도구 dict"""
+    import openai
+    from tools.dart_tools import DARTTool
+    from tools.gnews_tool import GNewsTool
+    from tools.llm_tools import OpenAILLM
+    from tools.sec_edgar_tools import SECEdgarTool
+    from tools.yahoo_finance_tools import YahooFinanceTool
+
+    class StandInDARTTool(DARTTool):
+        """생성 직후 어댑터 장착 (기업 코드 백그라운드 로드 포함 모든 DART 호출이 대체 제공자로 감)"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            _mount(self.session, adapter)
+
+    adapter = StandInAdapter(corpus, latency)
+
+    llm = OpenAILLM('stand-in', model='gpt-4o-mini')
+    llm.client = openai.OpenAI(api_key='stand-in', max_retries=0,
+                               http_client=create_stand_in_llm_client(latency))
+
+    sec = SECEdgarTool()
+    gnews = GNewsTool(api_key='stand-in')
+    yahoo = YahooFinanceTool()
+    for tool in (sec, gnews, yahoo):
+        _mount(tool.session, adapter)
+
+    dart = StandInDARTTool('stand-in', sec_tool=sec, yahoo_tool=yahoo)
+    dart.prefetch_corp_codes()  # main.create_tools()와 같이 첫 노드와 겹쳐 로드
+
+    return {
+        'web_search': StandInWebSearchTool(corpus, latency),
+        'llm': llm,
+        'dart': dart,
+        'sec': sec,
+        'gnews': gnews,
+        'yahoo': yahoo
+    }
+
+
+__all__ = ['SyntheticCorpus', 'LatencyModel', 'StandInAdapter', 'StandInWebSearchTool',
+           'create_stand_in_tools', 'create_stand_in_llm_client', 'PROVIDER_LATENCY']
@@ -0,0 +1,164 @@
+"""
+시작 시간 벤치마크 (import 시간 회귀 확인용)
+
+사용법:
+    python -m benchmarks.startup                        # 단계별 시작 시간 + import 상위 모듈
+    python -m benchmarks.startup --repeat 10 --top 30
+    python -m benchmarks.startup --max-help-seconds 0.5 # 기준 초과 시 종료 코드 1 (CI용)
+
+측정 항목 (매번 새 프로세스, 중앙값):
+    - help: python main.py --help 전체 실행 시간
+    - import_main: import main
+    - create_tools: main.create_tools() (원격 초기화 없이 도구 생성)
+    - create_executor: 에이전트 모듈 import + DAG 실행기 생성
+외부 호출은 HTTP_TRANSPORT_MODE=replay + 빈 기록 폴더로 막아 네트워크 없이 측정
+결과: outputs/startup_<timestamp>.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = ('import_main', 'create_tools', 'create_executor')
+
+# 자식 프로세스에서 단계별 누적 시간 측정 (JSON 한 줄로 출력)
+PHASE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+timings = {}
+import main
+timings['import_main'] = time.perf_counter() - start
+tools = main.create_tools()
+timings['create_tools'] = time.perf_counter() - start
+from workflow.graph import create_executor
+create_executor(web_search_tool=tools['web_search'], llm_tool=tools['llm'], dart_tool=tools['dart'],
+                sec_tool=tools['sec'], gnews_tool=tools['gnews'], yahoo_tool=tools['yahoo'])
+timings['create_executor'] = time.perf_counter() - start
+sys.__stdout__.write('\\nSTARTUP_TIMINGS ' + json.dumps(timings) + '\\n')
+"""
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument('--repeat', type=int, default=5, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=20, help='출력할 import 누적 시간 상위 모듈 수')
+    parser.add_argument('--max-help-seconds', type=float, default=1.0,
+                        help='main.py --help 허용 시간 (초과 시 종료 코드 1)')
+    parser.add_argument('--max-startup-seconds', type=float, default=None,
+                        help='import main ~ DAG 실행기 생성까지 허용 시간 (초과 시 종료 코드 1)')
+    return parser.parse_args(argv)
+
+
+def child_env(workdir: str) -> Dict[str, str]:
+    """네트워크 없이 도구를 생성하도록 기록/재생 모드를 빈 기록 폴더의 replay로 설정"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+    env['PYTHONIOENCODING'] = 'utf-8'
+    env['HTTP_TRANSPORT_MODE'] = 'replay'
+    env['HTTP_CASSETTE_DIR'] = os.path.join(workdir, 'cassettes')
+    env['ALPHA_VANTAGE_ENABLED'] = '0'
+    return env
+
+
+def time_help(workdir: str, env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'main.py'), '--help'],
+                   cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def time_phases(workdir: str, env: Dict[str, str]) -> Dict[str, float]:
+    completed = subprocess.run([sys.executable, '-c', PHASE_SCRIPT], cwd=workdir, env=env,
+                               capture_output=True, text=True, encoding='utf-8', errors='replace')
+    for line in completed.stdout.splitlines():
+        if line.startswith('STARTUP_TIMINGS '):
+            return json.loads(line[len('STARTUP_TIMINGS '):])
+    raise RuntimeError(f"단계별 측정 실패 (종료 코드 {completed.returncode}):\n{completed.stderr[-2000:]}")
+
+
+def import_profile(workdir: str, env: Dict[str, str], top: int) -> List[Dict[str, Any]]:
+    """python -X importtime 결과에서 누적 시간 상위 모듈 (DAG 실행기 생성까지)"""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', PHASE_SCRIPT], cwd=workdir, env=env,
+                               capture_output=True, text=True, encoding='utf-8', errors='replace')
+    modules = []
+    for line in completed.stderr.splitlines():
+        # 형식: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        modules.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,  # 하위 import는 2칸씩 들여씀
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000
+        })
+    # 최상위(직접 import된) 모듈 기준으로 정렬해야 하위 모듈과 중복 집계되지 않음
+    top_level = [module for module in modules if module['depth'] == 0]
+    return sorted(top_level, key=lambda module: module['cumulative_ms'], reverse=True)[:top]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='evi_startup_')
+    env = child_env(workdir)
+
+    try:
+        print(f"[시작 시간] {args.repeat}회 측정 중...")
+        help_times = [time_help(workdir, env) for _ in range(args.repeat)]
+        phase_runs = [time_phases(workdir, env) for _ in range(args.repeat)]
+        imports = import_profile(workdir, env, args.top)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        'python': sys.version.split()[0],
+        'repeat': args.repeat,
+        'help': round(statistics.median(help_times), 3),
+        'phases': {phase: round(statistics.median(run[phase] for run in phase_runs), 3) for phase in PHASES},
+        'top_imports': imports
+    }
+
+    print("\n" + "=" * 70)
+    print(f"   main.py --help: {result['help']:.3f}s")
+    for phase in PHASES:
+        print(f"   {phase:<16} {result['phases'][phase]:.3f}s (누적)")
+    print(f"\n   [import 누적 시간 상위 {len(imports)}개]")
+    for module in imports:
+        print(f"   {module['cumulative_ms']:>9.1f}ms  {module['module']}")
+    print("=" * 70)
+
+    output_dir = os.path.join(REPO_ROOT, "outputs")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"startup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장] {output_path}")
+
+    failed = False
+    if result['help'] > args.max_help_seconds:
+        print(f"[FAIL] --help {result['help']:.3f}s > 기준 {args.max_help_seconds:.3f}s")
+        failed = True
+    startup = result['phases']['create_executor']
+    if args.max_startup_seconds is not None and startup > args.max_startup_seconds:
+        print(f"[FAIL] 시작 {startup:.3f}s > 기준 {args.max_startup_seconds:.3f}s")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("[OK] 시작 시간 기준 통과")
+
+
+if __name__ == "__main__":
+    main()
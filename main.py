@@ -4,17 +4,14 @@
 
 import os
 import sys
+import argparse
 from datetime import datetime
 from dotenv import load_dotenv
-from workflow.graph import create_workflow
-from workflow.state import create_initial_state
-from tools.web_tools import WebSearchTool
-from tools.llm_tools import OpenAILLM
-from tools.dart_tools import DARTTool
-from tools.sec_edgar_tools import SECEdgarTool  # 🆕 SEC EDGAR tool 추가
-from tools.report_converter import ReportConverter
 import json
 
+# 워크플로우/도구 모듈(langgraph, pydantic, openai, requests 등)은 사용하는 함수 안에서 import
+# → --help는 무거운 의존성을 로드하지 않고, --list-runs는 체크포인트 모듈만 로드 (python -m benchmarks.startup로 측정)
+
 # UTF-8   (Windows cp949  )
 if sys.platform == 'win32':
     import io
@@ -24,37 +21,115 @@ if sys.platform == 'win32':
 # .env
 load_dotenv()
 
+# 서비스 모드 stale-while-revalidate 기본값 (--stale-while-revalidate / CACHE_STALE_WHILE_REVALIDATE로 변경)
+SERVICE_STALE_WHILE_REVALIDATE = '6h'
+
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="EV 투자 분석 보고서 생성")
+    parser.add_argument(
+        '--resume', metavar='RUN_ID',
+        help='체크포인트(checkpoints/<RUN_ID>)에서 완료되지 않은 첫 노드부터 이어서 실행'
+    )
+    parser.add_argument(
+        '--list-runs', action='store_true',
+        help='재개 가능한 체크포인트 목록 출력'
+    )
+    parser.add_argument(
+        '--memo', action='store_true',
+        help='에이전트 결과 메모 사용: 입력/설정이 같은 노드는 저장된 결과로 복원 (보고서 문구 반복 수정용, 기본 꺼짐)'
+    )
+    parser.add_argument(
+        '--no-memo', action='store_true',
+        help='에이전트 결과 메모를 사용하지 않고 모든 노드를 새로 실행 (config의 memo_enabled보다 우선)'
+    )
+    parser.add_argument(
+        '--clear-memo', action='store_true',
+        help='저장된 에이전트 결과 메모 삭제 후 실행'
+    )
+    parser.add_argument(
+        '--batch', metavar='CONFIGS_JSON',
+        help='config dict 리스트(JSON 파일)를 한 프로세스에서 순서대로 실행 (도구/캐시 공유)'
+    )
+    parser.add_argument(
+        '--serve', action='store_true',
+        help='상주 서비스 모드: 도구/캐시를 유지한 채 HTTP로 보고서 작업을 받아 큐로 실행'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='서비스 모드 바인드 주소')
+    parser.add_argument('--port', type=int, default=8765, help='서비스 모드 포트')
+    parser.add_argument(
+        '--stale-while-revalidate', metavar='DURATION',
+        help=f'서비스 모드에서 만료된 캐시를 바로 반환하고 백그라운드 갱신할 최대 경과 시간 '
+             f'(예: 30m, 6h, 0이면 끔, 기본 CACHE_STALE_WHILE_REVALIDATE 또는 {SERVICE_STALE_WHILE_REVALIDATE})'
+    )
+    return parser.parse_args(argv)
+
+
+def build_config(overrides=None):
     """
-      
+    기본 설정 + overrides
+    배치 실행 시 각 항목은 기본 설정에서 바꿀 값만 지정하면 됨
     """
-    
-    print("="*70)
-    print("        ")
-    print("="*70)
-    print()
-    
-    # ==========================================
-    # 1. 
-    # ==========================================
-    
     config = {
         'report_month': datetime.now().strftime('%Y-%m'),
         'days_ago': 30,  # 최근 30일 이내 뉴스만 수집
         'max_news_articles': 100,  # 최대 100개 뉴스 기사로 증가 (신뢰도 향상)
+        'results_per_query': 5,  # 뉴스 시드 쿼리당 검색 결과 수
+        'max_target_companies': 30,  # 재무 분석 대상 기업 상한
         'max_disclosures_per_company': 10,  # 기업당 최대 공시 수
         'max_sec_filings_per_company': 8,  # SEC 기업당 최대 공시 수
+        'fetch_full_text': False,  # 검색 스니펫 대신 기사 본문 수집 (기사 수만큼 추가 요청)
+        'full_text_max_chars': 4000,  # 기사당 본문 최대 길이
+        'article_store_path': 'cache/articles.db',  # 기사 저장소 (SQLite, 빈 값이면 사용 안 함)
+        'article_store_refresh_hours': 24,  # 이 시간 안에 검색한 쿼리는 저장된 기사 사용 (실행 주기에 맞춤, 최대 days_ago의 1/4)
         'keywords': ['EV', 'electric vehicle', 'battery', 'charging'],  # 영어 키워드로 변경
         'target_audience': 'individual investors',  # 영어로 변경
         'language': 'en',  # 영어 보고서 생성
-        
+
         # 데이터 수집 전략 (웹 서치 실패 대비)
         'relaxed_mode': True,  # 에러 시에도 계속 진행 (기준 완화)
         'fallback_enabled': True,  # 웹 서치 실패 시 fallback 전략 사용
-        'default_companies_enabled': True  # 기본 기업 리스트 사용 여부
+        'default_companies_enabled': True,  # 기본 기업 리스트 사용 여부
+
+        # 동시 실행 설정
+        'max_workers': 4,  # 노드/기업 단위 최대 동시 실행 수
+
+        # 에이전트 결과 메모 (입력/설정이 같은 노드는 재실행하지 않음, 보고서 반복 수정용으로 --memo 시 사용)
+        # 켜면 memo_ttl 안의 이전 뉴스/시장 분석이 그대로 재사용되므로 기본은 꺼짐
+        'memo_enabled': False,
+        'memo_ttl': 86400,  # 24시간
+
+        # 실행 1건당 예산 (None이면 제한 없음, 노드 가중치는 tools/budget.py)
+        'web_search_budget': None,  # 유료 웹 검색(Tavily) 호출 수
+        'llm_token_budget': None  # LLM 입력+출력 토큰
     }
-    
+    config.update(overrides or {})
+    return config
+
+
+def apply_memo_args(config, args):
+    """--memo / --no-memo 인자를 config에 반영 (--no-memo 우선)"""
+    if args.memo:
+        config['memo_enabled'] = True
+    if args.no_memo:
+        config['memo_enabled'] = False
+    return config
+
+
+def load_batch_configs(path):
+    """배치 설정 파일 로드 (config override dict의 JSON 리스트)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        overrides_list = json.load(f)
+
+    if not isinstance(overrides_list, list) or not all(isinstance(item, dict) for item in overrides_list):
+        raise ValueError(f"배치 설정은 config dict의 JSON 리스트여야 합니다: {path}")
+
+    return [build_config(overrides) for overrides in overrides_list]
+
+
+def print_config(config):
+    """설정 정보 출력"""
     print("[설정 정보]")
     print(f"   - 보고서 월: {config['report_month']}")
     print(f"   - 뉴스 수집 기간: 최근 {config['days_ago']}일")
@@ -63,212 +138,439 @@ def main():
     print(f"   - 대상 독자: {config['target_audience']}")
     print(f"   - Relaxed Mode: {'활성화' if config.get('relaxed_mode') else '비활성화'}")
     print(f"   - Fallback 전략: {'활성화' if config.get('fallback_enabled') else '비활성화'}")
+    print(f"   - 최대 동시 실행 수: {config['max_workers']}")
+    print(f"   - 에이전트 결과 메모: {'활성화' if config['memo_enabled'] else '비활성화'}")
+    if config.get('web_search_budget') is not None or config.get('llm_token_budget') is not None:
+        print(f"   - 예산: 웹 검색 {config.get('web_search_budget') or '무제한'}회, "
+              f"LLM {config.get('llm_token_budget') or '무제한'} tokens")
     print()
-    
-    # ==========================================
-    # 2.  
-    # ==========================================
-    
+
+
+def create_tools():
+    """
+    외부 API 도구 생성
+    배치 실행 시 모든 보고서가 같은 인스턴스(HTTP 세션, 응답 캐시, DART 기업 코드)를 공유
+    원격 초기화(DART 기업 코드, OpenAI 클라이언트)는 생성자에서 하지 않고 첫 사용 시/백그라운드로 진행
+    """
+    from tools.web_tools import WebSearchTool
+    from tools.llm_tools import OpenAILLM
+    from tools.dart_tools import DARTTool
+    from tools.sec_edgar_tools import SECEdgarTool  # 🆕 SEC EDGAR tool 추가
+    from tools.gnews_tool import GNewsTool
+    from tools.yahoo_finance_tools import YahooFinanceTool
+
     print("[  ...]")
-    
+
     # Web Search ( web_search  )
     web_search = WebSearchTool()
-    
+
     # OpenAI API
     openai_api_key = os.getenv('OPENAI_API_KEY', 'sk-proj-your-key-here')
     llm = OpenAILLM(openai_api_key, model='gpt-4o-mini')  # 비용 절감: GPT-4o-mini 사용
-    
-    # DART API (한국 기업)
-    dart_api_key = os.getenv('DART_API_KEY', 'f9cc57c302b3717900443947647ca55800eb6e8a')
-    dart = DARTTool(dart_api_key)
-    
+
     # SEC EDGAR API (미국 기업) - 🆕 추가
     sec = SECEdgarTool()
-    
+
+    # 뉴스/주가 (MarketTrendAgent, DART Fallback 공용)
+    gnews = GNewsTool()
+    yahoo = YahooFinanceTool()
+
+    # DART API (한국 기업) - 해외 기업 Fallback도 같은 SEC/Yahoo 인스턴스 사용
+    dart_api_key = os.getenv('DART_API_KEY', 'f9cc57c302b3717900443947647ca55800eb6e8a')
+    dart = DARTTool(dart_api_key, sec_tool=sec, yahoo_tool=yahoo)
+    dart.prefetch_corp_codes()  # 기업 코드 다운로드/파싱은 백그라운드 (첫 노드와 겹쳐 진행)
+
     print("   [OK] Web Search 도구 초기화")
     print("   [OK] OpenAI API 초기화")
     if dart_api_key:
         print("   [OK] DART API 초기화 (한국 기업)")
     print("   [OK] SEC EDGAR 초기화 (미국 기업)")
     print()
-    
+
+    return {
+        'web_search': web_search,
+        'llm': llm,
+        'dart': dart,
+        'sec': sec,
+        'gnews': gnews,
+        'yahoo': yahoo
+    }
+
+
+def save_metrics(final_state, timestamp):
+    """노드별 실행 지표 저장 (outputs/metrics_<timestamp>.json)"""
+    metrics = final_state.get('metrics') or {}
+    if not metrics:
+        return
+
+    output_dir = "outputs"
+    os.makedirs(output_dir, exist_ok=True)
+
+    metrics_path = f"{output_dir}/metrics_{timestamp}.json"
+    with open(metrics_path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, ensure_ascii=False, indent=2)
+
+    print(f"\n[실행 지표] {metrics_path}")
+    for name, values in metrics.get('nodes', {}).items():
+        print(f"   - {name}: {values['wall_time']:.1f}s (CPU {values['cpu_time']:.1f}s), "
+              f"LLM {values['llm_calls']}회/{values['llm_tokens_in'] + values['llm_tokens_out']:,} tokens, "
+              f"HTTP {values['http_requests']}회/{values['bytes_downloaded']:,} bytes, "
+              f"캐시 {values['cache_hits']}/{values['cache_hits'] + values['cache_misses']} "
+              f"(메모리 {values.get('cache_memory_hits', 0)}, 디스크 {values.get('cache_disk_hits', 0)})")
+    for provider, breaker in metrics.get('circuit_breakers', {}).items():
+        if breaker['trips'] or breaker['state'] != 'closed':
+            print(f"   - [CIRCUIT] {provider}: {breaker['state']}, open {breaker['trips']}회, "
+                  f"차단 {breaker['rejected']}건")
+
+
+def save_report(final_state, timestamp):
+    """최종 보고서 저장 (JSON, Markdown, HTML/PDF)"""
+    print("\n[  ...]")
+
+    output_dir = "outputs"
+    os.makedirs(output_dir, exist_ok=True)
+
+    # JSON
+    json_path = f"{output_dir}/report_{timestamp}.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(final_state['final_report'], f,
+                 ensure_ascii=False, indent=2)
+    print(f"   [OK] JSON: {json_path}")
+
+    # Markdown
+    md_path = f"{output_dir}/report_{timestamp}.md"
+    with open(md_path, 'w', encoding='utf-8') as f:
+        for section_name, section_content in final_state['final_report'].items():
+            # section_content에 이미 제목이 있는지 확인
+            if not section_content.strip().startswith('#'):
+                f.write(f"# {section_name}\n\n")
+            f.write(section_content)
+            f.write("\n\n---\n\n")
+    print(f"   [OK] Markdown: {md_path}")
+
+    # HTML과 PDF 변환
+    try:
+        from tools.report_converter import ReportConverter
+        print("   HTML/PDF 변환 중...")
+        converter = ReportConverter()
+        converter.convert_markdown_file(md_path, generate_pdf=True)
+    except Exception as e:
+        print(f"   [WARNING] HTML/PDF 변환 실패: {e}")
+
+    print("\n[보고서 생성 완료!]")
+    print(f"    저장 위치: {output_dir}/")
+
+
+def run_report(config, tools, memo, checkpoint, initial_state=None, completed_nodes=None, label=None,
+               executor=None):
+    """
+    보고서 1건 실행 (단일/배치 공용)
+
+    Args:
+        config: 보고서 설정
+        tools: create_tools() 결과 (배치 실행 시 공유)
+        memo: AgentMemo (None이면 메모 미사용)
+        checkpoint: CheckpointStore
+        initial_state: 체크포인트에서 복원한 State (재개 시)
+        completed_nodes: 체크포인트의 정상 완료 노드 (재개 시)
+        label: 출력 파일명 접미사 (배치 실행 시)
+        executor: 미리 만든 DAG 실행기 (벤치마크에서 노드를 감쌀 때, 없으면 tools로 생성)
+
+    Returns:
+        최종 State (실패 시 None)
+    """
+    from workflow.graph import create_executor
+    from workflow.state import create_initial_state
+
     # ==========================================
-    # 3.  State 
+    # 3.  State
     # ==========================================
-    
-    initial_state = create_initial_state(config)
-    
+
+    initial_state = initial_state or create_initial_state(config)
+
     # ==========================================
-    # 4.  
+    # 4.
     # ==========================================
-    
+
     print("[워크플로우 생성 중...]")
-    
-    workflow = create_workflow(
-        web_search_tool=web_search,
-        llm_tool=llm,
-        dart_tool=dart,
-        sec_tool=sec  # 🆕 SEC tool 전달
+
+    executor = executor or create_executor(
+        web_search_tool=tools['web_search'],
+        llm_tool=tools['llm'],
+        dart_tool=tools['dart'],
+        sec_tool=tools['sec'],  # 🆕 SEC tool 전달
+        max_workers=config['max_workers'],
+        memo=memo,
+        gnews_tool=tools['gnews'],
+        yahoo_tool=tools['yahoo']
     )
-    
-    print("   [OK] LangGraph 워크플로우 생성 완료")
+
+    print("   [OK] DAG 실행기 생성 완료")
     print()
-    
+
     # ==========================================
-    # 5. 
+    # 5.
     # ==========================================
-    
+
     print("[  !]")
+    print(f"[실행 ID] {checkpoint.run_id} (실패 시: python main.py --resume {checkpoint.run_id})")
     print("="*70)
-    
+
     try:
-        # 워크플로우 실행 (LangGraph 버전 호환성 문제로 수동 실행)
-        # LangGraph의 checkpoint 버그를 회피하기 위해 각 에이전트를 직접 호출
-        from agents.market_trend_agent import MarketTrendAgent
-        from agents.supplier_matching_agent import SupplierMatchingAgent
-        from agents.financial_analyzer_agent import FinancialAnalyzerAgent
-        from agents.risk_assessment_agent_improved import RiskAssessmentAgent
-        from agents.investment_strategy_agent import InvestmentStrategyAgent
-        from agents.report_generator_agent import ReportGeneratorAgent
-        
-        # 에이전트 초기화
-        market_agent = MarketTrendAgent(web_search, llm, dart)
-        supplier_agent = SupplierMatchingAgent(web_search, llm)
-        financial_agent = FinancialAnalyzerAgent(web_search, llm, dart, sec_tool=sec)
-        risk_agent = RiskAssessmentAgent(web_search, llm)
-        strategy_agent = InvestmentStrategyAgent(web_search, llm)
-        report_agent = ReportGeneratorAgent(llm)
-        
-        final_state = initial_state
-        
-        # 1. MarketTrendAgent
-        print("[현재 노드: market_trend_node]")
-        print("="*60)
-        result = market_agent.analyze_market_trends(final_state)
-        final_state['news_articles'] = result.get('news_articles', [])
-        final_state['disclosure_data'] = result.get('disclosure_data', [])
-        final_state['keywords'] = result.get('keywords', [])
-        final_state['categorized_keywords'] = result.get('categorized_keywords', {})
-        final_state['market_trends'] = result.get('market_trends', [])
-        discovered = result.get('discovered_companies', [])
-        if discovered:
-            final_state['suppliers'].extend(discovered)
-        
-        # 2. SupplierMatchingAgent
-        print("\n[현재 노드: supplier_matching_node]")
-        print("="*60)
-        result = supplier_agent.match_suppliers(final_state)
-        final_state['suppliers'] = result.get('suppliers', [])
-        
-        # 3. FinancialAnalyzerAgent
-        print("\n[현재 노드: financial_analysis_node]")
-        print("="*60)
-        result = financial_agent.analyze_financials(final_state)
-        final_state['financial_analysis'] = result.get('financial_analysis', {})
-        
-        # 4. RiskAssessmentAgent
-        print("\n[현재 노드: risk_assessment_node]")
-        print("="*60)
-        result = risk_agent.analyze_risks(final_state)
-        final_state['risk_assessment'] = result.get('risk_assessment', {})
-        
-        # 5. InvestmentStrategyAgent
-        print("\n[현재 노드: investment_strategy_node]")
-        print("="*60)
-        result = strategy_agent.develop_investment_strategy(final_state)
-        final_state['investment_strategy'] = result.get('investment_strategy', {})
-        final_state['investment_opportunities'] = result.get('investment_opportunities', [])
-        final_state['portfolio_recommendation'] = result.get('portfolio_recommendation', {})
-        
-        # 6. ReportGeneratorAgent
-        print("\n[현재 노드: report_generation_node]")
-        print("="*60)
-        result = report_agent.generate_report(final_state)
-        final_state['final_report'] = result.get('final_report', {})
-        final_state['glossary'] = result.get('glossary', {})
-        final_state['investor_guide'] = result.get('investor_guide', {})
-        
+        # DAG 실행기로 워크플로우 실행
+        # 노드별 입력/출력 선언에 따라 독립 노드(재무 분석 ∥ 정성 리스크 수집)는 동시 실행
+        # 노드가 끝날 때마다 체크포인트 저장
+        final_state = executor.run(
+            initial_state,
+            completed_nodes=completed_nodes or set(),
+            on_stage_complete=checkpoint.save
+        )
+
         # ==========================================
-        # 6.  
+        # 6.
         # ==========================================
-        
+
         print("\n" + "="*70)
         print("[ ]")
         print("="*70)
-        
+
         print(f"\n[ ]")
         for msg in final_state['messages']:
             print(f"   {msg}")
-        
+
         if final_state['errors']:
             print(f"\n[ : {len(final_state['errors'])}]")
             for i, error in enumerate(final_state['errors'], 1):
                 print(f"   {i}. {error['agent']}: {error['error'][:100]}...")
-        
+
         print(f"\n[ ]")
         print(f"   -  : {len(final_state['news_articles'])}")
         print(f"   - : {len(final_state['keywords'])}")
         print(f"   - : {len(final_state['suppliers'])}")
         print(f"   -  : {len(final_state['source_manager'].citations)}")
-        
-        #   
+        if memo is not None:
+            print(f"   - 메모 복원/실행: {memo.hits}/{memo.misses}")
+
+        #
         if final_state['source_manager'].citations:
             confidence_summary = final_state['source_manager'].get_citations_summary()
             print(f"   -  : {confidence_summary['average_confidence']:.2f}")
             print(f"   -  : {confidence_summary['average_reliability']:.2f}")
-        
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if label:
+            timestamp = f"{timestamp}_{label}"
+
+        save_metrics(final_state, timestamp)
+
         # ==========================================
-        # 7.  
+        # 7.
         # ==========================================
-        
+
         if final_state['final_report']:
-            print("\n[  ...]")
-            
-            output_dir = "outputs"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            # JSON 
-            json_path = f"{output_dir}/report_{timestamp}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(final_state['final_report'], f, 
-                         ensure_ascii=False, indent=2)
-            print(f"   [OK] JSON: {json_path}")
-            
-            # Markdown
-            md_path = f"{output_dir}/report_{timestamp}.md"
-            with open(md_path, 'w', encoding='utf-8') as f:
-                for section_name, section_content in final_state['final_report'].items():
-                    # section_content에 이미 제목이 있는지 확인
-                    if not section_content.strip().startswith('#'):
-                        f.write(f"# {section_name}\n\n")
-                    f.write(section_content)
-                    f.write("\n\n---\n\n")
-            print(f"   [OK] Markdown: {md_path}")
-
-            # HTML과 PDF 변환
-            try:
-                print("   HTML/PDF 변환 중...")
-                converter = ReportConverter()
-                converter.convert_markdown_file(md_path, generate_pdf=True)
-            except Exception as e:
-                print(f"   [WARNING] HTML/PDF 변환 실패: {e}")
-
-            print("\n[보고서 생성 완료!]")
-            print(f"    저장 위치: {output_dir}/")
-        
+            save_report(final_state, timestamp)
+
         else:
             print("\n[  ]")
             print("     .")
-        
+
+        return final_state
+
     except Exception as e:
         print(f"\n[  : {e}]")
         import traceback
         traceback.print_exc()
-    
+        return None
+
+
+def run_batch(path, args):
+    """
+    배치 실행: config 리스트를 한 프로세스에서 순서대로 실행
+    도구 인스턴스(DART 기업 코드, HTTP 세션, 응답 캐시)와 에이전트 결과 메모를 공유하므로
+    키워드/대상 독자만 다른 보고서는 겹치는 뉴스/공시 수집을 다시 하지 않음
+    """
+    from workflow.checkpoint import CheckpointStore
+    from workflow.memo import AgentMemo
+
+    try:
+        configs = load_batch_configs(path)
+    except Exception as e:
+        print(f"[ERROR] 배치 설정 로드 실패: {e}")
+        return
+
+    print(f"[배치 실행] {len(configs)}개 보고서")
+    print()
+
+    tools = create_tools()
+
+    for config in configs:
+        apply_memo_args(config, args)
+
+    memo = None
+    if any(config['memo_enabled'] for config in configs):
+        memo = AgentMemo(ttl=max(config['memo_ttl'] for config in configs))
+        if args.clear_memo:
+            print(f"   [CACHE] 메모 {memo.clear()}개 삭제")
+
+    batch_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+    results = []
+
+    for index, config in enumerate(configs, 1):
+        label = config.get('name') or f"{index:02d}"
+
+        print("="*70)
+        print(f"[배치 {index}/{len(configs)}] {label}")
+        print("="*70)
+        print_config(config)
+
+        checkpoint = CheckpointStore(run_id=f"{batch_id}_{label}")
+        final_state = run_report(
+            config, tools,
+            memo if config['memo_enabled'] else None,
+            checkpoint, label=label
+        )
+        results.append((label, final_state))
+
+    print("\n" + "="*70)
+    print("[배치 실행 결과]")
+    for label, final_state in results:
+        if final_state is None:
+            print(f"   [FAIL] {label}")
+        else:
+            print(f"   [OK] {label} (에러 {len(final_state['errors'])}건)")
+
+    dart_cache, sec_cache = tools['dart'].response_cache, tools['sec'].response_cache
+    print(f"   [CACHE] DART 응답 재사용 {dart_cache.hits}회, SEC 응답 재사용 {sec_cache.hits}회")
+    print("="*70)
+
+
+def run_service(args):
+    """
+    상주 서비스 실행
+    도구는 한 번만 생성하고, 작업마다 config override만 바꿔 run_report 호출
+    """
+    from workflow.checkpoint import CheckpointStore
+    from workflow.memo import AgentMemo
+    from workflow.service import ReportService, serve
+    from tools.cache_manager import get_cache_manager, parse_duration
+
+    # 서비스 모드는 만료 직후 캐시를 바로 반환하고 백그라운드에서 갱신 (공유 CacheManager에 직접 설정)
+    stale_setting = (args.stale_while_revalidate or os.getenv('CACHE_STALE_WHILE_REVALIDATE')
+                     or SERVICE_STALE_WHILE_REVALIDATE)
+    try:
+        max_stale = parse_duration(stale_setting)
+    except ValueError:
+        print(f"[WARNING] stale-while-revalidate 값이 올바르지 않습니다: {stale_setting} "
+              f"- {SERVICE_STALE_WHILE_REVALIDATE} 사용")
+        max_stale = parse_duration(SERVICE_STALE_WHILE_REVALIDATE)
+    get_cache_manager(max_stale=max_stale)
+    print(f"[CACHE] stale-while-revalidate: {max_stale:.0f}초")
+    tools = create_tools()
+    memo = None if args.no_memo else AgentMemo()
+
+    def run_job(job_id, overrides):
+        config = apply_memo_args(build_config(overrides), args)
+        if memo is None:
+            config['memo_enabled'] = False
+        print_config(config)
+
+        final_state = run_report(
+            config, tools,
+            memo if config['memo_enabled'] else None,
+            CheckpointStore(run_id=job_id), label=job_id
+        )
+        if final_state is None:
+            return None
+
+        return {
+            'run_id': job_id,
+            'report_sections': list(final_state['final_report'].keys()),
+            'errors': [
+                {'agent': error['agent'], 'error': error['error']}
+                for error in final_state['errors']
+            ],
+            'citations': len(final_state['source_manager'].citations)
+        }
+
+    # 작업별 DAG 실행이 이미 max_workers로 병렬화되므로 작업은 하나씩 처리
+    serve(ReportService(run_job, num_workers=1), host=args.host, port=args.port)
+
+
+def main(argv=None):
+    """
+
+    """
+    args = parse_args(argv)
+
+    from workflow.checkpoint import CheckpointStore
+
+    if args.list_runs:
+        runs = CheckpointStore.list_runs()
+        print("[체크포인트 목록]")
+        for run_id in runs:
+            print(f"   - {run_id}")
+        if not runs:
+            print("   (없음)")
+        return
+
+    print("="*70)
+    print("        ")
+    print("="*70)
+    print()
+
+    if args.batch:
+        run_batch(args.batch, args)
+        return
+
+    if args.serve:
+        run_service(args)
+        return
+
+    # ==========================================
+    # 1.
+    # ==========================================
+
+    # 체크포인트: 노드 완료마다 State 저장 (--resume 시 기존 run 재사용)
+    checkpoint = CheckpointStore(run_id=args.resume)
+    completed_nodes = set()
+    resumed_state = None
+
+    if args.resume:
+        try:
+            resumed_state, completed_nodes = checkpoint.load()
+        except FileNotFoundError as e:
+            print(f"[ERROR] {e}")
+            return
+        print(f"[재개] {args.resume} - 완료 노드: {', '.join(sorted(completed_nodes)) or '없음'}")
+        print()
+
+    config = resumed_state['config'] if resumed_state else build_config()
+    config.setdefault('max_workers', 4)
+    config.setdefault('memo_enabled', False)
+    config.setdefault('memo_ttl', 86400)
+    apply_memo_args(config, args)
+
+    print_config(config)
+
+    # ==========================================
+    # 2.
+    # ==========================================
+
+    tools = create_tools()
+
+    from workflow.memo import AgentMemo
+    memo = AgentMemo(ttl=config['memo_ttl']) if config['memo_enabled'] else None
+    if memo is not None and args.clear_memo:
+        print(f"   [CACHE] 메모 {memo.clear()}개 삭제")
+
+    run_report(
+        config, tools, memo, checkpoint,
+        initial_state=resumed_state,
+        completed_nodes=completed_nodes
+    )
+
     print("\n" + "="*70)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -45,6 +45,15 @@ class Citation(BaseModel):
         use_enum_values = True
 
 
+def citation_to_dict(citation: Citation) -> Dict[str, Any]:
+    """Citation → JSON 호환 dict (datetime은 ISO 문자열)"""
+    data = citation.dict()
+    for key in ('publication_date', 'created_at'):
+        if isinstance(data.get(key), datetime):
+            data[key] = data[key].isoformat()
+    return data
+
+
 class SourceManager:
     """
        SourceManager 
@@ -211,6 +220,27 @@ class SourceManager:
         
         return "\n".join(references)
     
+    def add_existing_citation(self, citation: Citation) -> Citation:
+        """이미 생성된 Citation 등록 (id 유지, 중복 id는 무시)"""
+        if citation.id not in self._citation_index:
+            self.citations.append(citation)
+            self._citation_index[citation.id] = citation
+        return citation
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict 변환 (체크포인트 저장)"""
+        return {
+            'citations': [citation_to_dict(c) for c in list(self.citations)]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SourceManager':
+        """to_dict() 결과로부터 복원 (Citation id, 생성 시각 유지)"""
+        manager = cls()
+        for citation_data in data.get('citations', []):
+            manager.add_existing_citation(Citation(**citation_data))
+        return manager
+    
     def clear(self):
         """  """
         self.citations.clear()
@@ -220,4 +250,28 @@ class SourceManager:
         return len(self.citations)
     
     def __iter__(self):
-        return iter(self.citations)
\ No newline at end of file
+        return iter(self.citations)
+
+
+class NodeSourceManager(SourceManager):
+    """
+    노드 실행 중 State에 넣는 SourceManager (출처 목록은 parent와 공유)
+    출처 추가는 parent에 위임하고, 이 노드가 추가한 출처만 added에 따로 기록
+    → 동시에 실행되는 다른 노드의 출처와 구분 (메모/체크포인트용, 중첩 가능)
+    """
+    
+    def __init__(self, parent: SourceManager):
+        self.parent = parent
+        self.citations = parent.citations
+        self._citation_index = parent._citation_index
+        self.added: List[Citation] = []
+    
+    def add_citation(self, *args, **kwargs) -> Citation:
+        citation = self.parent.add_citation(*args, **kwargs)
+        self.added.append(citation)
+        return citation
+    
+    def add_existing_citation(self, citation: Citation) -> Citation:
+        if citation.id not in self._citation_index:
+            self.added.append(citation)
+        return self.parent.add_existing_citation(citation)
@@ -0,0 +1,6 @@
+"""
+단위 테스트 (외부 API/LLM 없이 표준 라이브러리 대체 객체로 실행)
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
@@ -0,0 +1,39 @@
+"""테스트 공용 대체 객체"""
+
+import time
+from typing import Any, Callable, Dict
+
+from models.citation import SourceManager, SourceType
+
+
+def make_state(**fields) -> Dict[str, Any]:
+    """노드 실행에 필요한 최소 ReportState"""
+    state = {
+        'config': {},
+        'source_manager': SourceManager(),
+        'citations': {},
+        'errors': [],
+        'messages': []
+    }
+    state.update(fields)
+    return state
+
+
+def add_citation(state: Dict[str, Any], title: str):
+    """노드가 출처를 추가하는 것과 같은 방식으로 웹 검색 출처 1건 추가"""
+    return state['source_manager'].add_citation(
+        source_type=SourceType.WEB_SEARCH,
+        data_source='test',
+        title=title,
+        url=f"https://example.com/{title}"
+    )
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5.0, interval: float = 0.01) -> bool:
+    """predicate가 참이 될 때까지 대기 (백그라운드 스레드 결과 확인용)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
@@ -0,0 +1,162 @@
+"""CacheManager: TTL 정책, 네임스페이스 한도 교체, stale-while-revalidate, 메모리 계층"""
+
+import copy
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from tests.helpers import wait_until
+from tools.cache_manager import (EVICTION_LOW_WATERMARK, IMMUTABLE, CacheManager, parse_duration, parse_quotas,
+                                 parse_ttls)
+
+
+class CacheManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _manager(self, **kwargs):
+        kwargs.setdefault('max_stale', 0)
+        return CacheManager(self.cache_dir, **kwargs)
+
+    def test_round_trip(self):
+        cache = self._manager()
+        cache.set_cached_result('tavily_ev news', 5, [{'title': 'EV'}])
+
+        self.assertEqual(cache.get_cached_result('tavily_ev news', 5), [{'title': 'EV'}])
+        self.assertIsNone(cache.get_cached_result('tavily_ev news', 10))
+
+    def test_ttl_policy_uses_longest_prefix(self):
+        cache = self._manager(ttl_policies={'dart': 100, 'dart_financial': 10})
+
+        self.assertEqual(cache.ttl_for('dart_disclosure_00126380'), 100)
+        self.assertEqual(cache.ttl_for('dart_financial_00126380_2026'), 10)
+        self.assertEqual(cache.ttl_for('dart_financial_closed_00126380_2024'), IMMUTABLE)
+        self.assertEqual(cache.ttl_for('dartboard'), cache.cache_duration)
+        self.assertEqual(cache.ttl_for('unknown_key'), cache.cache_duration)
+
+    def test_expired_entry_is_a_miss(self):
+        cache = self._manager(ttl_policies={'gnews': 0.05})
+        cache.set_cached_result('gnews_ev', 1, ['old'])
+
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get_cached_result('gnews_ev', 1))
+        self.assertEqual(cache.get_cache_stats()['total_entries'], 0)
+
+    def test_immutable_entry_never_expires(self):
+        cache = self._manager()
+        cache.set_cached_result('sec_submissions_1', 0, {'form': ['10-K']}, ttl=IMMUTABLE)
+
+        row = cache._connect().execute("SELECT expires_at FROM cache_entries").fetchone()
+
+        self.assertEqual(row[0], float('inf'))
+
+    def test_quota_evicts_least_recently_used(self):
+        value = 'x' * 300
+        cache = self._manager(quotas={'tavily': 1100})  # 값 하나가 약 300 bytes, 넘으면 990 bytes까지 비움
+        for name in ('a', 'b', 'c'):
+            cache.set_cached_result(f'tavily_{name}', 1, value)
+            time.sleep(0.01)
+        cache.get_cached_result('tavily_a', 1)  # a를 최근 사용으로
+
+        cache.set_cached_result('tavily_d', 1, value)
+
+        self.assertIsNotNone(cache.get_cached_result('tavily_a', 1))
+        self.assertIsNone(cache.get_cached_result('tavily_b', 1))
+        self.assertIsNotNone(cache.get_cached_result('tavily_d', 1))
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.get_cache_stats()['namespaces']['tavily']['size'], 1100 * EVICTION_LOW_WATERMARK)
+
+    def test_quota_is_per_namespace(self):
+        cache = self._manager(quotas={'tavily': 500, 'fetch': 0})
+        for i in range(5):
+            cache.set_cached_result(f'fetch_{i}', 1, 'y' * 300)
+
+        self.assertEqual(cache.evictions, 0)
+        self.assertEqual(cache.get_cache_stats()['namespaces']['fetch']['entries'], 5)
+
+    def test_stale_while_revalidate_serves_old_value_and_refreshes(self):
+        cache = self._manager(ttl_policies={'tavily': 0.05}, max_stale=60)
+        cache.set_cached_result('tavily_ev', 1, ['old'])
+        time.sleep(0.1)
+        refreshed = threading.Event()
+
+        def revalidate():
+            refreshed.set()
+            return ['new']
+
+        self.assertEqual(cache.get_cached_result('tavily_ev', 1, revalidate=revalidate), ['old'])
+        self.assertTrue(refreshed.wait(5))
+        self.assertTrue(wait_until(lambda: cache.get_cached_result('tavily_ev', 1) == ['new']))
+        self.assertEqual(cache.stale_hits, 1)
+
+    def test_stale_value_without_revalidate_is_a_miss(self):
+        cache = self._manager(ttl_policies={'tavily': 0.05}, max_stale=60)
+        cache.set_cached_result('tavily_ev', 1, ['old'])
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get_cached_result('tavily_ev', 1))
+
+    def test_failed_revalidation_keeps_old_value(self):
+        cache = self._manager(ttl_policies={'tavily': 0.05}, max_stale=60)
+        cache.set_cached_result('tavily_ev', 1, ['old'])
+        time.sleep(0.1)
+
+        def revalidate():
+            raise ConnectionError("provider down")
+
+        self.assertEqual(cache.get_cached_result('tavily_ev', 1, revalidate=revalidate), ['old'])
+        self.assertTrue(wait_until(lambda: not cache._refreshing))
+        self.assertEqual(cache.get_cached_result('tavily_ev', 1, revalidate=revalidate), ['old'])
+
+    def test_memory_tier_shares_read_only_values(self):
+        cache = self._manager(memory_entries=10)
+        cache.set_cached_result('dart_list_1', 0, [{'report_nm': 'report'}])
+
+        first = cache.get_cached_result('dart_list_1', 0)
+        second = cache.get_cached_result('dart_list_1', 0)
+
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first[0]['report_nm'] = 'changed'
+        editable = copy.deepcopy(first)
+        editable[0]['report_nm'] = 'changed'
+        self.assertEqual(cache.get_cached_result('dart_list_1', 0)[0]['report_nm'], 'report')
+        self.assertEqual(cache.tier_stats['memory']['hits'], 3)
+        self.assertEqual(cache.tier_stats['disk']['hits'], 0)
+
+    def test_memory_tier_is_bounded_by_bytes(self):
+        cache = self._manager(memory_entries=100, memory_bytes=1000)
+        for i in range(10):
+            cache.set_cached_result(f'fetch_{i}', 0, 'z' * 100)
+        cache.set_cached_result('fetch_big', 0, 'z' * 500)
+
+        self.assertLessEqual(cache.get_cache_stats()['memory_bytes'], 1000)
+        self.assertLess(cache.get_cache_stats()['memory_entries'], 10)
+        # 한도의 1/8보다 큰 값은 SQLite에서만 조회
+        self.assertEqual(cache.get_cached_result('fetch_big', 0), 'z' * 500)
+        self.assertEqual(cache.tier_stats['disk']['hits'], 1)
+
+
+class CacheSettingsTest(unittest.TestCase):
+
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration('90'), 90)
+        self.assertEqual(parse_duration('30m'), 1800)
+        self.assertEqual(parse_duration('7d'), 7 * 86400)
+
+    def test_parse_ttls_and_quotas(self):
+        self.assertEqual(parse_ttls('tavily=3h,dart_financial_closed=immutable'),
+                         {'tavily': 3 * 3600, 'dart_financial_closed': IMMUTABLE})
+        self.assertEqual(parse_quotas('fetch=256MB,tavily=512KB,default=0'),
+                         {'fetch': 256 * 1024 * 1024, 'tavily': 512 * 1024, 'default': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
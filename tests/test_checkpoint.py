@@ -0,0 +1,100 @@
+"""CheckpointStore / serialize_state: State 저장 후 복원"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from models.citation import Citation, SourceManager, SourceType
+from tests.helpers import add_citation, make_state
+from workflow.checkpoint import CheckpointStore, deserialize_state, serialize_state
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _state(self):
+        state = make_state(
+            config={'days_ago': 7, 'keywords': ['EV']},
+            news_articles=[{'title': 'a', 'publishedAt': '2026-10-01'}],
+            errors=[{'agent': 'risk_assessment_node', 'error': 'timeout'}],
+            messages=['[OK] market_trend_node'],
+            generated_at=datetime(2026, 10, 17, 9, 30)
+        )
+        first = add_citation(state, 'tesla-10k')
+        add_citation(state, 'lg-disclosure')
+        state['citations'] = {'market': first}
+        return state
+
+    def test_serialize_round_trip(self):
+        state = self._state()
+
+        restored = deserialize_state(serialize_state(state))
+
+        self.assertIsInstance(restored['source_manager'], SourceManager)
+        self.assertEqual([c.id for c in restored['source_manager'].citations],
+                         [c.id for c in state['source_manager'].citations])
+        self.assertEqual([c.title for c in restored['source_manager'].citations], ['tesla-10k', 'lg-disclosure'])
+        self.assertIsInstance(restored['citations']['market'], Citation)
+        self.assertEqual(restored['citations']['market'].id, state['citations']['market'].id)
+        self.assertEqual(restored['citations']['market'].source_type, SourceType.WEB_SEARCH)
+        self.assertEqual(restored['errors'], state['errors'])
+        self.assertEqual(restored['messages'], state['messages'])
+        self.assertEqual(restored['news_articles'], state['news_articles'])
+        self.assertEqual(restored['generated_at'], '2026-10-17T09:30:00')
+
+    def test_restored_source_manager_accepts_new_citations(self):
+        restored = deserialize_state(serialize_state(self._state()))
+
+        existing = restored['source_manager'].citations[0]
+        restored['source_manager'].add_existing_citation(existing)
+        add_citation(restored, 'new')
+
+        self.assertEqual(len(restored['source_manager']), 3)
+        self.assertIs(restored['source_manager'].get_citation(existing.id), existing)
+
+    def test_missing_accumulated_keys_default_to_empty(self):
+        state = self._state()
+        del state['errors']
+        del state['messages']
+
+        restored = deserialize_state(serialize_state(state))
+
+        self.assertEqual((restored['errors'], restored['messages']), ([], []))
+
+    def test_store_save_and_load(self):
+        store = CheckpointStore('run_1', base_dir=self.base_dir)
+        self.assertFalse(store.exists())
+
+        store.save(self._state(), ['market_trend_node', 'supplier_matching_node'])
+        state, completed = CheckpointStore('run_1', base_dir=self.base_dir).load()
+
+        self.assertEqual(completed, {'market_trend_node', 'supplier_matching_node'})
+        self.assertEqual(len(state['source_manager']), 2)
+        self.assertEqual(state['config']['days_ago'], 7)
+        self.assertEqual(CheckpointStore.list_runs(self.base_dir), ['run_1'])
+
+    def test_save_overwrites_previous_checkpoint(self):
+        store = CheckpointStore('run_1', base_dir=self.base_dir)
+        state = self._state()
+        store.save(state, ['market_trend_node'])
+
+        state['messages'].append('[OK] supplier_matching_node')
+        store.save(state, ['market_trend_node', 'supplier_matching_node'])
+        restored, completed = store.load()
+
+        self.assertEqual(len(completed), 2)
+        self.assertEqual(restored['messages'][-1], '[OK] supplier_matching_node')
+
+    def test_load_without_checkpoint_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            CheckpointStore('missing', base_dir=self.base_dir).load()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""CircuitBreaker: closed → open → half_open → closed/open 전이"""
+
+import time
+import unittest
+
+from tools.circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, get_url_breaker,
+                                   is_failure_status)
+
+COOLDOWN = 0.05
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def _open_breaker(self):
+        breaker = CircuitBreaker('tavily', failure_threshold=2, cooldown=COOLDOWN)
+        breaker.record_failure(503)
+        breaker.record_failure(503)
+        return breaker
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker('tavily', failure_threshold=3, cooldown=COOLDOWN)
+        breaker.record_failure(503)
+        breaker.record_failure(503)
+        self.assertEqual(breaker.state, CLOSED)
+
+        breaker.record_failure(503)
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertTrue(breaker.is_open())
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.snapshot()['rejected'], 1)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker('tavily', failure_threshold=2, cooldown=COOLDOWN)
+        breaker.record_failure(503)
+        breaker.record_success()
+        breaker.record_failure(503)
+
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_auth_error_trips_immediately(self):
+        breaker = CircuitBreaker('tavily', failure_threshold=5, cooldown=COOLDOWN)
+
+        breaker.observe(401)
+
+        self.assertEqual(breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.check()
+
+    def test_half_open_allows_one_trial_after_cooldown(self):
+        breaker = self._open_breaker()
+        time.sleep(COOLDOWN * 2)
+
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_successful_trial_closes(self):
+        breaker = self._open_breaker()
+        time.sleep(COOLDOWN * 2)
+        breaker.allow_request()
+
+        breaker.observe(200)
+
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_trial_reopens(self):
+        breaker = self._open_breaker()
+        time.sleep(COOLDOWN * 2)
+        breaker.allow_request()
+
+        breaker.observe(500)
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.trips, 2)
+
+    def test_retry_after_extends_open_period(self):
+        breaker = CircuitBreaker('tavily', failure_threshold=1, cooldown=COOLDOWN)
+
+        breaker.observe(429, retry_after='30')
+        time.sleep(COOLDOWN * 2)
+
+        self.assertFalse(breaker.allow_request())
+        self.assertGreater(breaker.snapshot()['cooldown_remaining'], 20)
+
+    def test_failure_statuses(self):
+        self.assertTrue(all(is_failure_status(code) for code in (401, 403, 408, 429, 500, 503)))
+        self.assertFalse(any(is_failure_status(code) for code in (200, 304, 400, 404)))
+
+    def test_unknown_hosts_have_no_breaker(self):
+        self.assertIsNone(get_url_breaker('https://news.example.com/article'))
+        self.assertIs(get_url_breaker('https://data.sec.gov/a'), get_url_breaker('https://www.sec.gov/b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
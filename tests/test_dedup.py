@@ -0,0 +1,90 @@
+"""URL 정규화 + SimHash 기사 중복 제거"""
+
+import unittest
+
+from tools.dedup import (ArticleDeduplicator, canonicalize_url, deduplicate_articles, hamming_distance,
+                         simhash)
+
+BODY = ("Tesla reported record electric vehicle deliveries in the third quarter as demand for the "
+        "Model Y rose across Europe and China while battery costs continued to fall")
+
+
+class CanonicalizeUrlTest(unittest.TestCase):
+
+    def test_variants_of_one_article_match(self):
+        variants = [
+            'https://www.reuters.com/business/autos/tesla-deliveries/',
+            'http://reuters.com/business/autos/tesla-deliveries',
+            'https://m.reuters.com/business/autos/tesla-deliveries?utm_source=x&utm_medium=y',
+            'https://reuters.com/business//autos/tesla-deliveries/amp#section',
+            'https://REUTERS.com/business/autos/tesla-deliveries?fbclid=abc',
+        ]
+
+        self.assertEqual(len({canonicalize_url(url) for url in variants}), 1)
+
+    def test_meaningful_query_is_kept_and_sorted(self):
+        self.assertEqual(canonicalize_url('https://example.com/news?page=2&id=7&utm_campaign=z'),
+                         'https://example.com/news?id=7&page=2')
+        self.assertNotEqual(canonicalize_url('https://example.com/news?id=7'),
+                            canonicalize_url('https://example.com/news?id=8'))
+
+    def test_empty_url(self):
+        self.assertEqual(canonicalize_url(''), '')
+
+
+class SimHashTest(unittest.TestCase):
+
+    def test_near_duplicate_text_is_close(self):
+        a = simhash(BODY + " - Reuters")
+        b = simhash(BODY + " (AP)")
+
+        self.assertLessEqual(hamming_distance(a, b), 6)
+
+    def test_different_text_is_far(self):
+        other = ("LG Energy Solution signed a long term supply contract for cathode materials with a mining "
+                 "company in Australia to secure lithium for new plants in North America")
+
+        self.assertGreater(hamming_distance(simhash(BODY), simhash(other)), 6)
+
+    def test_short_text_has_no_fingerprint(self):
+        self.assertIsNone(simhash("Tesla deliveries rise"))
+
+    def test_fingerprint_is_stable(self):
+        self.assertEqual(simhash(BODY), simhash(BODY))
+
+
+class ArticleDeduplicatorTest(unittest.TestCase):
+
+    def test_url_and_content_duplicates_are_dropped(self):
+        articles = [
+            {'url': 'https://www.reuters.com/a', 'title': 'Tesla deliveries', 'content': BODY},
+            {'url': 'https://reuters.com/a/?utm_source=rss', 'title': 'Tesla deliveries', 'content': 'snippet'},
+            {'url': 'https://syndicated.example.com/b', 'title': 'Tesla deliveries', 'content': BODY + ' (AP)'},
+            {'url': 'https://example.com/c', 'title': 'Battery plant', 'content': 'LG builds a plant in Ohio'},
+        ]
+        deduplicator = ArticleDeduplicator()
+
+        kept = [article for article in articles if deduplicator.add(article)]
+
+        self.assertEqual([a['url'] for a in kept], ['https://www.reuters.com/a', 'https://example.com/c'])
+        self.assertEqual((deduplicator.url_duplicates, deduplicator.content_duplicates), (1, 1))
+
+    def test_short_articles_with_same_title_are_kept(self):
+        articles = [
+            {'url': 'https://a.example.com/1', 'title': 'EV sales', 'content': ''},
+            {'url': 'https://b.example.com/2', 'title': 'EV sales', 'content': ''},
+        ]
+
+        self.assertEqual(len(deduplicate_articles(articles)), 2)
+
+    def test_first_article_wins(self):
+        articles = [
+            {'url': 'https://example.com/x', 'title': 'first'},
+            {'url': 'https://www.example.com/x/', 'title': 'second'},
+        ]
+
+        self.assertEqual([a['title'] for a in deduplicate_articles(articles)], ['first'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""DAGExecutor: 의존성 순서, 동시 실행, 실패 처리, 체크포인트 재개"""
+
+import threading
+import unittest
+
+from tests.helpers import add_citation, make_state
+from workflow.executor import DAGExecutor, Stage, StageExecutionError
+
+
+def recording_stage(name, log, writes=None, reads=None, func=None):
+    """실행 순서를 log에 남기고 outputs 키에 노드 이름을 쓰는 노드"""
+    writes = writes or []
+
+    def run(state):
+        for key in reads or []:
+            assert key in state, f"{name}: 선행 노드 출력 {key} 없음"
+        if func is not None:
+            func(state)
+        log.append(name)
+        for key in writes:
+            state[key] = name
+        return state
+
+    return Stage(name, run, inputs=list(reads or []), outputs=list(writes))
+
+
+class DAGExecutorTest(unittest.TestCase):
+
+    def test_dependent_stage_runs_after_its_writer(self):
+        log = []
+        stages = [
+            recording_stage('collect', log, writes=['news']),
+            recording_stage('analyze', log, reads=['news'], writes=['trends']),
+            recording_stage('report', log, reads=['trends'], writes=['report'])
+        ]
+        executor = DAGExecutor(stages, max_workers=4)
+
+        state = executor.run(make_state())
+
+        self.assertEqual(log, ['collect', 'analyze', 'report'])
+        self.assertEqual(state['report'], 'report')
+        self.assertEqual(executor.get_execution_levels(), [['collect'], ['analyze'], ['report']])
+
+    def test_independent_stages_run_concurrently(self):
+        # 두 노드가 동시에 실행 중이어야만 barrier를 통과 (순차 실행이면 BrokenBarrierError)
+        barrier = threading.Barrier(2, timeout=5)
+        log = []
+        stages = [
+            recording_stage('suppliers', log, writes=['suppliers'], func=lambda s: barrier.wait()),
+            recording_stage('risks', log, writes=['risks'], func=lambda s: barrier.wait()),
+            recording_stage('report', log, reads=['suppliers', 'risks'], writes=['report'])
+        ]
+
+        state = DAGExecutor(stages, max_workers=2).run(make_state())
+
+        self.assertEqual(sorted(log[:2]), ['risks', 'suppliers'])
+        self.assertEqual(log[2], 'report')
+        self.assertEqual((state['suppliers'], state['risks']), ('suppliers', 'risks'))
+
+    def test_only_declared_outputs_are_merged(self):
+        def run(state):
+            state['declared'] = 1
+            state['undeclared'] = 2
+            state['messages'].append('done')
+            return state
+
+        state = DAGExecutor([Stage('node', run, outputs=['declared'])]).run(make_state())
+
+        self.assertEqual(state['declared'], 1)
+        self.assertNotIn('undeclared', state)
+        self.assertEqual(state['messages'], ['done'])
+
+    def test_unhandled_exception_stops_dependents(self):
+        log = []
+
+        def fail(state):
+            raise RuntimeError("boom")
+
+        stages = [
+            recording_stage('collect', log, writes=['news'], func=fail),
+            recording_stage('analyze', log, reads=['news'], writes=['trends'])
+        ]
+        state = make_state()
+
+        with self.assertRaises(StageExecutionError):
+            DAGExecutor(stages).run(state)
+
+        self.assertEqual(log, [])
+        self.assertEqual(state['errors'][0]['agent'], 'collect')
+        self.assertIn('boom', state['errors'][0]['error'])
+
+    def test_checkpoint_records_only_nodes_without_errors(self):
+        def handled_error(state):
+            state['errors'].append({'agent': 'risks', 'error': 'fallback'})
+
+        log = []
+        stages = [
+            recording_stage('suppliers', log, writes=['suppliers']),
+            recording_stage('risks', log, writes=['risks'], func=handled_error)
+        ]
+        saved = []
+
+        DAGExecutor(stages, max_workers=1).run(
+            make_state(), on_stage_complete=lambda snapshot, done: saved.append(done)
+        )
+
+        self.assertEqual(saved[-1], {'suppliers'})
+
+    def test_resume_skips_completed_nodes(self):
+        log = []
+        stages = [
+            recording_stage('collect', log, writes=['news']),
+            recording_stage('analyze', log, reads=['news'], writes=['trends'])
+        ]
+        # 체크포인트에서 복원한 State (collect 출력 포함)
+        state = make_state(news='restored')
+
+        result = DAGExecutor(stages).run(state, completed_nodes={'collect'})
+
+        self.assertEqual(log, ['analyze'])
+        self.assertEqual(result['news'], 'restored')
+
+    def test_resume_reruns_node_whose_dependency_is_incomplete(self):
+        stages = [
+            Stage('collect', lambda s: s, outputs=['news']),
+            Stage('analyze', lambda s: s, inputs=['news'], outputs=['trends'])
+        ]
+
+        resumable = DAGExecutor(stages).get_resumable_nodes({'analyze'})
+
+        self.assertEqual(resumable, set())
+
+    def test_snapshot_keeps_citations_of_succeeded_nodes_only(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(state):
+            add_citation(state, 'slow')
+            started.set()
+            release.wait(5)
+
+        def failing(state):
+            add_citation(state, 'failed')
+            state['errors'].append({'agent': 'failing', 'error': 'fallback'})
+
+        def fast(state):
+            started.wait(5)
+            add_citation(state, 'fast')
+
+        log = []
+        stages = [
+            recording_stage('slow', log, writes=['a'], func=slow),
+            recording_stage('failing', log, writes=['b'], func=failing),
+            recording_stage('fast', log, writes=['c'], func=fast)
+        ]
+        state = make_state()
+        shared = state['source_manager']
+        add_citation(state, 'initial')
+        snapshots = []
+
+        def on_complete(snapshot, done):
+            snapshots.append(({c.title for c in snapshot['source_manager'].citations}, set(done)))
+            if done == {'fast'}:
+                release.set()
+
+        result = DAGExecutor(stages, max_workers=3).run(state, on_stage_complete=on_complete)
+
+        # slow가 실행 중일 때의 스냅샷에는 실행 중/실패한 노드의 출처가 없음
+        for titles, done in snapshots:
+            expected = {'initial'} | done
+            self.assertEqual(titles, expected)
+        self.assertIs(result['source_manager'], shared)
+        self.assertEqual({c.title for c in shared.citations}, {'initial', 'slow', 'failed', 'fast'})
+
+
+if __name__ == '__main__':
+    unittest.main()
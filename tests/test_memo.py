@@ -0,0 +1,114 @@
+"""AgentMemo: 적중/실패, 입력/config/에이전트 변경 시 키 무효화"""
+
+import shutil
+import tempfile
+import unittest
+
+from tests.helpers import add_citation, make_state
+from workflow.memo import AgentMemo
+
+
+class FakeAgent:
+    """지문 계산용 에이전트 (JSON 속성이 설정으로 들어감)"""
+
+    def __init__(self, weight=1.0):
+        self.weight = weight
+
+
+class AgentMemoTest(unittest.TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.memo = AgentMemo(base_dir=self.base_dir, ttl=0)
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _node(self, state):
+        self.calls += 1
+        add_citation(state, f"source-{self.calls}")
+        state['trends'] = [article.upper() for article in state['news']]
+        return state
+
+    def _wrap(self, func=None, agent=None):
+        return self.memo.wrap('trend_node', func or self._node, inputs=['news', 'config'], outputs=['trends'],
+                              agent=agent or FakeAgent(), config_keys=['days_ago'])
+
+    def _state(self, **config):
+        return make_state(news=['ev', 'battery'], config={'days_ago': 7, 'language': 'en', **config})
+
+    def test_second_call_restores_outputs_and_citations(self):
+        node = self._wrap()
+        first = node(self._state())
+
+        second = node(self._state())
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second['trends'], ['EV', 'BATTERY'])
+        self.assertEqual([c.id for c in second['source_manager'].citations],
+                         [c.id for c in first['source_manager'].citations])
+        self.assertEqual((self.memo.hits, self.memo.misses), (1, 1))
+
+    def test_changed_input_is_a_miss(self):
+        node = self._wrap()
+        node(self._state())
+
+        state = self._state()
+        state['news'] = ['charging']
+        result = node(state)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(result['trends'], ['CHARGING'])
+
+    def test_only_declared_config_keys_invalidate(self):
+        node = self._wrap()
+        node(self._state())
+
+        node(self._state(language='ko'))
+        self.assertEqual(self.calls, 1)
+
+        node(self._state(days_ago=30))
+        self.assertEqual(self.calls, 2)
+
+    def test_agent_settings_are_part_of_key(self):
+        self._wrap(agent=FakeAgent(weight=1.0))(self._state())
+
+        self._wrap(agent=FakeAgent(weight=2.0))(self._state())
+
+        self.assertEqual(self.calls, 2)
+
+    def test_result_with_handled_error_is_not_memoized(self):
+        def failing_node(state):
+            self.calls += 1
+            state['errors'].append({'agent': 'trend_node', 'error': 'fallback'})
+            state['trends'] = []
+            return state
+
+        node = self._wrap(func=failing_node)
+        node(self._state())
+        node(self._state())
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.memo.hits, 0)
+
+    def test_node_keeps_shared_source_manager(self):
+        state = self._state()
+        shared = state['source_manager']
+
+        result = self._wrap()(state)
+
+        self.assertIs(result['source_manager'], shared)
+        self.assertEqual(len(shared), 1)
+
+    def test_clear_removes_entries(self):
+        node = self._wrap()
+        node(self._state())
+
+        self.assertEqual(self.memo.clear(), 1)
+        node(self._state())
+        self.assertEqual(self.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""RateLimiter: 토큰 버킷, 429 감속(AIMD), 회복, 호스트별 공유"""
+
+import asyncio
+import time
+import unittest
+
+import tools.rate_limiter as rate_limiter
+from tools.rate_limiter import (ADAPTIVE_START_RATE, RECOVERY_FACTOR, RateLimiter, get_host_limiter,
+                                parse_retry_after)
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        limiter = RateLimiter(rate=1.0, burst=2)
+
+        self.assertTrue(limiter.acquire(timeout=0))
+        self.assertTrue(limiter.acquire(timeout=0))
+        self.assertFalse(limiter.acquire(timeout=0.1))
+
+    def test_tokens_refill_at_rate(self):
+        limiter = RateLimiter(rate=50.0, burst=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.015)
+
+    def test_unlimited_limiter_never_waits(self):
+        limiter = RateLimiter(rate=0)
+
+        self.assertTrue(all(limiter.acquire(timeout=0) for _ in range(100)))
+
+    def test_throttle_halves_rate_and_blocks(self):
+        limiter = RateLimiter(rate=10.0, burst=5)
+
+        limiter.observe(429, retry_after='0.2')
+
+        self.assertEqual(limiter.rate, 5.0)
+        self.assertFalse(limiter.acquire(timeout=0.05))
+        self.assertEqual(limiter.throttled_count, 1)
+
+    def test_success_recovers_additively_up_to_limit(self):
+        limiter = RateLimiter(rate=10.0, burst=1)
+        limiter.throttled(retry_after=0.01)
+        limiter.throttled(retry_after=0.01)
+        self.assertEqual(limiter.rate, 2.5)
+
+        limiter.observe(200)
+        self.assertAlmostEqual(limiter.rate, 2.5 + 10.0 * RECOVERY_FACTOR)
+
+        for _ in range(100):
+            limiter.succeeded()
+        self.assertEqual(limiter.rate, 10.0)
+
+    def test_unlimited_host_is_limited_after_429_and_released_on_recovery(self):
+        limiter = RateLimiter(rate=0)
+
+        limiter.throttled(retry_after=0.01)
+        self.assertEqual(limiter.rate, ADAPTIVE_START_RATE / 2)
+
+        for _ in range(100):
+            limiter.succeeded()
+        self.assertEqual(limiter.rate, 0.0)
+
+    def test_async_acquire_waits_without_blocking_loop(self):
+        limiter = RateLimiter(rate=20.0, burst=1)
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.ensure_future(ticker())
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+            task.cancel()
+            return ticks
+
+        self.assertGreater(asyncio.run(main()), 2)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('3'), 3.0)
+        self.assertIsNone(parse_retry_after('Wed, 21 Oct 2026 07:28:00 GMT'))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class HostLimiterRegistryTest(unittest.TestCase):
+
+    def test_hosts_of_one_provider_share_a_limiter(self):
+        self.assertIs(get_host_limiter('data.sec.gov'), get_host_limiter('WWW.SEC.GOV'))
+        self.assertEqual(get_host_limiter('api.tavily.com').max_rate, 2.0)
+
+    def test_unknown_hosts_are_lru_bounded(self):
+        original = rate_limiter.MAX_UNKNOWN_HOSTS
+        rate_limiter.MAX_UNKNOWN_HOSTS = 2
+        try:
+            first = get_host_limiter('a.test-lru.example')
+            get_host_limiter('b.test-lru.example')
+            self.assertIs(get_host_limiter('a.test-lru.example'), first)
+            get_host_limiter('c.test-lru.example')
+
+            self.assertLessEqual(len(rate_limiter._unknown_limiters), 2)
+            self.assertIs(get_host_limiter('a.test-lru.example'), first)
+            self.assertNotIn('b.test-lru.example', rate_limiter._unknown_limiters)
+        finally:
+            rate_limiter.MAX_UNKNOWN_HOSTS = original
+
+
+if __name__ == '__main__':
+    unittest.main()
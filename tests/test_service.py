@@ -0,0 +1,126 @@
+"""ReportService: 작업 큐 순서, 실패 기록, 끝난 작업 정리, HTTP API"""
+
+import json
+import threading
+import unittest
+import urllib.request
+
+from tests.helpers import wait_until
+from workflow.service import JOB_DONE, JOB_FAILED, ReportService, create_server
+
+
+class ReportServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.services = []
+
+    def tearDown(self):
+        for service in self.services:
+            service.stop(timeout=5)
+
+    def _service(self, runner, **kwargs):
+        service = ReportService(runner, **kwargs)
+        service.start()
+        self.services.append(service)
+        return service
+
+    def _finished(self, service, job_ids):
+        return wait_until(lambda: all(
+            (service.get_job(job_id) or {}).get('status') in (JOB_DONE, JOB_FAILED) for job_id in job_ids
+        ))
+
+    def test_jobs_run_in_submission_order(self):
+        order = []
+
+        def runner(job_id, overrides):
+            order.append(overrides['report_month'])
+            return {'report': overrides['report_month']}
+
+        service = self._service(runner)
+        job_ids = [service.submit({'report_month': month}) for month in ('2026-08', '2026-09', '2026-10')]
+
+        self.assertTrue(self._finished(service, job_ids))
+        self.assertEqual(order, ['2026-08', '2026-09', '2026-10'])
+        job = service.get_job(job_ids[0])
+        self.assertEqual(job['status'], JOB_DONE)
+        self.assertEqual(job['result'], {'report': '2026-08'})
+        self.assertIsNotNone(job['started_at'])
+
+    def test_failed_job_does_not_stop_worker(self):
+        def runner(job_id, overrides):
+            if overrides.get('fail'):
+                raise RuntimeError("DART timeout")
+            return {'ok': True}
+
+        service = self._service(runner)
+        failed = service.submit({'fail': True})
+        succeeded = service.submit({})
+
+        self.assertTrue(self._finished(service, [failed, succeeded]))
+        self.assertEqual(service.get_job(failed)['status'], JOB_FAILED)
+        self.assertIn('DART timeout', service.get_job(failed)['error'])
+        self.assertIn('traceback', service.get_job(failed)['result'])
+        self.assertEqual(service.get_job(succeeded)['status'], JOB_DONE)
+
+    def test_runner_returning_none_marks_job_failed(self):
+        service = self._service(lambda job_id, overrides: None)
+        job_id = service.submit({})
+
+        self.assertTrue(self._finished(service, [job_id]))
+        self.assertEqual(service.get_job(job_id)['status'], JOB_FAILED)
+
+    def test_only_recent_finished_jobs_are_kept(self):
+        service = self._service(lambda job_id, overrides: {'n': overrides['n']}, max_finished_jobs=2)
+        job_ids = []
+        for n in range(4):
+            job_ids.append(service.submit({'n': n}))
+            self.assertTrue(self._finished(service, job_ids[-1:]))
+
+        self.assertEqual([job['job_id'] for job in service.list_jobs()], job_ids[2:])
+        self.assertIsNone(service.get_job(job_ids[0]))
+        self.assertEqual(service.health()['jobs'], {JOB_DONE: 2})
+
+    def test_queued_jobs_are_not_pruned(self):
+        release = threading.Event()
+
+        def runner(job_id, overrides):
+            release.wait(5)
+            return {}
+
+        service = self._service(runner, max_finished_jobs=0)
+        job_ids = [service.submit({}) for _ in range(3)]
+
+        self.assertEqual(len(service.list_jobs()), 3)
+        release.set()
+        self.assertTrue(wait_until(lambda: not service.list_jobs()))
+        self.assertEqual(service.health()['queue_size'], 0)
+        self.assertTrue(all(service.get_job(job_id) is None for job_id in job_ids))
+
+    def test_http_api(self):
+        service = self._service(lambda job_id, overrides: {'month': overrides.get('report_month')})
+        server = create_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            request = urllib.request.Request(
+                f"{base_url}/jobs", data=json.dumps({'report_month': '2026-10'}).encode('utf-8'),
+                headers={'Content-Type': 'application/json'}, method='POST'
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                job_id = json.loads(response.read())['job_id']
+
+            self.assertTrue(self._finished(service, [job_id]))
+            with urllib.request.urlopen(f"{base_url}/jobs/{job_id}", timeout=5) as response:
+                job = json.loads(response.read())
+            with urllib.request.urlopen(f"{base_url}/health", timeout=5) as response:
+                health = json.loads(response.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(job['result'], {'month': '2026-10'})
+        self.assertEqual(health['status'], 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""SingleFlight / coalesce: 동시 호출 합치기, 결과 사본, 예외 전달"""
+
+import asyncio
+import threading
+import unittest
+
+from tests.helpers import wait_until
+from tools.singleflight import SingleFlight, coalesce
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def _run_concurrently(self, group, key, func, count=3):
+        """leader가 func 안에서 막혀 있는 동안 나머지 호출이 합류하도록 실행"""
+        results, errors = [None] * count, [None] * count
+
+        def call(i):
+            try:
+                results[i] = group.do(key, func)
+            except Exception as e:
+                errors[i] = e
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+        threads[0].start()
+        self.assertTrue(self.entered.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        self.assertTrue(wait_until(lambda: group.coalesced == count - 1))
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results, errors
+
+    def setUp(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _blocking(self, value=None, error=None):
+        def func():
+            self.calls += 1
+            self.entered.set()
+            self.release.wait(5)
+            if error is not None:
+                raise error
+            return value
+        return func
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+
+        results, errors = self._run_concurrently(group, 'key', self._blocking({'items': [1, 2]}))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(errors, [None, None, None])
+        self.assertEqual(results, [{'items': [1, 2]}] * 3)
+        # 기다린 호출은 사본을 받으므로 한 호출 측의 수정이 다른 쪽에 보이지 않음
+        self.assertIsNot(results[1], results[2])
+        self.assertIsNot(results[1]['items'], results[0]['items'])
+
+    def test_exception_is_raised_in_every_caller(self):
+        group = SingleFlight()
+
+        _, errors = self._run_concurrently(group, 'key', self._blocking(error=ValueError("quota")))
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+    def test_sequential_calls_are_not_coalesced(self):
+        group = SingleFlight()
+        calls = []
+
+        group.do('key', lambda: calls.append(1))
+        group.do('key', lambda: calls.append(2))
+
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(group.coalesced, 0)
+
+    def test_different_keys_run_separately(self):
+        group = SingleFlight()
+
+        self.assertEqual((group.do('a', lambda: 'A'), group.do('b', lambda: 'B')), ('A', 'B'))
+
+    def test_async_calls_share_one_execution(self):
+        group = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return ['result']
+
+        async def main():
+            return await asyncio.gather(*(group.ado('key', fetch) for _ in range(3)))
+
+        results = asyncio.run(main())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [['result']] * 3)
+        self.assertEqual(group.coalesced, 2)
+
+    def test_async_exception_is_raised_in_every_caller(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            raise ConnectionError("down")
+
+        async def main():
+            return await asyncio.gather(*(group.ado('key', fetch) for _ in range(2)), return_exceptions=True)
+
+        results = asyncio.run(main())
+
+        self.assertTrue(all(isinstance(result, ConnectionError) for result in results))
+
+
+class CoalesceDecoratorTest(unittest.TestCase):
+
+    def test_method_calls_are_grouped_per_instance_and_key(self):
+        release = threading.Event()
+        entered = threading.Event()
+
+        class Tool:
+            def __init__(self):
+                self.calls = []
+
+            @coalesce(lambda self, query, num_results=10: (query, num_results))
+            def search(self, query, num_results=10):
+                self.calls.append((query, num_results))
+                entered.set()
+                release.wait(5)
+                return [query]
+
+        tool = Tool()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(tool.search('ev'))) for _ in range(2)]
+        threads[0].start()
+        self.assertTrue(entered.wait(5))
+        threads[1].start()
+        self.assertTrue(wait_until(lambda: tool._singleflight.coalesced == 1))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(tool.calls, [('ev', 10)])
+        self.assertEqual(results, [['ev'], ['ev']])
+        self.assertEqual(Tool().search('ev'), ['ev'])
+
+
+if __name__ == '__main__':
+    unittest.main()
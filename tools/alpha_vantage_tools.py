@@ -4,9 +4,12 @@ Alpha Vantage API를 사용한 해외 기업 재무 데이터 수집
 
 import os
 import requests
-import time
 from typing import Dict, Any, Optional
 from datetime import datetime
+from tools.cache_manager import MemoryCache
+from tools.metrics import instrument_session
+from tools.http_transport import configure_session
+from tools.rate_limiter import get_url_limiter
 
 
 class AlphaVantageTool:
@@ -18,6 +21,9 @@ class AlphaVantageTool:
         self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
         self.base_url = "https://www.alphavantage.co/query"
         self.session = requests.Session()
+        instrument_session(self.session, 'alpha_vantage')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'alpha_vantage')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
+        self.response_cache = MemoryCache('alphavantage')  # 개요/연간 재무제표 응답 캐시 (TTL 정책 alphavantage)
         
         if not self.api_key:
             print("[WARNING] Alpha Vantage API 키가 설정되지 않았습니다.")
@@ -150,32 +156,44 @@ class AlphaVantageTool:
         
         return symbol_mapping.get(company_name, None)
     
+    def _query(self, function: str, symbol: str) -> Dict[str, Any]:
+        """API 호출 (성공 응답은 캐시, 호출 한도 안내/오류 응답은 캐시하지 않음)"""
+        cache_key = (function.lower(), symbol)
+        data = self.response_cache.get(cache_key)
+        if data is not None:
+            return data
+        
+        params = {
+            'function': function,
+            'symbol': symbol,
+            'apikey': self.api_key
+        }
+        
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        data = response.json()
+        if data and not any(key in data for key in ('Note', 'Information', 'Error Message')):
+            self.response_cache.set(cache_key, data)
+        return data
+    
     def _get_company_overview(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         회사 개요 정보 조회
         """
         try:
-            params = {
-                'function': 'OVERVIEW',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._query('OVERVIEW', symbol)
             
             # API 제한 확인
             if 'Note' in data:
                 print(f"   [WARNING] Alpha Vantage API 제한: {data['Note']}")
+                get_url_limiter(self.base_url).throttled(60)  # 429 대신 본문으로 알려주므로 직접 감속
                 return None
             
             if 'Symbol' not in data:
                 print(f"   [WARNING] 회사 개요 정보 없음")
                 return None
             
-            time.sleep(12)  # API 제한: 5 calls/min
             return data
             
         except Exception as e:
@@ -187,20 +205,10 @@ class AlphaVantageTool:
         손익계산서 조회
         """
         try:
-            params = {
-                'function': 'INCOME_STATEMENT',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._query('INCOME_STATEMENT', symbol)
             
             if 'annualReports' in data and len(data['annualReports']) > 0:
                 latest = data['annualReports'][0]
-                time.sleep(12)  # API 제한
                 return {
                     'revenue': float(latest.get('totalRevenue', 0)),
                     'operating_profit': float(latest.get('operatingIncome', 0)),
@@ -219,20 +227,10 @@ class AlphaVantageTool:
         재무상태표 조회
         """
         try:
-            params = {
-                'function': 'BALANCE_SHEET',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._query('BALANCE_SHEET', symbol)
             
             if 'annualReports' in data and len(data['annualReports']) > 0:
                 latest = data['annualReports'][0]
-                time.sleep(12)  # API 제한
                 return {
                     'total_assets': float(latest.get('totalAssets', 0)),
                     'total_equity': float(latest.get('totalShareholderEquity', 0)),
@@ -252,20 +250,10 @@ class AlphaVantageTool:
         현금흐름표 조회
         """
         try:
-            params = {
-                'function': 'CASH_FLOW',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._query('CASH_FLOW', symbol)
             
             if 'annualReports' in data and len(data['annualReports']) > 0:
                 latest = data['annualReports'][0]
-                time.sleep(12)  # API 제한
                 return {
                     'cash_flow_operating': float(latest.get('operatingCashflow', 0)),
                     'cash_flow_investing': float(latest.get('cashflowFromInvestment', 0)),
@@ -0,0 +1,258 @@
+"""
+뉴스 기사 로컬 저장소 (SQLite + FTS5 전문 색인)
+실행마다 같은 뉴스를 다시 검색하지 않도록 본 기사를 모두 보관하고 다음 실행에서 재사용
+
+- 기사: 정규화 URL(dedup.canonicalize_url) 기준 1건, 처음/마지막으로 본 시각, 발행일, 추출된 기업(entities)
+- 출처: 기사를 가져온 검색 쿼리 (article_queries), 쿼리별 마지막 검색 시각 (query_runs)
+- 전문 검색: 제목/본문 FTS5 색인 (SQLite에 FTS5가 없으면 LIKE 검색)
+- 같은 경로의 저장소는 프로세스에서 하나만 사용 (get_article_store), 연결은 스레드 간 공유 + 잠금
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from tools.dedup import canonicalize_url
+
+
+DEFAULT_STORE_PATH = os.path.join('cache', 'articles.db')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT,
+    content TEXT,
+    published_at TEXT,
+    source TEXT,
+    entities TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_first_seen ON articles(first_seen);
+CREATE TABLE IF NOT EXISTS article_queries (
+    url_key TEXT NOT NULL,
+    query TEXT NOT NULL,
+    seen_at TEXT NOT NULL,
+    PRIMARY KEY (query, url_key)
+);
+CREATE TABLE IF NOT EXISTS query_runs (
+    query TEXT PRIMARY KEY,
+    searched_at TEXT NOT NULL
+);
+"""
+
+
+class ArticleStore:
+    """
+    Args:
+        path: SQLite 파일 경로 (':memory:'면 메모리)
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self.fts_enabled = self._create_fts()
+
+    def _create_fts(self) -> bool:
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(url_key UNINDEXED, title, content)"
+            )
+            return True
+        except sqlite3.OperationalError:
+            print("[WARNING] SQLite FTS5를 사용할 수 없습니다 - 기사 검색은 LIKE로 대체")
+            return False
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec='seconds')
+
+    def add_articles(self, articles: Iterable[Dict[str, Any]], query: Optional[str] = None) -> int:
+        """
+        기사 저장 (이미 있으면 마지막으로 본 시각 갱신, 본문은 더 긴 쪽 유지), query가 있으면 출처 기록
+
+        Returns:
+            새로 저장된 기사 수
+        """
+        now = self._now()
+        added = 0
+        with self._lock, self._conn:
+            for article in articles:
+                url = article.get('url', '')
+                url_key = canonicalize_url(url)
+                if not url_key:
+                    continue
+                row = self._conn.execute(
+                    "SELECT content FROM articles WHERE url_key = ?", (url_key,)
+                ).fetchone()
+                content = article.get('content') or ''
+                if row is None:
+                    self._conn.execute(
+                        "INSERT INTO articles (url_key, url, title, content, published_at, source, first_seen, last_seen)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (url_key, url, article.get('title', ''), content, article.get('publishedAt'),
+                         article.get('source', ''), now, now)
+                    )
+                    self._index(url_key, article.get('title', ''), content, new=True)
+                    added += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE articles SET last_seen = ?, published_at = COALESCE(published_at, ?) WHERE url_key = ?",
+                        (now, article.get('publishedAt'), url_key)
+                    )
+                    if len(content) > len(row['content'] or ''):
+                        self._conn.execute("UPDATE articles SET content = ? WHERE url_key = ?", (content, url_key))
+                        self._index(url_key, article.get('title', ''), content, new=False)
+                if query:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO article_queries (url_key, query, seen_at) VALUES (?, ?, ?)",
+                        (url_key, query, now)
+                    )
+        return added
+
+    def _index(self, url_key: str, title: str, content: str, new: bool) -> None:
+        if not self.fts_enabled:
+            return
+        if not new:
+            self._conn.execute("DELETE FROM articles_fts WHERE url_key = ?", (url_key,))
+        self._conn.execute(
+            "INSERT INTO articles_fts (url_key, title, content) VALUES (?, ?, ?)", (url_key, title, content)
+        )
+
+    def set_entities(self, entities_by_url: Dict[str, Dict[str, List[str]]]) -> None:
+        """기사별 추출 기업 저장 (URL → {'dart': [...], 'sec': [...]})"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE articles SET entities = ? WHERE url_key = ?",
+                [(json.dumps(entities, ensure_ascii=False), canonicalize_url(url))
+                 for url, entities in entities_by_url.items() if url]
+            )
+
+    def mark_searched(self, query: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_runs (query, searched_at) VALUES (?, ?)", (query, self._now())
+            )
+
+    def last_searched(self, query: str) -> Optional[datetime]:
+        """쿼리를 마지막으로 실시간 검색한 시각 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT searched_at FROM query_runs WHERE query = ?", (query,)).fetchone()
+        return datetime.fromisoformat(row['searched_at']) if row else None
+
+    @staticmethod
+    def _parse_published(value: Optional[str]) -> Optional[datetime]:
+        """발행일 문자열 (ISO 8601 또는 RFC 2822) → 로컬 시각 (파싱 실패 시 None)"""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
+    @classmethod
+    def _published_since(cls, row: sqlite3.Row, since: Optional[datetime]) -> bool:
+        """since 이후 발행된 기사인지 (발행일이 없거나 읽을 수 없으면 처음 본 시각으로 판단)"""
+        if since is None:
+            return True
+        published = cls._parse_published(row['published_at'])
+        if published is not None:
+            return published >= since
+        return row['first_seen'] >= since.isoformat(timespec='seconds')
+
+    def query_articles(self, query: str, since: Optional[datetime] = None,
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        쿼리로 수집된 기사 (since 이후 발행된 기사, 최근에 본 순서)
+        발행일이 없는 기사만 처음 본 시각으로 기간 판단 (오래된 기사를 새로 본 경우 제외되도록)
+        """
+        sql = ("SELECT a.* FROM articles a JOIN article_queries q ON q.url_key = a.url_key"
+               " WHERE q.query = ? ORDER BY q.seen_at DESC, a.first_seen DESC")
+        with self._lock:
+            rows = self._conn.execute(sql, (query,)).fetchall()
+        rows = [row for row in rows if self._published_since(row, since)]
+        if limit:
+            rows = rows[:limit]
+        return [self._to_article(row, query) for row in rows]
+
+    def search(self, text: str, since: Optional[datetime] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """제목/본문 전문 검색 (FTS5 MATCH 문법, 관련도 순, since는 query_articles와 같이 발행일 기준)"""
+        rows = None
+        with self._lock:
+            if self.fts_enabled:
+                try:
+                    rows = self._conn.execute(
+                        "SELECT a.* FROM articles_fts f JOIN articles a ON a.url_key = f.url_key"
+                        " WHERE articles_fts MATCH ? ORDER BY f.rank", (text,)
+                    ).fetchall()
+                except sqlite3.OperationalError as e:
+                    print(f"    [WARNING] 기사 전문 검색 쿼리 오류 ({text}): {e} - LIKE로 대체")
+            if rows is None:
+                pattern = f"%{text}%"
+                rows = self._conn.execute(
+                    "SELECT * FROM articles WHERE title LIKE ? OR content LIKE ? ORDER BY first_seen DESC",
+                    (pattern, pattern)
+                ).fetchall()
+        rows = [row for row in rows if self._published_since(row, since)]
+        return [self._to_article(row) for row in rows[:limit]]
+
+    @staticmethod
+    def _to_article(row: sqlite3.Row, query: Optional[str] = None) -> Dict[str, Any]:
+        """저장된 행 → 뉴스 기사 형식 (MarketTrendAgent._to_article과 같은 키)"""
+        article = {
+            'title': row['title'] or '',
+            'url': row['url'],
+            'content': row['content'] or '',
+            'publishedAt': row['published_at'],
+            'source': row['source'] or 'web_search',
+            'first_seen': row['first_seen']
+        }
+        if query is not None:
+            article['query'] = query
+        if row['entities']:
+            article['entities'] = json.loads(row['entities'])
+        return article
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            articles = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            queries = self._conn.execute("SELECT COUNT(*) FROM query_runs").fetchone()[0]
+        return {'articles': articles, 'queries': queries, 'fts': self.fts_enabled, 'path': self.path}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, ArticleStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_article_store(path: str = DEFAULT_STORE_PATH) -> ArticleStore:
+    """경로별 공유 기사 저장소"""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = ArticleStore(path)
+            _stores[path] = store
+        return store
+
+
+__all__ = ['ArticleStore', 'get_article_store', 'DEFAULT_STORE_PATH']
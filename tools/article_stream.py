@@ -0,0 +1,118 @@
+"""
+뉴스 기사 스트림 처리
+검색 결과가 도착하는 대로 기사별 기업 태깅/키워드 집계를 하고,
+처음 등장한 기업의 공시 수집을 검색이 끝나기 전에 백그라운드로 시작
+
+- 기사별 결과를 보관하므로 최종 기사(중복 제거/최근 기사 필터/개수 제한 후)만 골라 합산
+  → 전체 텍스트를 한 번에 처리하던 결과와 동일 (기업 순서는 태거 사전 순서, 키워드는 기사 순서)
+- 선수집 결과는 prefetched()로 받음 (예외도 그대로 전달, 선수집하지 않은 기업은 None)
+- 최종 목록에서 빠진 기업의 선수집은 결과를 버림 (시작 전이면 취소)
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tools.dedup import article_text
+from tools.metrics import bind_context
+
+
+Extractor = Callable[[str], List[str]]
+Prefetcher = Callable[[str], Any]
+
+
+class ArticleStream:
+    """
+    Args:
+        extractors: 소스 이름 → 텍스트에서 기업명 리스트를 추출하는 함수 (예: {'dart': ..., 'sec': ...})
+        keyword_counter: 기사 1건 → 카테고리별 Counter (TrendAnalyzer.count_article_keywords)
+        prefetchers: 소스 이름 → 기업 1곳의 공시를 수집하는 함수 (없는 소스는 선수집 안 함)
+        max_workers: 선수집 동시 실행 수
+    """
+
+    def __init__(self, extractors: Dict[str, Extractor],
+                 keyword_counter: Optional[Callable[[Dict[str, Any]], Dict[str, Counter]]] = None,
+                 prefetchers: Optional[Dict[str, Prefetcher]] = None,
+                 max_workers: int = 4):
+        self.extractors = extractors
+        self.keyword_counter = keyword_counter
+        self.prefetchers = prefetchers or {}
+        self._analysis: Dict[int, Tuple[Dict[str, Any], Dict[str, List[str]], Optional[Dict[str, Counter]]]] = {}
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='prefetch') \
+            if self.prefetchers else None
+
+    def _analyze(self, article: Dict[str, Any]):
+        text = article_text(article)
+        companies = {source: extract(text) for source, extract in self.extractors.items()}
+        keywords = self.keyword_counter(article) if self.keyword_counter else None
+        return article, companies, keywords
+
+    def add(self, article: Dict[str, Any]) -> Dict[str, List[str]]:
+        """기사 1건 태깅/키워드 집계, 처음 등장한 기업은 공시 선수집 시작. 소스별 기업 리스트 반환"""
+        analysis = self._analyze(article)
+        with self._lock:
+            # 기사 객체를 함께 보관하므로 id가 재사용되지 않음
+            self._analysis[id(article)] = analysis
+            new = [(source, company) for source, companies in analysis[1].items()
+                   for company in companies if (source, company) not in self._futures]
+            for source, company in new:
+                prefetch = self.prefetchers.get(source)
+                if prefetch is not None:
+                    self._futures[(source, company)] = self._pool.submit(bind_context(prefetch), company)
+        for source, company in new:
+            if source in self.prefetchers:
+                print(f"    [STREAM] 새 기업 감지: {company} ({source}) - 공시 선수집")
+        return analysis[1]
+
+    def _get(self, article: Dict[str, Any]):
+        with self._lock:
+            analysis = self._analysis.get(id(article))
+        if analysis is None or analysis[0] is not article:
+            # 스트림을 거치지 않은 기사는 지금 처리
+            analysis = self._analyze(article)
+        return analysis
+
+    def companies(self, source: str, articles: Iterable[Dict[str, Any]],
+                  order: Optional[Iterable[str]] = None) -> List[str]:
+        """articles에서 추출된 source 기업 (order가 있으면 그 순서, 없으면 처음 등장 순서)"""
+        found: Dict[str, None] = {}
+        for article in articles:
+            for company in self._get(article)[1].get(source, []):
+                found.setdefault(company, None)
+        if order is None:
+            return list(found)
+        return [company for company in order if company in found]
+
+    def entities(self, article: Dict[str, Any]) -> Dict[str, List[str]]:
+        """기사 1건의 소스별 기업 리스트"""
+        return self._get(article)[1]
+
+    def keyword_counts(self, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Counter]]:
+        """articles의 기사별 카테고리 Counter (기사 순서)"""
+        return [self._get(article)[2] or {} for article in articles]
+
+    def prefetched(self, source: str, company: str) -> Any:
+        """선수집 결과 (끝나지 않았으면 대기), 선수집하지 않은 기업은 None"""
+        with self._lock:
+            future = self._futures.get((source, company))
+        if future is None:
+            return None
+        return future.result()
+
+    def close(self) -> None:
+        """시작하지 않은 선수집 취소 (실행 중인 요청은 끝까지 진행)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+__all__ = ['ArticleStream']
@@ -0,0 +1,205 @@
+"""
+API 크레딧/LLM 토큰 예산
+실행(run) 1건의 웹 검색 호출 수와 LLM 토큰에 상한을 두고 노드(에이전트)별로 나눠 배정
+
+- 노드는 가중치 비율만큼 예산을 예약받고, 끝나면 남은 몫을 공용 풀로 반환
+- 자기 몫이 부족한 호출은 공용 풀에서 빌려 씀 (먼저 끝난 노드의 잔여분)
+- 낮은 우선순위 호출(low_priority 블록)은 노드 몫의 일부를 남겨 두고 공용 풀도 쓰지 않음
+  → 예산이 줄어들면 부가 검색부터 생략되고 핵심 호출은 끝까지 유지
+- 거절된 호출은 각 도구의 기존 fallback 경로를 탐 (검색: 빈 결과, LLM: BudgetExceededError → 호출부 fallback)
+
+현재 노드/예산은 contextvar로 전달 (노드 내부 스레드 풀은 metrics.bind_context로 함께 전달)
+예산이 설정되지 않으면 spend()는 항상 True
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+
+WEB_SEARCH = 'web_search'
+LLM_TOKENS = 'llm_tokens'
+
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 0
+
+# 자원별 노드 가중치 (가중치 합 대비 비율만큼 예약, 목록에 없는 노드는 공용 풀만 사용)
+DEFAULT_NODE_WEIGHTS = {
+    WEB_SEARCH: {
+        'market_trend_node': 3,
+        'supplier_matching_node': 2,
+        'financial_analysis_node': 3,
+        'risk_prefetch_node': 3,
+        'risk_assessment_node': 1
+    },
+    LLM_TOKENS: {
+        'market_trend_node': 1,
+        'financial_analysis_node': 1,
+        'risk_prefetch_node': 3,
+        'risk_assessment_node': 1,
+        'investment_strategy_node': 2,
+        'report_generation_node': 4
+    }
+}
+
+# 낮은 우선순위 호출이 남겨 둬야 하는 노드 몫 비율
+DEFAULT_LOW_PRIORITY_RESERVE = 0.25
+
+
+class BudgetExceededError(RuntimeError):
+    """예산 소진으로 호출을 생략함 (호출부의 기존 예외 처리/fallback으로 이어짐)"""
+
+
+_current_budget: contextvars.ContextVar = contextvars.ContextVar('budget_manager', default=None)
+_current_node: contextvars.ContextVar = contextvars.ContextVar('budget_node', default=None)
+_call_priority: contextvars.ContextVar = contextvars.ContextVar('budget_priority', default=PRIORITY_NORMAL)
+
+
+class BudgetManager:
+    """실행(run) 1건의 자원별 예산"""
+
+    def __init__(
+        self,
+        limits: Dict[str, Optional[float]],
+        weights: Optional[Dict[str, Dict[str, float]]] = None,
+        low_priority_reserve: float = DEFAULT_LOW_PRIORITY_RESERVE
+    ):
+        self._lock = threading.Lock()
+        self.limits = {resource: float(limit) for resource, limit in limits.items() if limit is not None}
+        self.low_priority_reserve = low_priority_reserve
+        weights = weights or DEFAULT_NODE_WEIGHTS
+
+        self.allowances: Dict[str, Dict[str, float]] = {}
+        self.pool: Dict[str, float] = {}
+        for resource, limit in self.limits.items():
+            node_weights = weights.get(resource, {})
+            total_weight = sum(node_weights.values())
+            if total_weight > 0:
+                self.allowances[resource] = {
+                    node: limit * weight / total_weight for node, weight in node_weights.items()
+                }
+                self.pool[resource] = 0.0
+            else:
+                self.allowances[resource] = {}
+                self.pool[resource] = limit
+
+        # spent: 노드 몫에서 쓴 양 / used: 노드가 쓴 총량 (풀 차용 포함)
+        self.spent = {resource: {} for resource in self.limits}
+        self.used = {resource: {} for resource in self.limits}
+        self.denied = {resource: {} for resource in self.limits}
+        self._released = set()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['BudgetManager']:
+        """config의 web_search_budget / llm_token_budget으로 생성 (둘 다 없으면 None)"""
+        limits = {
+            WEB_SEARCH: config.get('web_search_budget'),
+            LLM_TOKENS: config.get('llm_token_budget')
+        }
+        if all(limit is None for limit in limits.values()):
+            return None
+        return cls(limits, weights=config.get('budget_weights'))
+
+    def try_spend(self, resource: str, amount: float, node: Optional[str], priority: int) -> bool:
+        """예산 차감 (부족하면 차감 없이 False)"""
+        if resource not in self.limits:
+            return True
+
+        node = node or '_unattributed'
+        with self._lock:
+            allowance = self.allowances[resource].get(node, 0.0)
+            own_left = allowance - self.spent[resource].get(node, 0.0)
+            if node in self._released:
+                own_left = 0.0
+
+            if priority <= PRIORITY_LOW:
+                usable = own_left - allowance * self.low_priority_reserve
+            else:
+                usable = own_left + self.pool[resource]
+
+            if amount > usable:
+                self.denied[resource][node] = self.denied[resource].get(node, 0) + 1
+                return False
+
+            from_own = min(amount, max(0.0, own_left))
+            self.spent[resource][node] = self.spent[resource].get(node, 0.0) + from_own
+            self.pool[resource] -= amount - from_own
+            self.used[resource][node] = self.used[resource].get(node, 0.0) + amount
+            return True
+
+    def adjust(self, resource: str, amount: float, node: Optional[str]) -> None:
+        """예상치로 차감한 양 정산 (amount > 0 추가 차감, < 0 환급)"""
+        if resource not in self.limits or not amount:
+            return
+
+        node = node or '_unattributed'
+        with self._lock:
+            self.used[resource][node] = self.used[resource].get(node, 0.0) + amount
+            if node in self._released or node not in self.allowances[resource]:
+                self.pool[resource] -= amount
+            else:
+                self.spent[resource][node] = self.spent[resource].get(node, 0.0) + amount
+
+    def release(self, node: str) -> None:
+        """노드 완료: 쓰지 않은 몫을 공용 풀로 반환"""
+        with self._lock:
+            if node in self._released:
+                return
+            self._released.add(node)
+            for resource in self.limits:
+                allowance = self.allowances[resource].get(node, 0.0)
+                self.pool[resource] += max(0.0, allowance - self.spent[resource].get(node, 0.0))
+
+    @contextmanager
+    def scope(self, node: str):
+        """이 블록 안(및 bind_context로 넘긴 스레드)의 spend()는 node 몫에서 차감"""
+        budget_token = _current_budget.set(self)
+        node_token = _current_node.set(node)
+        try:
+            yield
+        finally:
+            _current_node.reset(node_token)
+            _current_budget.reset(budget_token)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """state['metrics']['budget'] 형식"""
+        with self._lock:
+            return {
+                resource: {
+                    'limit': limit,
+                    'used': round(sum(self.used[resource].values()), 2),
+                    'by_node': {node: round(value, 2) for node, value in self.used[resource].items()},
+                    'denied': dict(self.denied[resource])
+                }
+                for resource, limit in self.limits.items()
+            }
+
+
+def spend(resource: str, amount: float = 1) -> bool:
+    """현재 노드 예산에서 차감 (예산이 없으면 항상 True)"""
+    budget = _current_budget.get()
+    if budget is None:
+        return True
+    return budget.try_spend(resource, amount, _current_node.get(), _call_priority.get())
+
+
+def adjust(resource: str, amount: float) -> None:
+    """spend()로 예상치를 차감한 뒤 실제 사용량과의 차이 정산"""
+    budget = _current_budget.get()
+    if budget is not None:
+        budget.adjust(resource, amount, _current_node.get())
+
+
+@contextmanager
+def low_priority():
+    """이 블록 안의 호출은 낮은 우선순위 (예산이 부족해지면 먼저 생략)"""
+    token = _call_priority.set(PRIORITY_LOW)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+__all__ = ['BudgetManager', 'BudgetExceededError', 'spend', 'adjust', 'low_priority',
+           'WEB_SEARCH', 'LLM_TOKENS', 'PRIORITY_NORMAL', 'PRIORITY_LOW', 'DEFAULT_NODE_WEIGHTS']
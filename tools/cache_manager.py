@@ -1,23 +1,326 @@
 """
 API 요청 결과 캐싱 시스템
+
+CacheManager: 단일 SQLite 파일(cache/cache.db, WAL 모드)에 키별 1행
+- 만료 시각(expires_at) 색인 → 만료 정리는 DELETE 한 번
+- 저장은 upsert 한 문장 (동시에 같은 키를 저장해도 파일이 깨지지 않음)
+- 스레드별 연결 (WAL이므로 읽기는 쓰기를 기다리지 않음)
+- 예전 형식(cache/<md5>.json 파일)은 처음 열 때 유효한 항목만 옮기고 파일 삭제
+
+get_cache_manager(): 프로세스 공유 인스턴스 (검색 도구들이 같은 캐시 사용)
+- 메모리 LRU 계층(디코딩된 객체, CACHE_MEMORY_ENTRIES개, 기본 512)을 SQLite 앞에 둠
+  → 방금 읽은 키를 다시 읽을 때 DB 조회/JSON 파싱 없음
+  - 크기는 직렬화 크기 합계로도 제한 (CACHE_MEMORY_BYTES, 기본 64MB), 한도의 1/8보다 큰 값은 SQLite에만 둠
+  - 조회 결과는 복사하지 않고 읽기 전용 객체를 공유 (수정하면 TypeError, 수정하려면 copy.deepcopy로 사본 생성)
+- 계층별 적중/실패는 cache_memory_hits/misses, cache_disk_hits/misses 지표와 get_cache_stats()['tiers']
+
+용량 제한: 네임스페이스(키 접두어: tavily_, duckduckgo_, gnews_, fetch_, 그 외 default)별 바이트 한도
+- 저장 후 한도를 넘으면 만료 항목부터 지우고, 그래도 넘으면 LRU(마지막 사용 순) 또는
+  LFU(사용 횟수 순)로 한도의 EVICTION_LOW_WATERMARK까지 삭제 (cache_evictions 지표)
+- 설정: CACHE_QUOTAS="fetch=256MB,tavily=64MB,default=64MB" (0이면 무제한), CACHE_EVICTION=lru|lfu
+
+유효 기간: 키 접두어(네임스페이스 또는 데이터 종류)별 TTL_POLICIES, 가장 긴 접두어 적용
+- 뉴스/검색은 몇 시간, 공시 원문/재무 데이터는 며칠, 종료된 회계연도 재무제표는 immutable(만료 없음)
+- 설정: CACHE_TTL="tavily=3h,sec_companyfacts=30d,dart_financial_closed=immutable" (단위 s/m/h/d)
+
+stale-while-revalidate (CACHE_STALE_WHILE_REVALIDATE=최대 허용 경과 시간, 기본 0=사용 안 함,
+서비스 모드는 main.run_service가 공유 CacheManager에 직접 설정, 기본 6h):
+- 만료 후 이 시간 안의 항목은 조회 시 revalidate 함수를 넘긴 호출에 한해 바로 반환하고 백그라운드에서 갱신
+  (같은 키의 갱신은 한 번만, 갱신 결과가 비어 있거나 실패하면 기존 값 유지)
+- 이 시간이 지난 항목은 기존처럼 만료 (삭제 후 캐시 실패)
 """
 
+import copy
 import json
 import os
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional, Hashable
+from tools.metrics import bind_context, record
+
+
+CACHE_DB_NAME = "cache.db"
+BUSY_TIMEOUT_MS = 5000
+DEFAULT_MEMORY_ENTRIES = 512
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+MEMORY_VALUE_FRACTION = 8  # 메모리 계층 한도의 1/8보다 큰 값은 메모리에 두지 않음
+
+DEFAULT_NAMESPACE = 'default'
+CACHE_NAMESPACES = ('tavily', 'duckduckgo', 'gnews', 'fetch', 'dart', 'sec', 'yahoo', 'alphavantage')
+_MB = 1024 * 1024
+DEFAULT_QUOTAS = {'tavily': 64 * _MB, 'duckduckgo': 16 * _MB, 'gnews': 16 * _MB,
+                  'fetch': 256 * _MB, 'dart': 128 * _MB, 'sec': 512 * _MB,
+                  'yahoo': 16 * _MB, 'alphavantage': 16 * _MB, DEFAULT_NAMESPACE: 64 * _MB}
+
+IMMUTABLE = 'immutable'
+_HOUR = 3600
+_DAY = 86400
+TTL_POLICIES = {
+    'tavily': 12 * _HOUR,
+    'duckduckgo': 12 * _HOUR,
+    'gnews': 6 * _HOUR,
+    'fetch': 7 * _DAY,  # 기사 본문 (발행 후 거의 바뀌지 않음)
+    'dart_list': 6 * _HOUR,  # 공시 목록 (매일 추가)
+    'dart_financial': _DAY,  # 진행 중인 회계연도 재무제표
+    'dart_financial_closed': IMMUTABLE,  # 종료된 회계연도 재무제표 (fnlttSinglAcntAll)
+    'dart_corpcodes': 7 * _DAY,  # 기업 코드 목록 (신규 상장 정도만 바뀜)
+    'sec_submissions': _DAY,
+    'sec_companyfacts': 7 * _DAY,
+    'yahoo_chart': _HOUR,  # 주가
+    'yahoo_quotesummary': 6 * _HOUR,  # 시가총액
+    'alphavantage': 7 * _DAY,  # 회사 개요/연간 재무제표
+}
+_TTL_UNITS = {'s': 1, 'm': 60, 'h': _HOUR, 'd': _DAY}
+REFRESH_WORKERS = 4  # stale-while-revalidate 백그라운드 갱신 스레드
+EVICTION_POLICIES = ('lru', 'lfu')
+EVICTION_LOW_WATERMARK = 0.9  # 한도를 넘으면 한도의 90%까지 비움 (저장할 때마다 삭제하지 않도록)
+_SIZE_UNITS = {'KB': 1024, 'MB': _MB, 'GB': 1024 * _MB, 'B': 1}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    cache_key TEXT PRIMARY KEY,
+    query TEXT,
+    num_results INTEGER,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    namespace TEXT NOT NULL DEFAULT 'default',
+    size INTEGER NOT NULL DEFAULT 0,
+    last_access REAL NOT NULL DEFAULT 0,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries(expires_at);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lru ON cache_entries(namespace, last_access);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lfu ON cache_entries(namespace, hits, last_access);
+"""
+
+# 용량 제한 이전에 만든 DB에 추가할 열
+_ADDED_COLUMNS = (
+    ("namespace", "TEXT NOT NULL DEFAULT 'default'"),
+    ("size", "INTEGER NOT NULL DEFAULT 0"),
+    ("last_access", "REAL NOT NULL DEFAULT 0"),
+    ("hits", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+
+def cache_namespace(query: str) -> str:
+    """캐시 키(query)의 네임스페이스 (도구가 붙이는 접두어, 없으면 default)"""
+    prefix = (query or '').split('_', 1)[0]
+    return prefix if prefix in CACHE_NAMESPACES else DEFAULT_NAMESPACE
+
+
+def parse_duration(value: str) -> float:
+    """'90', '30m', '6h', '7d' → 초 (형식이 틀리면 ValueError)"""
+    value = value.strip().lower()
+    if value[-1:] in _TTL_UNITS:
+        return float(value[:-1]) * _TTL_UNITS[value[-1]]
+    return float(value)
+
+
+def parse_ttls(value: Optional[str]) -> Dict[str, Any]:
+    """'tavily=3h,dart_financial_closed=immutable' → {'tavily': 10800, 'dart_financial_closed': 'immutable'}"""
+    ttls = {}
+    for item in (value or '').split(','):
+        if not item.strip():
+            continue
+        try:
+            key, ttl = item.split('=', 1)
+            ttl = ttl.strip().lower()
+            ttls[key.strip()] = IMMUTABLE if ttl == IMMUTABLE else parse_duration(ttl)
+        except (ValueError, IndexError):
+            print(f"[WARNING] CACHE_TTL 항목이 올바르지 않습니다: {item}")
+    return ttls
+
+
+def parse_size(value: str) -> int:
+    """'256MB', '512KB', '1024' → 바이트 (단위 없으면 바이트, 형식이 틀리면 ValueError)"""
+    size = value.strip().upper()
+    unit = next((unit for unit in _SIZE_UNITS if size.endswith(unit)), None)
+    number = float(size[:-len(unit)] if unit else size)
+    return int(number * _SIZE_UNITS.get(unit, 1))
+
+
+def parse_quotas(value: Optional[str]) -> Dict[str, int]:
+    """'fetch=256MB,tavily=64MB' → {'fetch': 268435456, 'tavily': 67108864} (단위 없으면 바이트)"""
+    quotas = {}
+    for item in (value or '').split(','):
+        if not item.strip():
+            continue
+        try:
+            namespace, size = item.split('=', 1)
+            quotas[namespace.strip().lower()] = parse_size(size)
+        except ValueError:
+            print(f"[WARNING] CACHE_QUOTAS 항목이 올바르지 않습니다: {item}")
+    return quotas
+
+class _ReadOnlyDict(dict):
+    """메모리 계층이 공유하는 dict (수정 불가, 복사/피클하면 일반 dict)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("캐시된 값은 수정할 수 없습니다 - copy.deepcopy로 사본을 만들어 수정하세요")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (_thaw(self),)
+
+
+class _ReadOnlyList(list):
+    """메모리 계층이 공유하는 list (수정 불가, 슬라이스/+ 결과와 복사본은 일반 list)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("캐시된 값은 수정할 수 없습니다 - copy.deepcopy로 사본을 만들어 수정하세요")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+    def __reduce_ex__(self, protocol):
+        return list, (_thaw(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """JSON 값 → 읽기 전용 객체 (새 컨테이너로 만들므로 원본 수정의 영향 없음)"""
+    if isinstance(value, dict):
+        return _ReadOnlyDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return _ReadOnlyList(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """읽기 전용 객체 → 수정 가능한 사본"""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# 스키마 생성/예전 JSON 캐시 이전은 DB 파일별로 프로세스에서 한 번만
+_initialized_paths = set()
+_initialized_lock = threading.Lock()
+
 
 class CacheManager:
-    """API 요청 결과 캐싱 관리자"""
+    """
+    API 요청 결과 캐싱 관리자
     
-    def __init__(self, cache_dir: str = "cache"):
+    Args:
+        cache_dir: SQLite 파일 디렉토리
+        memory_entries: 메모리 LRU 계층 크기 (0이면 메모리 계층 없음)
+        memory_bytes: 메모리 LRU 계층의 직렬화 크기 합계 한도 (0이면 항목 수로만 제한)
+        quotas: 네임스페이스별 바이트 한도 (기본 DEFAULT_QUOTAS + CACHE_QUOTAS, 0이면 무제한)
+        eviction: 'lru' 또는 'lfu' (기본 CACHE_EVICTION, 없으면 lru)
+        ttl_policies: 키 접두어별 유효 기간 (초 또는 IMMUTABLE, 기본 TTL_POLICIES + CACHE_TTL)
+        max_stale: 만료 후 stale-while-revalidate로 반환할 최대 경과 시간 (초, 기본 CACHE_STALE_WHILE_REVALIDATE)
+    """
+    
+    def __init__(self, cache_dir: str = "cache", memory_entries: int = 0, memory_bytes: int = DEFAULT_MEMORY_BYTES,
+                 quotas: Optional[Dict[str, int]] = None, eviction: Optional[str] = None,
+                 ttl_policies: Optional[Dict[str, Any]] = None, max_stale: Optional[float] = None):
         self.cache_dir = cache_dir
-        self.cache_duration = 86400  # 24시간 캐시 (86400초)
+        self.cache_duration = 86400  # 정책에 없는 키의 유효 기간 (24시간)
+        self.ttl_policies = {**TTL_POLICIES, **parse_ttls(os.getenv('CACHE_TTL')), **(ttl_policies or {})}
+        if max_stale is None:
+            try:
+                max_stale = parse_duration(os.getenv('CACHE_STALE_WHILE_REVALIDATE') or '0')
+            except ValueError:
+                print(f"[WARNING] CACHE_STALE_WHILE_REVALIDATE 값이 올바르지 않습니다: "
+                      f"{os.getenv('CACHE_STALE_WHILE_REVALIDATE')}")
+                max_stale = 0
+        self.max_stale = max(0.0, max_stale)
+        self._refreshing = set()  # 백그라운드 갱신 중인 키
+        self.stale_hits = 0
+        self.db_path = os.path.join(cache_dir, CACHE_DB_NAME)
+        self._local = threading.local()
+        self.memory_entries = max(0, memory_entries)
+        self.memory_bytes = max(0, memory_bytes)
+        self._memory: OrderedDict = OrderedDict()  # 키 → (만료 시각, 읽기 전용 결과, 직렬화 크기)
+        self._memory_size = 0
+        self._memory_lock = threading.Lock()
+        self.tier_stats = {'memory': {'hits': 0, 'misses': 0}, 'disk': {'hits': 0, 'misses': 0}}
+        self.quotas = {**DEFAULT_QUOTAS, **parse_quotas(os.getenv('CACHE_QUOTAS')), **(quotas or {})}
+        self.eviction = (eviction or os.getenv('CACHE_EVICTION') or 'lru').strip().lower()
+        if self.eviction not in EVICTION_POLICIES:
+            print(f"[WARNING] 알 수 없는 캐시 교체 정책: {self.eviction} - lru 사용")
+            self.eviction = 'lru'
+        self.evictions = 0
+        self._pending_access: Dict[str, int] = {}  # 메모리 계층 적중 (교체 순서 계산 전에 DB에 반영)
         
         # 캐시 디렉토리 생성
         if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        with _initialized_lock:
+            if self.db_path not in _initialized_paths:
+                try:
+                    with self._connect() as conn:
+                        conn.executescript(_SCHEMA)
+                        self._add_missing_columns(conn)
+                        conn.executescript(_INDEXES)
+                    self._migrate_json_files()
+                    self.clear_expired_cache()
+                    _initialized_paths.add(self.db_path)
+                except Exception as e:
+                    print(f"    [WARNING] 캐시 DB 초기화 실패: {e}")
+    
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 DB 연결 (처음 사용 시 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def _add_missing_columns(conn: sqlite3.Connection) -> None:
+        """용량 제한 이전 DB에 열 추가 (기존 항목의 네임스페이스/크기 채움)"""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(cache_entries)")}
+        missing = [(name, ddl) for name, ddl in _ADDED_COLUMNS if name not in existing]
+        if not missing:
+            return
+        for name, ddl in missing:
+            conn.execute(f"ALTER TABLE cache_entries ADD COLUMN {name} {ddl}")
+        conn.execute("UPDATE cache_entries SET size = LENGTH(CAST(result AS BLOB)), last_access = created_at")
+        conn.executemany(
+            "UPDATE cache_entries SET namespace = ? WHERE cache_key = ?",
+            [(cache_namespace(query), key) for key, query in conn.execute("SELECT cache_key, query FROM cache_entries")]
+        )
+    
+    def ttl_for(self, query: str) -> Any:
+        """키의 유효 기간 (초 또는 IMMUTABLE), 가장 긴 접두어가 일치하는 정책 사용"""
+        query = query or ''
+        for prefix in sorted(self.ttl_policies, key=len, reverse=True):
+            if query == prefix or query.startswith(prefix + '_'):
+                return self.ttl_policies[prefix]
+        return self.cache_duration
+    
+    def _expires_at(self, query: str, now: float, ttl: Any = None) -> float:
+        ttl = self.ttl_for(query) if ttl is None else ttl
+        return float('inf') if ttl == IMMUTABLE else now + float(ttl)
     
     def _get_cache_key(self, query: str, num_results: int) -> str:
         """캐시 키 생성"""
@@ -25,86 +328,275 @@ class CacheManager:
         key_string = f"{query}_{num_results}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """캐시 파일 경로 반환"""
-        return os.path.join(self.cache_dir, f"{cache_key}.json")
+    def _migrate_json_files(self) -> None:
+        """예전 형식의 캐시 파일(cache/<키>.json)을 DB로 옮기고 삭제 (만료/손상 파일은 삭제만)"""
+        filenames = [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        if not filenames:
+            return
+        
+        now = time.time()
+        rows = []
+        for filename in filenames:
+            file_path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    cache_data = json.load(f)
+                created_at = datetime.fromisoformat(cache_data['timestamp']).timestamp()
+                expires_at = self._expires_at(cache_data.get('query'), created_at)
+                if expires_at > now:
+                    result = json.dumps(cache_data['result'], ensure_ascii=False)
+                    rows.append((
+                        filename[:-len('.json')], cache_data.get('query'), cache_data.get('num_results'),
+                        result, created_at, expires_at,
+                        cache_namespace(cache_data.get('query')), len(result.encode('utf-8')), created_at
+                    ))
+            except Exception:
+                pass
+        
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache_entries (cache_key, query, num_results, result, created_at, expires_at,"
+                " namespace, size, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError:
+                pass
+        print(f"    [CACHE] 예전 캐시 파일 {len(filenames)}개 정리 ({len(rows)}개 항목을 {self.db_path}로 이전)")
+    
+    def _count(self, tier: str, outcome: str) -> None:
+        with self._memory_lock:
+            self.tier_stats[tier][outcome] += 1
+        record(f'cache_{tier}_{outcome}')
     
-    def get_cached_result(self, query: str, num_results: int) -> Optional[Dict[str, Any]]:
-        """캐시된 결과 조회"""
+    def _memory_get(self, cache_key: str) -> Optional[tuple]:
+        """
+        메모리 계층 조회 → (만료 시각, 공유 읽기 전용 결과), 없으면 None
+        만료 후 max_stale이 지난 항목은 삭제 (그 전의 항목은 stale-while-revalidate용으로 반환)
+        """
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] + self.max_stale <= time.time():
+                self._memory_pop(cache_key)
+                return None
+            self._memory.move_to_end(cache_key)
+        return entry[0], entry[1]
+    
+    def _memory_set(self, cache_key: str, expires_at: float, value: Any, size: int) -> Any:
+        """
+        메모리 계층 저장 (size: 직렬화 크기), 저장한 읽기 전용 값 반환
+        한도의 1/8보다 큰 값은 저장하지 않고 (같은 키의 이전 값은 삭제) 원래 값 반환
+        """
+        if self.memory_bytes and size > self.memory_bytes // MEMORY_VALUE_FRACTION:
+            with self._memory_lock:
+                self._memory_pop(cache_key)
+            return value
+        value = _freeze(value)
+        with self._memory_lock:
+            self._memory_pop(cache_key)
+            self._memory[cache_key] = (expires_at, value, size)
+            self._memory_size += size
+            while len(self._memory) > self.memory_entries or \
+                    (self.memory_bytes and self._memory_size > self.memory_bytes):
+                _, (_, _, evicted_size) = self._memory.popitem(last=False)
+                self._memory_size -= evicted_size
+        return value
+    
+    def _memory_pop(self, cache_key: str) -> None:
+        """메모리 계층 항목 삭제 (_memory_lock 안에서 호출)"""
+        entry = self._memory.pop(cache_key, None)
+        if entry is not None:
+            self._memory_size -= entry[2]
+    
+    def get_cached_result(self, query: str, num_results: int,
+                          revalidate: Optional[Callable[[], Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과 조회 (메모리 계층 → SQLite)
+        
+        Args:
+            revalidate: 새 결과를 가져오는 함수 (stale-while-revalidate 사용 시
+                        만료 후 max_stale 이내의 결과를 바로 반환하고 이 함수로 백그라운드 갱신)
+        """
         try:
             cache_key = self._get_cache_key(query, num_results)
-            cache_file = self._get_cache_file_path(cache_key)
+            serve_stale = revalidate is not None and self.max_stale > 0
             
-            if not os.path.exists(cache_file):
-                return None
+            if self.memory_entries:
+                entry = self._memory_get(cache_key)
+                if entry is not None and (entry[0] > time.time() or serve_stale):
+                    with self._memory_lock:
+                        self._pending_access[cache_key] = self._pending_access.get(cache_key, 0) + 1
+                    self._count('memory', 'hits')
+                    record('cache_hits')
+                    if entry[0] <= time.time():
+                        return self._serve_stale(query, num_results, entry[1], revalidate)
+                    print(f"    [CACHE] '{query}' 캐시에서 조회 (메모리)")
+                    return entry[1]
+                self._count('memory', 'misses')
             
-            # 캐시 파일 읽기
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT result, expires_at FROM cache_entries WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
             
-            # 캐시 만료 확인
-            cache_time = datetime.fromisoformat(cache_data['timestamp'])
-            if datetime.now() - cache_time > timedelta(seconds=self.cache_duration):
-                os.remove(cache_file)  # 만료된 캐시 삭제
+            if row is None:
+                self._count('disk', 'misses')
+                record('cache_misses')
                 return None
             
+            # 캐시 만료 확인 (stale-while-revalidate 허용 시간 안이면 기존 값 반환 후 갱신)
+            stale = row[1] <= time.time()
+            if stale and not (serve_stale and row[1] + self.max_stale > time.time()):
+                if row[1] + self.max_stale <= time.time():
+                    with conn:
+                        # 그 사이 다시 저장된 항목은 지우지 않음
+                        conn.execute(
+                            "DELETE FROM cache_entries WHERE cache_key = ? AND expires_at <= ?",
+                            (cache_key, time.time() - self.max_stale)
+                        )
+                self._count('disk', 'misses')
+                record('cache_misses')
+                return None
+            
+            with conn:
+                conn.execute(
+                    "UPDATE cache_entries SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                    (time.time(), cache_key)
+                )
+            self._count('disk', 'hits')
+            record('cache_hits')
+            result = json.loads(row[0])
+            if self.memory_entries:
+                result = self._memory_set(cache_key, row[1], result, len(row[0]))
+            if stale:
+                return self._serve_stale(query, num_results, result, revalidate)
             print(f"    [CACHE] '{query}' 캐시에서 조회")
-            return cache_data['result']
+            return result
             
         except Exception as e:
             print(f"    [WARNING] 캐시 조회 실패: {e}")
             return None
     
-    def set_cached_result(self, query: str, num_results: int, result: Dict[str, Any]) -> None:
-        """결과를 캐시에 저장"""
+    def _serve_stale(self, query: str, num_results: int, value: Any, revalidate: Callable[[], Any]) -> Any:
+        """만료된 값을 반환하고 백그라운드 갱신 시작 (같은 키가 이미 갱신 중이면 시작하지 않음)"""
+        cache_key = self._get_cache_key(query, num_results)
+        with self._memory_lock:
+            self.stale_hits += 1
+            refreshing = cache_key in self._refreshing
+            self._refreshing.add(cache_key)
+        record('cache_stale_hits')
+        print(f"    [CACHE] '{query}' 만료된 캐시 사용" + ("" if refreshing else " - 백그라운드 갱신"))
+        if not refreshing:
+            _get_refresh_pool().submit(bind_context(self._refresh), query, num_results, cache_key, revalidate)
+        return value
+    
+    def _refresh(self, query: str, num_results: int, cache_key: str, revalidate: Callable[[], Any]) -> None:
+        try:
+            value = revalidate()
+            if value:
+                self.set_cached_result(query, num_results, value)
+            else:
+                print(f"    [WARNING] 캐시 갱신 결과 없음 '{query}' - 기존 값 유지")
+        except Exception as e:
+            print(f"    [WARNING] 캐시 갱신 실패 '{query}': {e} - 기존 값 유지")
+        finally:
+            with self._memory_lock:
+                self._refreshing.discard(cache_key)
+    
+    def set_cached_result(self, query: str, num_results: int, result: Dict[str, Any], ttl: Any = None) -> None:
+        """결과를 캐시에 저장 (ttl: 초 또는 IMMUTABLE, 없으면 키 접두어의 TTL 정책)"""
         try:
             cache_key = self._get_cache_key(query, num_results)
-            cache_file = self._get_cache_file_path(cache_key)
+            namespace = cache_namespace(query)
+            encoded = json.dumps(result, ensure_ascii=False)
+            size = len(encoded.encode('utf-8'))
+            now = time.time()
+            expires_at = self._expires_at(query, now, ttl)
             
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'query': query,
-                'num_results': num_results,
-                'result': result
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO cache_entries (cache_key, query, num_results, result, created_at, expires_at,"
+                    " namespace, size, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT(cache_key) DO UPDATE SET query = excluded.query, num_results = excluded.num_results,"
+                    " result = excluded.result, created_at = excluded.created_at, expires_at = excluded.expires_at,"
+                    " namespace = excluded.namespace, size = excluded.size, last_access = excluded.last_access",
+                    (cache_key, query, num_results, encoded, now, expires_at,
+                     namespace, size, now)
+                )
+                self._enforce_quota(conn, namespace)
+            if self.memory_entries:
+                self._memory_set(cache_key, expires_at, result, size)
             
             print(f"    [CACHE] '{query}' 결과 캐시에 저장")
             
         except Exception as e:
             print(f"    [WARNING] 캐시 저장 실패: {e}")
     
+    def _flush_access(self, conn: sqlite3.Connection) -> None:
+        """메모리 계층 적중을 DB의 사용 시각/횟수에 반영"""
+        with self._memory_lock:
+            pending, self._pending_access = self._pending_access, {}
+        if pending:
+            now = time.time()
+            conn.executemany(
+                "UPDATE cache_entries SET last_access = ?, hits = hits + ? WHERE cache_key = ?",
+                [(now, count, key) for key, count in pending.items()]
+            )
+    
+    def _enforce_quota(self, conn: sqlite3.Connection, namespace: str) -> None:
+        """네임스페이스가 한도를 넘으면 만료 항목, 그다음 LRU/LFU 순서로 삭제 (호출 측 트랜잭션 안에서)"""
+        quota = self.quotas.get(namespace, self.quotas.get(DEFAULT_NAMESPACE, 0))
+        if not quota:
+            return
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+        if total <= quota:
+            return
+        
+        self._flush_access(conn)
+        expired = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (namespace, time.time())
+        ).rowcount
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+        
+        victims = []
+        if total > quota:
+            target = quota * EVICTION_LOW_WATERMARK
+            order = "last_access" if self.eviction == 'lru' else "hits, last_access"
+            for cache_key, size in conn.execute(
+                f"SELECT cache_key, size FROM cache_entries WHERE namespace = ? ORDER BY {order}", (namespace,)
+            ):
+                if total <= target:
+                    break
+                victims.append(cache_key)
+                total -= size
+            conn.executemany("DELETE FROM cache_entries WHERE cache_key = ?", [(key,) for key in victims])
+            with self._memory_lock:
+                for key in victims:
+                    self._memory_pop(key)
+                self.evictions += len(victims)
+            record('cache_evictions', len(victims))
+        
+        print(f"    [CACHE] {namespace} 캐시 한도({quota:,} bytes) 초과 - 만료 {expired}개, "
+              f"{self.eviction.upper()} {len(victims)}개 삭제")
+    
     def clear_expired_cache(self) -> None:
         """만료된 캐시 정리"""
         try:
-            if not os.path.exists(self.cache_dir):
-                return
-            
-            current_time = datetime.now()
-            removed_count = 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            cache_data = json.load(f)
-                        
-                        cache_time = datetime.fromisoformat(cache_data['timestamp'])
-                        if current_time - cache_time > timedelta(seconds=self.cache_duration):
-                            os.remove(file_path)
-                            removed_count += 1
-                            
-                    except Exception:
-                        # 손상된 캐시 파일 삭제
-                        os.remove(file_path)
-                        removed_count += 1
+            with self._connect() as conn:
+                # stale-while-revalidate로 반환할 수 있는 항목은 남김
+                removed_count = conn.execute(
+                    "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time() - self.max_stale,)
+                ).rowcount
             
             if removed_count > 0:
-                print(f"    [CACHE] {removed_count}개 만료된 캐시 파일 정리")
+                print(f"    [CACHE] {removed_count}개 만료된 캐시 항목 정리")
                 
         except Exception as e:
             print(f"    [WARNING] 캐시 정리 실패: {e}")
@@ -112,24 +604,138 @@ class CacheManager:
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보"""
         try:
-            if not os.path.exists(self.cache_dir):
-                return {'total_files': 0, 'total_size': 0}
-            
-            total_files = 0
-            total_size = 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    total_files += 1
-                    total_size += os.path.getsize(file_path)
+            total_entries, expired_entries, total_size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at <= ?), 0), COALESCE(SUM(LENGTH(CAST(result AS BLOB))), 0)"
+                " FROM cache_entries", (time.time(),)
+            ).fetchone()
             
             return {
-                'total_files': total_files,
+                'total_entries': total_entries,
+                'expired_entries': expired_entries,
                 'total_size': total_size,
+                'db_size': sum(os.path.getsize(self.db_path + suffix) for suffix in ('', '-wal')
+                               if os.path.exists(self.db_path + suffix)),
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_size,
+                'tiers': copy.deepcopy(self.tier_stats),
+                'namespaces': {
+                    namespace: {'entries': entries, 'size': size,
+                                'quota': self.quotas.get(namespace, self.quotas.get(DEFAULT_NAMESPACE, 0))}
+                    for namespace, entries, size in self._connect().execute(
+                        "SELECT namespace, COUNT(*), SUM(size) FROM cache_entries GROUP BY namespace"
+                    )
+                },
+                'eviction': self.eviction,
+                'evictions': self.evictions,
+                'max_stale': self.max_stale,
+                'stale_hits': self.stale_hits,
                 'cache_dir': self.cache_dir
             }
             
         except Exception as e:
             print(f"    [WARNING] 캐시 통계 조회 실패: {e}")
-            return {'total_files': 0, 'total_size': 0}
+            return {'total_entries': 0, 'total_size': 0}
+
+
+_refresh_pool: Optional[ThreadPoolExecutor] = None
+_refresh_pool_lock = threading.Lock()
+
+
+def _get_refresh_pool() -> ThreadPoolExecutor:
+    global _refresh_pool
+    with _refresh_pool_lock:
+        if _refresh_pool is None:
+            _refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix='cache-refresh')
+        return _refresh_pool
+
+
+_shared_managers: Dict[str, CacheManager] = {}
+_shared_managers_lock = threading.Lock()
+
+
+def get_cache_manager(cache_dir: str = "cache", max_stale: Optional[float] = None) -> CacheManager:
+    """
+    프로세스 공유 CacheManager (메모리 LRU 계층 포함, 크기는 CACHE_MEMORY_ENTRIES/CACHE_MEMORY_BYTES)
+    max_stale을 지정하면 공유 인스턴스의 stale-while-revalidate 허용 시간을 그 값으로 설정
+    """
+    with _shared_managers_lock:
+        manager = _shared_managers.get(cache_dir)
+        if manager is None:
+            try:
+                memory_entries = int(os.getenv('CACHE_MEMORY_ENTRIES', DEFAULT_MEMORY_ENTRIES))
+            except ValueError:
+                print(f"[WARNING] CACHE_MEMORY_ENTRIES 값이 올바르지 않습니다: {os.getenv('CACHE_MEMORY_ENTRIES')}")
+                memory_entries = DEFAULT_MEMORY_ENTRIES
+            try:
+                memory_bytes = parse_size(os.getenv('CACHE_MEMORY_BYTES') or str(DEFAULT_MEMORY_BYTES))
+            except ValueError:
+                print(f"[WARNING] CACHE_MEMORY_BYTES 값이 올바르지 않습니다: {os.getenv('CACHE_MEMORY_BYTES')}")
+                memory_bytes = DEFAULT_MEMORY_BYTES
+            manager = CacheManager(cache_dir, memory_entries=memory_entries, memory_bytes=memory_bytes)
+            _shared_managers[cache_dir] = manager
+        if max_stale is not None:
+            manager.max_stale = max(0.0, max_stale)
+        return manager
+
+
+class MemoryCache:
+    """
+    프로세스 내 API 응답 캐시
+    배치 실행 시 같은 도구 인스턴스를 공유하는 보고서끼리 공시/재무 응답 재사용
+    
+    namespace를 지정하면 공유 CacheManager(메모리 LRU 계층 + SQLite)에만 저장해 실행 간 재사용
+    (튜플 키 ('financial', corp_code, ...) → 'dart_financial_<corp_code>_...', 유효 기간은 TTL_POLICIES,
+    프로세스 내 사본을 따로 두지 않으므로 상주 프로세스에서도 만료/stale-while-revalidate가 적용됨)
+    """
+    
+    def __init__(self, namespace: Optional[str] = None):
+        self.namespace = namespace
+        self._data: Dict[Hashable, Any] = {}  # namespace가 없을 때만 사용
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, revalidate: Optional[Callable[[], Any]] = None) -> Optional[Any]:
+        """캐시 조회 (namespace가 있으면 공유 읽기 전용 값, 없으면 호출 측 수정이 캐시에 반영되지 않도록 사본 반환)"""
+        if self.namespace:
+            # 적중/실패 지표는 CacheManager가 기록
+            value = get_cache_manager().get_cached_result(self._persistent_key(key), 0, revalidate=revalidate)
+            with self._lock:
+                if value is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return value
+        
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                value = self._data[key]
+            else:
+                self.misses += 1
+                value = None
+        if value is None:
+            record('cache_misses')
+            return None
+        record('cache_hits')
+        return copy.deepcopy(value)
+    
+    def set(self, key: Hashable, value: Any, ttl: Any = None) -> None:
+        """캐시 저장 (ttl: 디스크 캐시 유효 기간, 없으면 TTL 정책)"""
+        if self.namespace:
+            get_cache_manager().set_cached_result(self._persistent_key(key), 0, value, ttl=ttl)
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = value
+    
+    def _persistent_key(self, key: Hashable) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return '_'.join([self.namespace] + [str(part) for part in parts])
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,255 @@
+"""
+제공자별 서킷 브레이커
+실패가 반복되는 제공자는 일정 시간(cooldown) 요청을 보내지 않고 바로 실패 처리
+→ 각 도구의 기존 Fallback 경로(빈 결과, 다른 제공자, 대체 응답)로 즉시 넘어감
+
+- closed: 정상. 연속 실패가 FAILURE_THRESHOLD회에 도달하면 open
+- open: cooldown 동안 요청 차단 (CircuitOpenError)
+- half_open: cooldown 후 시험 요청 1건만 허용, 성공하면 closed / 실패하면 다시 open
+- 인증 오류(401/403)는 재시도해도 같은 결과이므로 즉시 open
+- 429/408/5xx 응답, 연결 실패/타임아웃은 실패, 그 외(404 포함)는 성공으로 집계
+
+브레이커는 제공자(rate_limiter.host_provider) 단위로 프로세스 전체에서 공유
+(예: 모든 TavilySearchTool 인스턴스가 'tavily' 브레이커 하나를 사용)
+세션 연결은 알려진 API 제공자(HOST_LIMITS) 호스트만 대상, 기사 본문 등 임의 호스트 요청에는 브레이커 없음
+
+requests 세션은 guard_session(), httpx.AsyncClient는 guard_async_client()로 연결
+(configure_session/AsyncClientPool이 자동으로 호출), OpenAI 호출은 llm_tools에서 직접 사용
+설정: CIRCUIT_BREAKER_THRESHOLD (기본 5), CIRCUIT_BREAKER_COOLDOWN (초, 기본 60)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from tools.metrics import record
+from tools.rate_limiter import HOST_LIMITS, host_provider, parse_retry_after
+
+
+FAILURE_THRESHOLD = 5
+COOLDOWN_SECONDS = 60.0
+TRIP_IMMEDIATELY_STATUS = (401, 403)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """브레이커가 열려 요청을 보내지 않음 (기존 ConnectionError 처리 경로로 Fallback)"""
+
+
+def is_failure_status(status_code: int) -> bool:
+    return status_code in TRIP_IMMEDIATELY_STATUS or status_code in (408, 429) or status_code >= 500
+
+
+class CircuitBreaker:
+    """
+    제공자 1곳의 서킷 브레이커 (스레드 안전)
+
+    Args:
+        name: 제공자 이름 (로그/지표 표시용)
+        failure_threshold: open까지의 연속 실패 횟수
+        cooldown: open 상태 유지 시간 (초)
+    """
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 cooldown: float = COOLDOWN_SECONDS):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0  # 연속 실패 수
+        self.trips = 0  # open된 횟수
+        self.rejected = 0  # 차단된 요청 수
+        self._open_until = 0.0
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되면 True (cooldown이 지난 open은 half_open으로 바꾸고 시험 요청 1건 허용)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now >= self._open_until:
+                self.state = HALF_OPEN
+                self._trial_started = now
+                print(f"    [CIRCUIT] {self.name} 시험 요청 (half-open)")
+                return True
+            if self.state == HALF_OPEN and now - self._trial_started >= self.cooldown:
+                # 결과가 보고되지 않은 시험 요청은 cooldown 후 다시 시험
+                self._trial_started = now
+                return True
+            self.rejected += 1
+        record('circuit_rejected_calls')
+        return False
+
+    def is_open(self) -> bool:
+        """요청이 차단되는 상태인지 (상태를 바꾸지 않고 확인, 예산 차감 전 확인용)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                return now < self._open_until
+            return self.state == HALF_OPEN and now - self._trial_started < self.cooldown
+
+    def check(self) -> None:
+        """차단 상태면 CircuitOpenError"""
+        if not self.allow_request():
+            raise CircuitOpenError(f"{self.name} 서킷 브레이커 open - 요청 생략")
+
+    def record_success(self) -> None:
+        if self.state == CLOSED and not self.failures:
+            return
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"    [CIRCUIT] {self.name} 복구 (closed)")
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """실패 1회 집계 (연속 실패가 한도에 도달하거나 인증 오류/시험 요청 실패면 open)"""
+        with self._lock:
+            self.failures += 1
+            trip = (self.state == HALF_OPEN or self.failures >= self.failure_threshold
+                    or status_code in TRIP_IMMEDIATELY_STATUS)
+            failures = self.failures
+        if trip:
+            self.trip(f"HTTP {status_code}" if status_code else f"연속 실패 {failures}회", retry_after)
+
+    def trip(self, reason: str, retry_after: Optional[float] = None) -> None:
+        """즉시 open (cooldown과 retry_after 중 긴 시간 동안 차단, 이미 open이면 무시)"""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() < self._open_until:
+                return
+            cooldown = max(self.cooldown, retry_after or 0.0)
+            self.state = OPEN
+            self._open_until = time.monotonic() + cooldown
+            self.trips += 1
+        record('circuit_trips')
+        print(f"    [CIRCUIT] {self.name} open ({reason}) - {cooldown:g}초 동안 요청 생략")
+
+    def observe(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """응답 상태 코드로 성공/실패 집계"""
+        if is_failure_status(status_code):
+            self.record_failure(status_code, parse_retry_after(retry_after))
+        else:
+            self.record_success()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            remaining = max(0.0, self._open_until - time.monotonic()) if self.state == OPEN else 0.0
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'trips': self.trips,
+                'rejected': self.rejected,
+                'cooldown_remaining': round(remaining, 1)
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"[WARNING] {name} 값이 올바르지 않습니다: {value}")
+        return default
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """제공자별 공유 서킷 브레이커"""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                provider,
+                failure_threshold=int(_env_number('CIRCUIT_BREAKER_THRESHOLD', FAILURE_THRESHOLD)),
+                cooldown=_env_number('CIRCUIT_BREAKER_COOLDOWN', COOLDOWN_SECONDS)
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def get_url_breaker(url: str) -> Optional[CircuitBreaker]:
+    """URL 호스트 제공자의 브레이커 (HOST_LIMITS에 없는 호스트는 None)"""
+    host = (urlsplit(url).hostname or '').lower()
+    if host not in HOST_LIMITS:
+        return None
+    return get_breaker(host_provider(host))
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """사용된 브레이커의 현재 상태 (실행 지표용, 프로세스 시작 후 누적)"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.snapshot() for name, breaker in sorted(breakers.items())}
+
+
+def guard_session(session):
+    """
+    requests.Session의 모든 요청을 요청 호스트 제공자의 브레이커에 연결
+    open이면 보내지 않고 CircuitOpenError, 응답/연결 실패로 상태 갱신
+    """
+    if getattr(session, '_circuit_guarded', False):
+        return session
+
+    send = session.send
+
+    def guarded_send(request, **kwargs):
+        breaker = get_url_breaker(request.url)
+        if breaker is None:
+            return send(request, **kwargs)
+        breaker.check()
+        try:
+            response = send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            breaker.record_failure()
+            raise
+        breaker.observe(response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    session.send = guarded_send
+    session._circuit_guarded = True
+    return session
+
+
+def guard_async_client(client):
+    """httpx.AsyncClient용 guard_session()"""
+    if getattr(client, '_circuit_guarded', False):
+        return client
+
+    import httpx
+
+    send = client.send
+
+    async def guarded_send(request, **kwargs):
+        breaker = get_url_breaker(str(request.url))
+        if breaker is None:
+            return await send(request, **kwargs)
+        breaker.check()
+        try:
+            response = await send(request, **kwargs)
+        except (httpx.TimeoutException, httpx.NetworkError):
+            breaker.record_failure()
+            raise
+        breaker.observe(response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    client.send = guarded_send
+    client._circuit_guarded = True
+    return client
+
+
+__all__ = ['CircuitBreaker', 'CircuitOpenError', 'get_breaker', 'get_url_breaker', 'breaker_states',
+           'guard_session', 'guard_async_client', 'is_failure_status']
@@ -0,0 +1,43 @@
+"""
+병렬 실행 유틸리티
+에이전트 내부의 기업 단위 작업(하위 스테이지)을 스레드 풀로 동시 실행
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+from tools.metrics import bind_context
+
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def get_max_workers(state: Dict[str, Any]) -> int:
+    """config의 max_workers 값 반환 (없으면 기본값)"""
+    return int(state.get('config', {}).get('max_workers', DEFAULT_MAX_WORKERS))
+
+
+def parallel_map(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = DEFAULT_MAX_WORKERS) -> List[Any]:
+    """
+    items의 각 원소에 func를 동시에 적용하고 입력 순서대로 결과 반환
+
+    Args:
+        func: 원소 하나를 처리하는 함수 (예외는 func 내부에서 처리 권장)
+        items: 처리할 원소들
+        max_workers: 최대 동시 실행 수 (1 이하이면 순차 실행)
+
+    Returns:
+        입력 순서와 같은 결과 리스트
+    """
+    items = list(items)
+
+    # 동시 실행할 필요가 없으면 기존과 동일하게 순차 실행
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        # 작업 스레드에서도 현재 노드 지표(metrics)에 집계되도록 context 전달
+        return list(pool.map(bind_context(func), items))
+
+
+__all__ = ['DEFAULT_MAX_WORKERS', 'get_max_workers', 'parallel_map']
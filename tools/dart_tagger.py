@@ -323,11 +323,11 @@ class DARTTagger:
                 if disclosures:
                     print(f"   [OK] {company_name}: {len(disclosures)}개 공시 수집")
                     
-                    # 각 공시에 기업명 추가 및 태깅
-                    for disclosure in disclosures:
-                        disclosure['company_name'] = company_name
-                        disclosure['corp_code'] = corp_code
-                        disclosure = self.tag_disclosure(disclosure)
+                    # 각 공시에 기업명 추가 및 태깅 (캐시된 응답은 읽기 전용이므로 사본에 추가)
+                    disclosures = [
+                        self.tag_disclosure({**disclosure, 'company_name': company_name, 'corp_code': corp_code})
+                        for disclosure in disclosures
+                    ]
                     
                     all_disclosures.extend(disclosures)
                 else:
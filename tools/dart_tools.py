@@ -4,6 +4,7 @@ DART API  ( )
 """
 
 import os
+import threading
 import requests
 import json
 import zipfile
@@ -11,6 +12,17 @@ import io
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import xml.etree.ElementTree as ET
+from tools.cache_manager import MemoryCache, get_cache_manager
+from tools.metrics import instrument_session
+from tools.http_transport import configure_session
+from tools.singleflight import coalesce
+from tools.circuit_breaker import get_breaker
+
+
+# 재시도해도 실행 중에는 회복되지 않는 DART 오류 상태 코드 → 'dart' 서킷 브레이커 즉시 open
+# (DART는 오류도 HTTP 200으로 응답하므로 세션에서 감지할 수 없음)
+# 010/011/012/901: 인증키 오류, 020: 요청 한도 초과, 800: 시스템 점검 (013 데이터 없음은 정상)
+DART_TRIP_STATUS = ('010', '011', '012', '901', '020', '800')
 
 
 class DARTTool:
@@ -18,21 +30,65 @@ class DARTTool:
     DART API       
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, sec_tool=None, yahoo_tool=None, alpha_vantage_tool=None):
         self.api_key = api_key
         self.base_url = "https://opendart.fss.or.kr/api"
         self.session = requests.Session()
-        self.corp_code_cache = {}  #  → corp_code 
-        
-        #     
-        print("[DART     ...]")
-        self._load_corp_codes()
-    
+        instrument_session(self.session, 'dart')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'dart')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
+        self._corp_codes = {}  #  → corp_code
+        self._corp_codes_loaded = False
+        self._corp_codes_lock = threading.Lock()
+        self._prefetch_thread = None
+        self.response_cache = MemoryCache('dart')  # 공시/재무 응답 캐시 (배치 실행 시 보고서 간 공유, 디스크 캐시로 실행 간 재사용)
+
+        # 해외 기업 Fallback 도구 (주입되지 않으면 첫 사용 시 생성 후 재사용)
+        self.sec_tool = sec_tool
+        self.yahoo_tool = yahoo_tool
+        self.alpha_vantage_tool = alpha_vantage_tool
+
+        # 기업 코드(corpCode.xml)는 첫 사용 시 로드 (prefetch_corp_codes()로 미리 백그라운드 로드 가능)
+
+    @property
+    def corp_code_cache(self) -> Dict[str, Dict[str, Any]]:
+        """기업명 → corp_code (첫 접근 시 로드, 백그라운드 로드 중이면 완료까지 대기)"""
+        self._ensure_corp_codes()
+        return self._corp_codes
+
+    def _ensure_corp_codes(self):
+        """기업 코드 로드 (한 번만, 동시 접근 시 먼저 들어온 스레드가 로드)"""
+        if self._corp_codes_loaded:
+            return
+        with self._corp_codes_lock:
+            if not self._corp_codes_loaded:
+                print("[DART     ...]")
+                self._load_corp_codes()
+                self._corp_codes_loaded = True
+
+    def prefetch_corp_codes(self):
+        """
+        기업 코드를 백그라운드 스레드에서 로드
+        도구 생성 직후 호출하면 다운로드/파싱이 첫 노드(뉴스 수집)와 겹쳐 진행됨
+        """
+        if self._corp_codes_loaded or self._prefetch_thread is not None:
+            return
+        self._prefetch_thread = threading.Thread(
+            target=self._ensure_corp_codes, name='dart-corp-codes', daemon=True
+        )
+        self._prefetch_thread.start()
+
     def _load_corp_codes(self):
         """
               (ZIP   )
         """
         try:
+            # 기업 코드 목록은 거의 바뀌지 않으므로 디스크 캐시 사용 (TTL 정책 dart_corpcodes)
+            cached = get_cache_manager().get_cached_result('dart_corpcodes', 0)
+            if cached:
+                self._corp_codes.update(cached)
+                print(f"[OK] DART 기업 코드 {len(self._corp_codes)}개 (캐시)")
+                return
+            
             url = f"{self.base_url}/corpCode.xml"
             params = {'crtfc_key': self.api_key}
             
@@ -52,7 +108,7 @@ class DARTTool:
                 stock_code = corp.find('stock_code').text if corp.find('stock_code') is not None else None
                 
                 #     
-                self.corp_code_cache[corp_name] = {
+                self._corp_codes[corp_name] = {
                     'corp_code': corp_code,
                     'stock_code': stock_code,
                     'corp_name': corp_name
@@ -61,14 +117,16 @@ class DARTTool:
                 #   (: "" → "")
                 if '' in corp_name:
                     short_name = corp_name.replace('', '').strip()
-                    if short_name not in self.corp_code_cache:
-                        self.corp_code_cache[short_name] = {
+                    if short_name not in self._corp_codes:
+                        self._corp_codes[short_name] = {
                             'corp_code': corp_code,
                             'stock_code': stock_code,
                             'corp_name': corp_name
                         }
             
-            print(f"[OK] DART   {len(self.corp_code_cache)}  ")
+            print(f"[OK] DART   {len(self._corp_codes)}  ")
+            if self._corp_codes:
+                get_cache_manager().set_cached_result('dart_corpcodes', 0, self._corp_codes)
             
         except Exception as e:
             print(f"[FAIL] DART    : {e}")
@@ -156,6 +214,14 @@ class DARTTool:
             print(f"[FAIL]   : {e}")
             return None
     
+    @staticmethod
+    def _record_api_error(status: Optional[str]) -> None:
+        """인증키/한도/점검 오류면 'dart' 서킷 브레이커 open (이후 조회는 바로 Fallback)"""
+        if status in DART_TRIP_STATUS:
+            get_breaker('dart').trip(f"DART status {status}")
+    
+    # 동시에 들어온 같은 공시/재무 조회는 한 번만 호출하고 결과 공유
+    @coalesce(lambda self, corp_code, start_date=None, end_date=None: (corp_code, start_date, end_date))
     def get_disclosure_list(self, corp_code: str, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
         """
           
@@ -174,6 +240,11 @@ class DARTTool:
             if not end_date:
                 end_date = datetime.now().strftime('%Y%m%d')
             
+            cache_key = ('list', corp_code, start_date, end_date)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             url = f"{self.base_url}/list.json"
             params = {
                 'crtfc_key': self.api_key,
@@ -189,9 +260,12 @@ class DARTTool:
             data = response.json()
             
             if data.get('status') == '000':
-                return data.get('list', [])
+                disclosures = data.get('list', [])
+                self.response_cache.set(cache_key, disclosures)
+                return disclosures
             else:
                 error_msg = data.get('message', 'Unknown error')
+                self._record_api_error(data.get('status'))
                 print(f"[FAIL]    : {error_msg}")
                 return []
                 
@@ -199,6 +273,7 @@ class DARTTool:
             print(f"[FAIL]    : {e}")
             return []
     
+    @coalesce(lambda self, corp_code, year, reprt_code="11011": (corp_code, str(year), reprt_code))
     def get_financial_data(self, corp_code: str, year: int, reprt_code: str = "11011") -> Dict[str, Any]:
         """
           
@@ -216,6 +291,13 @@ class DARTTool:
              
         """
         try:
+            # 종료된 회계연도 재무제표는 바뀌지 않으므로 만료 없이 캐시 (TTL 정책 dart_financial_closed)
+            data_type = 'financial_closed' if int(year) < datetime.now().year else 'financial'
+            cache_key = (data_type, corp_code, str(year), reprt_code)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             # fnlttSinglAcntAll.json  (   )
             url = f"{self.base_url}/fnlttSinglAcntAll.json"
             params = {
@@ -232,9 +314,16 @@ class DARTTool:
             data = response.json()
             
             if data.get('status') == '000':
-                return self._parse_financial_data(data.get('list', []))
+                financial_data = self._parse_financial_data(data.get('list', []))
+                # 매출/자산이 모두 0이면 (계정명 불일치/정정 전 공시) 만료 없이 두지 않고 진행 중 회계연도와 같은 유효 기간
+                ttl = None
+                if data_type == 'financial_closed' and not (financial_data.get('revenue') or financial_data.get('total_assets')):
+                    ttl = get_cache_manager().ttl_for('dart_financial')
+                self.response_cache.set(cache_key, financial_data, ttl=ttl)
+                return financial_data
             else:
                 error_msg = data.get('message', 'Unknown error')
+                self._record_api_error(data.get('status'))
                 print(f"[FAIL]   : {error_msg}")
                 return {}
                 
@@ -352,6 +441,7 @@ class DARTTool:
             print(f"[FAIL]    : {e}")
             return {}
     
+    @coalesce(lambda self, company_name: company_name)
     def get_company_financial_analysis(self, company_name: str) -> Dict[str, Any]:
         """  (DART →  →  )"""
         
@@ -471,7 +561,9 @@ class DARTTool:
         try:
             from tools.alpha_vantage_tools import AlphaVantageTool
             
-            alpha_vantage = AlphaVantageTool()
+            if self.alpha_vantage_tool is None:
+                self.alpha_vantage_tool = AlphaVantageTool()
+            alpha_vantage = self.alpha_vantage_tool
             result = alpha_vantage.get_company_financial_data(company_name)
             
             if result['data_available']:
@@ -491,7 +583,9 @@ class DARTTool:
         try:
             from tools.sec_edgar_tools import SECEdgarTool
             
-            sec_edgar = SECEdgarTool()
+            if self.sec_tool is None:
+                self.sec_tool = SECEdgarTool()
+            sec_edgar = self.sec_tool
             result = sec_edgar.get_company_financial_data(company_name)
             
             if result['data_available']:
@@ -511,7 +605,9 @@ class DARTTool:
         try:
             from tools.yahoo_finance_tools import YahooFinanceTool
             
-            yahoo_finance = YahooFinanceTool()
+            if self.yahoo_tool is None:
+                self.yahoo_tool = YahooFinanceTool()
+            yahoo_finance = self.yahoo_tool
             result = yahoo_finance.get_company_financial_data(company_name)
             
             if result['data_available']:
@@ -542,7 +638,9 @@ class DARTTool:
             # 1. Yahoo Finance   
             if stock_code:
                 from tools.yahoo_finance_tools import YahooFinanceTool
-                yahoo_tool = YahooFinanceTool()
+                if self.yahoo_tool is None:
+                    self.yahoo_tool = YahooFinanceTool()
+                yahoo_tool = self.yahoo_tool
 
                 #  : .KS  .KQ 
                 ticker = f"{stock_code}.KS"  # KOSPI
@@ -0,0 +1,159 @@
+"""
+뉴스 기사 중복 제거 (URL 정규화 + SimHash 본문 지문)
+여러 시드 쿼리가 같은 기사나 통신사 배포 기사(사본)를 반복해서 가져오므로
+키워드 추출/태깅/LLM 프롬프트 전에 한 건만 남김
+
+- URL: 스킴/호스트 소문자, www./m./amp. 접두어, 추적용 쿼리(utm_* 등), 프래그먼트, 끝 슬래시 제거
+- 본문: 제목+본문 단어 3-gram의 64비트 SimHash, 해밍 거리 SIMHASH_THRESHOLD 이하면 같은 기사
+  (64비트를 8비트 8구간으로 나눠 색인, 거리 7 이하인 지문은 최소 한 구간이 같으므로 전체 비교 불필요)
+- 먼저 추가된 기사를 남김 (시드 쿼리 순서 = 우선순위)
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from tools.metrics import record
+
+
+SIMHASH_BITS = 64
+SIMHASH_THRESHOLD = 6  # 짧은 스니펫은 꼬리 문구("- Reuters" 등)만 달라도 4~5비트 차이
+SHINGLE_SIZE = 3
+MIN_FINGERPRINT_TOKENS = 8  # 이보다 짧은 텍스트는 지문 비교 생략 (제목만 있는 기사 오탐 방지)
+
+_BANDS = 8
+_BAND_BITS = SIMHASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+TRACKING_PARAMS = {'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+                   'ref', 'ref_src', 'cmpid', 'ocid', 'ncid', 'sr_share', 'taid', 'outputtype'}
+_HOST_PREFIXES = ('www.', 'm.', 'amp.', 'mobile.')
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def canonicalize_url(url: str) -> str:
+    """같은 기사를 가리키는 URL 변형을 하나로 정규화 (비교용, 요청에는 원래 URL 사용)"""
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or '').lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    path = re.sub(r'/+', '/', parts.path or '/')
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path[:path.rindex('/amp')]
+    path = path.rstrip('/') or '/'
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=False)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    # http/https는 같은 기사로 취급
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or '').lower())
+
+
+def _hash64(token: str) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 해시 (캐시/체크포인트 간 지문 일치)
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(text: str) -> Optional[int]:
+    """텍스트의 64비트 SimHash (단어 3-gram), 토큰이 너무 적으면 None"""
+    tokens = _tokens(text)
+    if len(tokens) < MIN_FINGERPRINT_TOKENS:
+        return None
+
+    weights = [0] * SIMHASH_BITS
+    for i in range(len(tokens) - SHINGLE_SIZE + 1):
+        h = _hash64(' '.join(tokens[i:i + SHINGLE_SIZE]))
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def article_text(article: Dict[str, Any]) -> str:
+    return f"{article.get('title', '')} {article.get('content', '')}"
+
+
+class ArticleDeduplicator:
+    """
+    기사를 순서대로 추가하며 중복 여부 판정
+
+    Args:
+        threshold: 같은 기사로 볼 최대 해밍 거리 (0~7, 구간 색인이 보장하는 범위)
+    """
+
+    def __init__(self, threshold: int = SIMHASH_THRESHOLD):
+        self.threshold = max(0, min(threshold, _BANDS - 1))
+        self._urls: Set[str] = set()
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(_BANDS)]
+        self.url_duplicates = 0
+        self.content_duplicates = 0
+
+    def _find_similar(self, fingerprint: int) -> Optional[int]:
+        for band in range(_BANDS):
+            key = fingerprint >> (band * _BAND_BITS) & _BAND_MASK
+            for candidate in self._bands[band].get(key, ()):
+                if hamming_distance(fingerprint, candidate) <= self.threshold:
+                    return candidate
+        return None
+
+    def add(self, article: Dict[str, Any]) -> bool:
+        """새 기사면 등록 후 True, 이미 본 기사(URL 또는 본문 지문)면 False"""
+        url = canonicalize_url(article.get('url', ''))
+        if url and url in self._urls:
+            self.url_duplicates += 1
+            return False
+
+        fingerprint = simhash(article_text(article))
+        if fingerprint is not None and self._find_similar(fingerprint) is not None:
+            self.content_duplicates += 1
+            return False
+
+        if url:
+            self._urls.add(url)
+        if fingerprint is not None:
+            for band in range(_BANDS):
+                key = fingerprint >> (band * _BAND_BITS) & _BAND_MASK
+                self._bands[band].setdefault(key, []).append(fingerprint)
+        return True
+
+    @property
+    def duplicates(self) -> int:
+        return self.url_duplicates + self.content_duplicates
+
+
+def deduplicate_articles(articles: Iterable[Dict[str, Any]],
+                         threshold: int = SIMHASH_THRESHOLD) -> List[Dict[str, Any]]:
+    """중복 기사를 제거한 리스트 (순서 유지, 먼저 나온 기사를 남김)"""
+    deduplicator = ArticleDeduplicator(threshold)
+    unique = [article for article in articles if deduplicator.add(article)]
+    if deduplicator.duplicates:
+        record('duplicate_articles', deduplicator.duplicates)
+        print(f"    [DEDUP] 중복 기사 {deduplicator.duplicates}개 제거 "
+              f"(URL {deduplicator.url_duplicates}개, 유사 본문 {deduplicator.content_duplicates}개)")
+    return unique
+
+
+__all__ = ['ArticleDeduplicator', 'deduplicate_articles', 'canonicalize_url', 'simhash', 'hamming_distance']
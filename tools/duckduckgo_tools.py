@@ -5,10 +5,15 @@ Tavily API 대체용
 
 import os
 import requests
-import time
 from typing import List, Dict, Any
-from tools.cache_manager import CacheManager
+from tools.cache_manager import get_cache_manager
+from tools.fetch_pipeline import adownload, download
 import urllib.parse
+from tools.metrics import instrument_session
+from tools.http_transport import AsyncClientPool, configure_session
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
 
 class DuckDuckGoSearchTool:
@@ -19,11 +24,15 @@ class DuckDuckGoSearchTool:
     
     def __init__(self):
         self.base_url = "https://api.duckduckgo.com"
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         self.session = requests.Session()
+        instrument_session(self.session, 'duckduckgo')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'duckduckgo')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': USER_AGENT
         })
+        # asearch/afetch용 (httpx, 이벤트 루프별 연결 풀)
+        self.async_clients = AsyncClientPool('duckduckgo', headers={'User-Agent': USER_AGENT}, timeout=10)
     
     def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -36,8 +45,9 @@ class DuckDuckGoSearchTool:
         Returns:
             검색 결과 리스트
         """
-        # 1. 캐시에서 결과 조회
-        cached_result = self.cache_manager.get_cached_result(query, num_results)
+        # 1. 캐시에서 결과 조회 (duckduckgo_ 네임스페이스)
+        cache_key = f"duckduckgo_{query}"
+        cached_result = self.cache_manager.get_cached_result(cache_key, num_results)
         if cached_result is not None:
             return cached_result
         
@@ -63,10 +73,9 @@ class DuckDuckGoSearchTool:
                 print(f"    DuckDuckGo '{query}' 검색 완료: {len(results)}개 결과")
                 
                 # 2. 결과를 캐시에 저장
-                self.cache_manager.set_cached_result(query, num_results, results)
+                self.cache_manager.set_cached_result(cache_key, num_results, results)
                 
-                # API 요청 간격 추가 (1초 대기)
-                time.sleep(1)
+                # 요청 간격은 세션의 호스트별 속도 제한기가 조절 (초당 1회)
                 return results
                 
             else:
@@ -77,7 +86,38 @@ class DuckDuckGoSearchTool:
             print(f"[FAIL] DuckDuckGo 검색 오류: {e}")
             return self._fallback_search_results(query)
     
-    def _parse_duckduckgo_results(self, data: Dict[str, Any], query: str, num_results: int) -> List[Dict[str, Any]]:
+    async def asearch(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+        """search()의 비동기 버전 (Google 보완 검색도 비동기)"""
+        cache_key = f"duckduckgo_{query}"
+        cached_result = self.cache_manager.get_cached_result(cache_key, num_results)
+        if cached_result is not None:
+            return cached_result
+        
+        try:
+            response = await self.async_clients.get().get(
+                f"{self.base_url}/",
+                params={'q': query, 'format': 'json', 'no_html': '1', 'skip_disambig': '1'}
+            )
+            
+            if response.status_code != 200:
+                print(f"[FAIL] DuckDuckGo API 오류: {response.status_code} - {response.text}")
+                return self._fallback_search_results(query)
+            
+            results = self._parse_duckduckgo_results(response.json(), query, num_results, supplement=False)
+            if len(results) < num_results:
+                results.extend(await self._agoogle_search_fallback(query, num_results - len(results)))
+            results = results[:num_results]
+            
+            print(f"    DuckDuckGo '{query}' 검색 완료: {len(results)}개 결과")
+            self.cache_manager.set_cached_result(cache_key, num_results, results)
+            return results
+            
+        except Exception as e:
+            print(f"[FAIL] DuckDuckGo 검색 오류: {e}")
+            return self._fallback_search_results(query)
+    
+    def _parse_duckduckgo_results(self, data: Dict[str, Any], query: str, num_results: int,
+                                  supplement: bool = True) -> List[Dict[str, Any]]:
         """
         DuckDuckGo API 응답을 파싱하여 표준 형식으로 변환
         """
@@ -113,8 +153,8 @@ class DuckDuckGoSearchTool:
                 'score': 0.7
             })
         
-        # 결과가 부족한 경우 Google Custom Search로 보완
-        if len(results) < num_results:
+        # 결과가 부족한 경우 Google Custom Search로 보완 (비동기 검색은 호출부에서 보완)
+        if supplement and len(results) < num_results:
             google_results = self._google_search_fallback(query, num_results - len(results))
             results.extend(google_results)
         
@@ -126,41 +166,69 @@ class DuckDuckGoSearchTool:
         """
         try:
             # Google Custom Search API 키가 있는 경우에만 사용
-            api_key = os.getenv('GOOGLE_API_KEY')
-            search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
-            
-            if not api_key or not search_engine_id:
+            request = self._google_search_request(query, num_results)
+            if request is None:
                 return []
             
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                'key': api_key,
-                'cx': search_engine_id,
-                'q': query,
-                'num': min(num_results, 10)
-            }
-            
+            url, params = request
             response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                results = []
-                
-                for item in data.get('items', []):
-                    results.append({
-                        'title': item.get('title', ''),
-                        'url': item.get('link', ''),
-                        'content': item.get('snippet', ''),
-                        'score': 0.6
-                    })
+                return self._parse_google_results(response.json())
                 
-                return results
+        except Exception as e:
+            print(f"[WARNING] Google 보완 검색 실패: {e}")
+        
+        return []
+    
+    async def _agoogle_search_fallback(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        """_google_search_fallback()의 비동기 버전"""
+        try:
+            request = self._google_search_request(query, num_results)
+            if request is None:
+                return []
+            
+            url, params = request
+            response = await self.async_clients.get().get(url, params=params)
+            
+            if response.status_code == 200:
+                return self._parse_google_results(response.json())
                 
         except Exception as e:
             print(f"[WARNING] Google 보완 검색 실패: {e}")
         
         return []
     
+    def _google_search_request(self, query: str, num_results: int):
+        """Google Custom Search 요청 (url, params), API 키가 없으면 None"""
+        api_key = os.getenv('GOOGLE_API_KEY')
+        search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
+        
+        if not api_key or not search_engine_id:
+            return None
+        
+        url = "https://www.googleapis.com/customsearch/v1"
+        params = {
+            'key': api_key,
+            'cx': search_engine_id,
+            'q': query,
+            'num': min(num_results, 10)
+        }
+        return url, params
+    
+    def _parse_google_results(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        results = []
+        
+        for item in data.get('items', []):
+            results.append({
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'content': item.get('snippet', ''),
+                'score': 0.6
+            })
+        
+        return results
+    
     def _fallback_search_results(self, query: str) -> List[Dict[str, Any]]:
         """API 실패 시 빈 결과 반환"""
         print(f"[WARNING] '{query}' 검색 결과를 가져올 수 없습니다.")
@@ -177,12 +245,23 @@ class DuckDuckGoSearchTool:
             콘텐츠 (HTML 텍스트)
         """
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
+            # 스트리밍으로 MAX_FETCH_BYTES까지만 읽음 (큰 페이지/파일 방지)
+            return download(self.session, url)
         except Exception as e:
             print(f"[FAIL] URL 가져오기 실패 {url}: {e}")
             return ""
+    
+    async def afetch(self, url: str) -> str:
+        """fetch()의 비동기 버전"""
+        try:
+            return await adownload(self.async_clients.get(), url)
+        except Exception as e:
+            print(f"[FAIL] URL 가져오기 실패 {url}: {e}")
+            return ""
+    
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 연결 정리"""
+        await self.async_clients.aclose()
 
 
 class WebSearchTool:
@@ -0,0 +1,241 @@
+"""
+기사 본문 수집 파이프라인
+검색 결과 URL의 페이지를 동시에 내려받아 본문 텍스트만 추출하고 캐시
+
+- 동시 실행: 전체 max_workers, 같은 호스트는 per_host개까지 (호스트별 속도 제한은 세션이 적용)
+- 크기 제한: 응답을 스트리밍으로 읽다가 max_bytes에서 중단 (큰 페이지/파일도 메모리 사용량 고정)
+- 본문 추출: BeautifulSoup으로 script/nav/footer 등 boilerplate 제거 후 article/main의 문단만 사용
+- 캐시: 추출된 텍스트를 URL별로 캐시 (CacheManager, 24시간)
+- HTML/텍스트가 아닌 응답(PDF, 이미지 등)과 실패한 URL은 빈 문자열
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from tools.metrics import bind_context, record
+
+
+MAX_FETCH_BYTES = 2 * 1024 * 1024  # 페이지당 최대 다운로드 크기
+FETCH_TIMEOUT = 10
+MAX_FETCH_WORKERS = 8
+PER_HOST_CONCURRENCY = 2
+MAX_TEXT_CHARS = 20000  # 캐시/반환하는 본문 최대 길이
+MIN_PARAGRAPH_CHARS = 40  # 이보다 짧은 문단은 메뉴/버튼 문구로 보고 제외
+CHUNK_SIZE = 64 * 1024
+
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'template', 'iframe', 'svg', 'canvas',
+                    'nav', 'header', 'footer', 'aside', 'form', 'button', 'select']
+# class/id 토큰 전체가 일치할 때만 boilerplate (article-header, post-share-body처럼 본문 요소의 합성 이름은 유지)
+BOILERPLATE_TOKENS = frozenset([
+    'nav', 'navbar', 'navigation', 'menu', 'footer', 'header', 'sidebar', 'cookie', 'cookies', 'consent',
+    'subscribe', 'newsletter', 'promo', 'advert', 'advertisement', 'ad', 'ads', 'share', 'sharing', 'social',
+    'related', 'recommend', 'recommended', 'comment', 'comments', 'breadcrumb', 'breadcrumbs', 'popup', 'modal',
+    'site-header', 'site-footer', 'site-nav', 'main-nav', 'cookie-banner', 'cookie-consent', 'share-buttons',
+    'social-share', 'related-articles', 'related-posts', 'ad-slot', 'ad-container',
+])
+TEXT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+
+def read_capped(response, max_bytes: int = MAX_FETCH_BYTES) -> bytes:
+    """stream=True 응답 본문을 max_bytes까지만 읽고 연결 반환"""
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if not chunk:
+                continue
+            chunks.append(chunk[:max_bytes - size])
+            size += len(chunks[-1])
+            if size >= max_bytes:
+                print(f"    [FETCH] {max_bytes:,} bytes 초과 - 앞부분만 사용: {response.url}")
+                break
+    finally:
+        response.close()
+    record('bytes_downloaded', size)
+    return b''.join(chunks)
+
+
+def _is_text_response(content_type: str) -> bool:
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    return not content_type or content_type in TEXT_CONTENT_TYPES
+
+
+def _charset(content_type: str) -> Optional[str]:
+    match = re.search(r'charset=([\w-]+)', content_type or '', re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def download(session, url: str, max_bytes: int = MAX_FETCH_BYTES, timeout: float = FETCH_TIMEOUT) -> str:
+    """
+    URL을 max_bytes까지 내려받아 문자열로 반환 (HTML/텍스트가 아니면 빈 문자열)
+    실패하면 예외 (requests.RequestException)
+    """
+    response = session.get(url, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '')
+        if not _is_text_response(content_type):
+            return ''
+    except Exception:
+        response.close()
+        raise
+    body = read_capped(response, max_bytes)
+    return body.decode(_charset(content_type) or response.encoding or 'utf-8', errors='replace')
+
+
+async def adownload(client, url: str, max_bytes: int = MAX_FETCH_BYTES, timeout: float = FETCH_TIMEOUT) -> str:
+    """download()의 비동기 버전 (httpx.AsyncClient)"""
+    # capped_download: 응답 훅이 본문 전체를 읽지 않도록 표시 (metrics.instrument_async_client)
+    async with client.stream('GET', url, timeout=timeout, extensions={'capped_download': True}) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '')
+        if not _is_text_response(content_type):
+            return ''
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            chunks.append(chunk[:max_bytes - size])
+            size += len(chunks[-1])
+            if size >= max_bytes:
+                print(f"    [FETCH] {max_bytes:,} bytes 초과 - 앞부분만 사용: {url}")
+                break
+    record('bytes_downloaded', size)
+    return b''.join(chunks).decode(_charset(content_type) or response.encoding or 'utf-8', errors='replace')
+
+
+def extract_text(html: str, max_chars: int = MAX_TEXT_CHARS) -> str:
+    """HTML에서 boilerplate를 제거한 본문 텍스트 (문단 단위 줄바꿈)"""
+    if not html:
+        return ''
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    if soup.find() is None:
+        # 태그가 없는 일반 텍스트
+        return re.sub(r'\s+', ' ', html).strip()[:max_chars]
+
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(True):
+        if tag.decomposed or tag.attrs is None:
+            continue
+        tokens = ' '.join([tag.get('id') or ''] + list(tag.get('class') or [])).lower().split()
+        if any(token in BOILERPLATE_TOKENS for token in tokens) and tag.name not in ('html', 'body', 'article', 'main'):
+            tag.decompose()
+
+    root = soup.find('article') or soup.find('main') or soup.body or soup
+    paragraphs = []
+    for element in root.find_all(['h1', 'h2', 'h3', 'p', 'li', 'blockquote', 'pre']):
+        text = re.sub(r'\s+', ' ', element.get_text(' ', strip=True))
+        if len(text) >= MIN_PARAGRAPH_CHARS or (element.name in ('h1', 'h2') and text):
+            paragraphs.append(text)
+
+    if paragraphs:
+        text = '\n'.join(dict.fromkeys(paragraphs))  # 중첩 요소로 같은 문단이 반복되면 한 번만
+    else:
+        text = re.sub(r'\s+', ' ', root.get_text(' ', strip=True))
+    return text[:max_chars]
+
+
+class FetchPipeline:
+    """
+    URL 본문 동시 수집 + 추출 + 캐시
+
+    Args:
+        session: requests.Session (없으면 생성, 지표/기록·재생/속도 제한 연결)
+        max_workers: 전체 동시 다운로드 수
+        per_host: 호스트별 동시 다운로드 수
+        max_bytes: 페이지당 최대 다운로드 크기
+        cache_manager: 추출 텍스트 캐시 (없으면 공유 CacheManager)
+    """
+
+    def __init__(self, session=None, max_workers: int = MAX_FETCH_WORKERS, per_host: int = PER_HOST_CONCURRENCY,
+                 max_bytes: int = MAX_FETCH_BYTES, timeout: float = FETCH_TIMEOUT, cache_manager=None):
+        if session is None:
+            import requests
+            from tools.http_transport import configure_session
+            from tools.metrics import instrument_session
+
+            session = requests.Session()
+            session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; EVMarketReport/1.0)'})
+            instrument_session(session, 'web_fetch')  # 노드별 호출 수 기록 (다운로드 바이트는 read_capped가 기록)
+            configure_session(session, 'web_fetch')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
+        if cache_manager is None:
+            from tools.cache_manager import get_cache_manager
+            cache_manager = get_cache_manager()
+
+        self.session = session
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache_manager = cache_manager
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = (urlsplit(url).hostname or '').lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def fetch_text(self, url: str) -> str:
+        """URL 본문 텍스트 (캐시 우선, 실패하면 빈 문자열)"""
+        if not url or not url.startswith(('http://', 'https://')):
+            return ''
+
+        cache_key = f"fetch_{url}"
+        cached = self.cache_manager.get_cached_result(cache_key, MAX_TEXT_CHARS)
+        if cached is not None:
+            return cached
+
+        try:
+            with self._host_slot(url):
+                html = download(self.session, url, self.max_bytes, self.timeout)
+        except Exception as e:
+            print(f"    [FAIL] 본문 가져오기 실패 {url}: {e}")
+            return ''
+
+        text = extract_text(html)
+        if text:
+            self.cache_manager.set_cached_result(cache_key, MAX_TEXT_CHARS, text)
+        return text
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """여러 URL 본문을 동시에 수집 (URL → 텍스트, 중복 URL은 1회)"""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            texts = list(pool.map(bind_context(self.fetch_text), urls))
+        return dict(zip(urls, texts))
+
+    def enrich_articles(self, articles: List[Dict[str, Any]], max_chars: int = 4000) -> int:
+        """
+        기사 content를 본문 텍스트(최대 max_chars)로 교체 (검색 스니펫은 'snippet'에 보관)
+        본문이 스니펫보다 짧거나 가져오지 못한 기사는 그대로 둠
+
+        Returns:
+            본문으로 교체된 기사 수
+        """
+        texts = self.fetch_many(article.get('url', '') for article in articles)
+        enriched = 0
+        for article in articles:
+            text = texts.get(article.get('url', ''), '')[:max_chars]
+            snippet = article.get('content') or ''
+            if len(text) > len(snippet):
+                article['snippet'] = snippet
+                article['content'] = text
+                enriched += 1
+        print(f"    [FETCH] 기사 본문 {enriched}/{len(articles)}개 수집")
+        return enriched
+
+
+__all__ = ['FetchPipeline', 'download', 'adownload', 'read_capped', 'extract_text', 'MAX_FETCH_BYTES']
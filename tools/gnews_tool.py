@@ -5,10 +5,11 @@ GNews API를 사용한 뉴스 검색 도구
 
 import os
 import requests
-import time
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from tools.cache_manager import CacheManager
+from tools.cache_manager import get_cache_manager
+from tools.metrics import instrument_session
+from tools.http_transport import configure_session
 
 # 환경변수 로드
 try:
@@ -26,8 +27,11 @@ class GNewsTool:
     def __init__(self, api_key: str = None):
         # API 키 우선순위: 직접 전달 > 환경변수
         self.api_key = api_key or os.getenv('GNEWS_API_KEY')
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         self.base_url = "https://gnews.io/api/v4"
+        self.session = requests.Session()  # 연결 재사용
+        instrument_session(self.session, 'gnews')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'gnews')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
         
         if not self.api_key:
             print("[WARNING] GNews API 키가 설정되지 않았습니다. 환경변수 GNEWS_API_KEY를 설정하세요.")
@@ -69,7 +73,7 @@ class GNewsTool:
             }
 
             print(f"    [GNews] '{query}' 검색 중 (lang={language}, country=us)...")
-            response = requests.get(f"{self.base_url}/search", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/search", params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -139,7 +143,7 @@ class GNewsTool:
             }
 
             print(f"    [GNews] 헤드라인 '{category}' 조회 중 (lang={language}, country=us)...")
-            response = requests.get(f"{self.base_url}/top-headlines", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/top-headlines", params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -196,7 +200,7 @@ class GNewsTool:
             articles = self.search_news(query, max_results=2, language="en")
             if articles:  # 실제 데이터가 있을 때만 추가
                 all_articles.extend(articles)
-            time.sleep(0.5)  # API 호출 간격
+            # API 호출 간격은 세션의 호스트별 속도 제한기가 조절
 
         if not all_articles:
             print(f"    [WARNING] EV 뉴스를 찾을 수 없습니다. 네트워크 또는 API 문제를 확인하세요.")
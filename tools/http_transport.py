@@ -0,0 +1,391 @@
+"""
+외부 HTTP/LLM 호출 기록/재생 (record/replay)
+requests.Session, OpenAI 클라이언트(httpx), 비동기 검색 클라이언트(httpx.AsyncClient) 아래에 전송 계층을 끼워 넣어
+실제 실행의 응답을 기록하고, 네트워크/API 키 없이 같은 응답을 재생
+
+환경변수
+    HTTP_TRANSPORT_MODE        off(기본) | record | replay
+    HTTP_CASSETTE_DIR          기록 저장 위치 (기본: cassettes)
+    HTTP_REPLAY_LATENCY        재생 지연: recorded(기록된 응답 시간, 기본) | 초 단위 고정값
+    HTTP_REPLAY_LATENCY_SCALE  recorded 지연 배율 (기본 1.0)
+    HTTP2_ENABLED              비동기 클라이언트 HTTP/2 사용 (기본 0, h2 패키지 필요)
+
+재생 시 기록이 없는 요청은 ConnectionError로 처리되어 각 도구의 기존 fallback 경로를 탐
+스트리밍 요청(stream=True, 기사 본문 등)은 기록할 때도 MAX_FETCH_BYTES까지만 읽음
+API 키는 요청 키에서 제외하므로 재생할 때는 같은 키 이름에 임의 값만 있으면 됨
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from tools.circuit_breaker import guard_async_client, guard_session
+from tools.fetch_pipeline import CHUNK_SIZE, MAX_FETCH_BYTES
+from tools.rate_limiter import throttle_async_client, throttle_session
+
+
+MODE_OFF = 'off'
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+
+DEFAULT_CASSETTE_DIR = "cassettes"
+
+# 요청 키에서 제외할 인증 파라미터 (쿼리/JSON 본문)
+REDACTED_PARAMS = ('crtfc_key', 'apikey', 'api_key', 'key', 'token', 'access_token')
+
+# 비동기 클라이언트 연결 풀 (이벤트 루프당 1개)
+ASYNC_MAX_CONNECTIONS = 20
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 10
+ASYNC_KEEPALIVE_EXPIRY = 30.0
+
+# 본문을 디코딩해서 저장하므로 재생 응답에서 제거할 헤더
+_HOP_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length', 'connection')
+
+
+def get_transport_mode() -> str:
+    mode = os.getenv('HTTP_TRANSPORT_MODE', MODE_OFF).strip().lower()
+    return mode if mode in (MODE_RECORD, MODE_REPLAY) else MODE_OFF
+
+
+def _replay_delay(recorded_elapsed: float) -> float:
+    """재생 지연 시간 (결정적: 기록값 × 배율 또는 고정값)"""
+    latency = os.getenv('HTTP_REPLAY_LATENCY', 'recorded').strip().lower()
+    if latency != 'recorded':
+        try:
+            return max(0.0, float(latency))
+        except ValueError:
+            pass
+    scale = float(os.getenv('HTTP_REPLAY_LATENCY_SCALE', '1.0'))
+    return max(0.0, recorded_elapsed * scale)
+
+
+def _canonical_url(url: str) -> str:
+    """쿼리 정렬 + 인증 파라미터 제거"""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in REDACTED_PARAMS
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def _canonical_body(body: Any) -> str:
+    """본문 → 키 문자열 (JSON이면 인증 필드 제거 후 정렬)"""
+    if body is None:
+        return ''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not isinstance(body, (bytes, bytearray)):
+        return repr(body)
+
+    try:
+        data = json.loads(body)
+        if isinstance(data, dict):
+            data = {k: v for k, v in data.items() if k.lower() not in REDACTED_PARAMS}
+        return json.dumps(data, ensure_ascii=False, sort_keys=True)
+    except (ValueError, UnicodeDecodeError):
+        return hashlib.sha256(bytes(body)).hexdigest()
+
+
+def request_key(method: str, url: str, body: Any = None) -> str:
+    key_string = f"{method.upper()} {_canonical_url(url)}\n{_canonical_body(body)}"
+    return hashlib.sha256(key_string.encode('utf-8')).hexdigest()
+
+
+class CassetteStore:
+    """
+    기록 저장소
+    <cassette_dir>/<provider>/<request_key>.json (같은 요청은 마지막 응답 유지)
+    """
+
+    def __init__(self, provider: str, cassette_dir: str = None):
+        self.provider = provider
+        self.cassette_dir = cassette_dir or os.getenv('HTTP_CASSETTE_DIR', DEFAULT_CASSETTE_DIR)
+        self.provider_dir = os.path.join(self.cassette_dir, provider)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.provider_dir, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, key: str, entry: Dict[str, Any]) -> None:
+        try:
+            os.makedirs(self.provider_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # 기록 실패로 실제 실행을 중단하지 않음
+            print(f"    [WARNING] 응답 기록 실패 ({self.provider}): {e}")
+
+    @staticmethod
+    def make_entry(method: str, url: str, status: int, headers: Dict[str, str],
+                   content: bytes, elapsed: float) -> Dict[str, Any]:
+        return {
+            'method': method.upper(),
+            'url': _canonical_url(url),
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS},
+            'body': base64.b64encode(content or b'').decode('ascii'),
+            'elapsed': elapsed
+        }
+
+    @staticmethod
+    def decode_entry(entry: Dict[str, Any]) -> Tuple[int, Dict[str, str], bytes]:
+        return entry['status'], entry.get('headers', {}), base64.b64decode(entry.get('body', ''))
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """requests용 기록/재생 어댑터"""
+
+    def __init__(self, provider: str, mode: str, cassette_dir: str = None, **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.store = CassetteStore(provider, cassette_dir)
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+
+        if self.mode == MODE_REPLAY:
+            entry = self.store.load(key)
+            if entry is None:
+                raise requests.ConnectionError(
+                    f"[replay] 기록된 응답 없음: {request.method} {_canonical_url(request.url)}",
+                    request=request
+                )
+            time.sleep(_replay_delay(entry.get('elapsed', 0.0)))
+            return self._build_response(request, entry)
+
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        if kwargs.get('stream'):
+            content = self._read_capped(response)
+        else:
+            content = response.content  # 기록을 위해 본문 읽기 (디코딩된 본문)
+        self.store.save(key, CassetteStore.make_entry(
+            request.method, request.url, response.status_code,
+            dict(response.headers), content, time.perf_counter() - start
+        ))
+        return response
+
+    @staticmethod
+    def _read_capped(response: requests.Response, max_bytes: int = MAX_FETCH_BYTES) -> bytes:
+        """
+        스트리밍 응답을 max_bytes까지만 읽고 연결 반환, 읽은 본문을 응답에 채움
+        (호출 측의 iter_content/content는 이 본문을 그대로 읽음 → 재생과 같은 본문)
+        """
+        chunks = []
+        size = 0
+        try:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                chunks.append(chunk[:max_bytes - size])
+                size += len(chunks[-1])
+                if size >= max_bytes:
+                    break
+        finally:
+            response.close()
+        content = b''.join(chunks)
+        response._content = content
+        response._content_consumed = True
+        return content
+
+    def _build_response(self, request, entry: Dict[str, Any]) -> requests.Response:
+        status, headers, content = CassetteStore.decode_entry(entry)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if status < 400 else 'Replayed Error'
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+def configure_session(session: requests.Session, provider: str) -> requests.Session:
+    """
+    호스트별 속도 제한/서킷 브레이커 연결 + HTTP_TRANSPORT_MODE가 record/replay면 세션에 기록/재생 어댑터 장착
+    (replay의 기록 없는 요청은 제공자 장애가 아니므로 replay에서는 서킷 브레이커 미사용)
+    """
+    throttle_session(session)
+    mode = get_transport_mode()
+    if mode != MODE_REPLAY:
+        guard_session(session)
+    if mode != MODE_OFF:
+        adapter = RecordReplayAdapter(provider, mode)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
+
+
+def create_llm_http_client(provider: str = 'openai'):
+    """
+    OpenAI 클라이언트용 httpx.Client (기록/재생 모드가 아니면 None → 기본 클라이언트 사용)
+    """
+    mode = get_transport_mode()
+    if mode == MODE_OFF:
+        return None
+
+    import httpx
+
+    store = CassetteStore(provider)
+
+    class RecordReplayTransport(httpx.HTTPTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            body = request.read()
+            key = request_key(request.method, str(request.url), body)
+
+            if mode == MODE_REPLAY:
+                entry = store.load(key)
+                if entry is None:
+                    raise httpx.ConnectError(
+                        f"[replay] 기록된 응답 없음: {request.method} {request.url}", request=request
+                    )
+                time.sleep(_replay_delay(entry.get('elapsed', 0.0)))
+                status, headers, content = CassetteStore.decode_entry(entry)
+                return httpx.Response(status, headers=headers, content=content, request=request)
+
+            start = time.perf_counter()
+            response = super().handle_request(request)
+            content = response.read()
+            store.save(key, CassetteStore.make_entry(
+                request.method, str(request.url), response.status_code,
+                dict(response.headers), content, time.perf_counter() - start
+            ))
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+            return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    return httpx.Client(transport=RecordReplayTransport())
+
+
+def _http2_enabled(http2: Optional[bool]) -> bool:
+    """HTTP/2 사용 여부 (None이면 HTTP2_ENABLED 환경변수, h2 패키지가 없으면 HTTP/1.1)"""
+    if http2 is None:
+        http2 = os.getenv('HTTP2_ENABLED', '0').strip().lower() in ('1', 'true', 'yes')
+    if not http2:
+        return False
+    try:
+        import h2  # noqa: F401  (httpx[http2])
+        return True
+    except ImportError:
+        print("[WARNING] HTTP/2를 사용하려면 h2 패키지가 필요합니다 (pip install httpx[http2]) - HTTP/1.1 사용")
+        return False
+
+
+def create_async_http_client(provider: str, headers: Optional[Dict[str, str]] = None,
+                             timeout: float = 30.0, http2: Optional[bool] = None):
+    """
+    비동기 도구용 httpx.AsyncClient (keep-alive 연결 풀, 선택적 HTTP/2)
+    기록/재생 모드면 requests 세션과 같은 카세트(<cassette_dir>/<provider>)를 쓰는 전송 계층 장착
+    """
+    import httpx
+
+    http2 = _http2_enabled(http2)
+    limits = httpx.Limits(
+        max_connections=ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=ASYNC_KEEPALIVE_EXPIRY
+    )
+
+    mode = get_transport_mode()
+    if mode == MODE_OFF:
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+    else:
+        store = CassetteStore(provider)
+
+        class AsyncRecordReplayTransport(httpx.AsyncHTTPTransport):
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                body = await request.aread()
+                key = request_key(request.method, str(request.url), body)
+
+                if mode == MODE_REPLAY:
+                    entry = store.load(key)
+                    if entry is None:
+                        raise httpx.ConnectError(
+                            f"[replay] 기록된 응답 없음: {request.method} {_canonical_url(str(request.url))}",
+                            request=request
+                        )
+                    await asyncio.sleep(_replay_delay(entry.get('elapsed', 0.0)))
+                    status, entry_headers, content = CassetteStore.decode_entry(entry)
+                    return httpx.Response(status, headers=entry_headers, content=content, request=request)
+
+                start = time.perf_counter()
+                response = await super().handle_async_request(request)
+                content = await response.aread()
+                store.save(key, CassetteStore.make_entry(
+                    request.method, str(request.url), response.status_code,
+                    dict(response.headers), content, time.perf_counter() - start
+                ))
+                response_headers = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+                return httpx.Response(response.status_code, headers=response_headers, content=content,
+                                      request=request)
+
+        transport = AsyncRecordReplayTransport(http2=http2, limits=limits)
+
+    return httpx.AsyncClient(transport=transport, headers=headers, timeout=timeout, follow_redirects=True)
+
+
+class AsyncClientPool:
+    """
+    이벤트 루프별 httpx.AsyncClient
+    httpx 연결 풀은 생성된 이벤트 루프에 묶이므로 루프마다 클라이언트 1개를 만들고
+    같은 루프 안의 요청은 keep-alive 연결을 재사용 (루프가 사라지면 클라이언트도 해제)
+    """
+
+    def __init__(self, provider: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: float = 30.0, http2: Optional[bool] = None):
+        self.provider = provider
+        self.headers = headers
+        self.timeout = timeout
+        self.http2 = http2
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self):
+        """현재 이벤트 루프의 클라이언트 (코루틴 안에서 호출)"""
+        from tools.metrics import instrument_async_client
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = create_async_http_client(self.provider, headers=self.headers,
+                                                  timeout=self.timeout, http2=self.http2)
+                instrument_async_client(client, self.provider)  # 노드별 호출 수/다운로드 바이트 기록
+                throttle_async_client(client)  # 호스트별 속도 제한 (requests 세션과 같은 버킷)
+                if get_transport_mode() != MODE_REPLAY:
+                    guard_async_client(client)  # 제공자별 서킷 브레이커 (requests 세션과 공유)
+                self._clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 클라이언트 연결 정리"""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+__all__ = ['configure_session', 'create_llm_http_client', 'create_async_http_client', 'AsyncClientPool',
+           'get_transport_mode', 'RecordReplayAdapter', 'CassetteStore', 'request_key',
+           'MODE_OFF', 'MODE_RECORD', 'MODE_REPLAY']
@@ -2,9 +2,18 @@
 OpenAI LLM
 """
 
-import openai
+import threading
 import time
 from typing import Optional
+from tools.metrics import record
+from tools.budget import LLM_TOKENS, BudgetExceededError, adjust, spend
+from tools.http_transport import create_llm_http_client
+from tools.rate_limiter import get_host_limiter, parse_retry_after
+from tools.circuit_breaker import get_breaker, is_failure_status
+
+
+# 예산 차감용 출력 토큰 예상치 (max_tokens가 더 작으면 max_tokens, 응답 후 실제 사용량으로 정산)
+EXPECTED_OUTPUT_TOKENS = 1000
 
 
 class OpenAILLM:
@@ -13,18 +22,41 @@ class OpenAILLM:
     """
     
     def __init__(self, api_key: str, model: str = "gpt-4o"):
+        self.api_key = api_key
+        self.model = model
+        # openai 패키지 import와 클라이언트 생성은 첫 호출 시 (--help, 캐시만 쓰는 실행의 시작 시간 단축)
+        self._client = None
+        self._client_ready = False
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """OpenAI 클라이언트 (첫 접근 시 생성, 초기화 실패 시 None)"""
+        if not self._client_ready:
+            with self._client_lock:
+                if not self._client_ready:
+                    self._client = self._create_client()
+                    self._client_ready = True
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+        self._client_ready = True
+
+    def _create_client(self):
         try:
-            self.client = openai.OpenAI(
-                api_key=api_key,
+            import openai
+            return openai.OpenAI(
+                api_key=self.api_key,
                 timeout=30.0,  # 30초 타임아웃
-                max_retries=2   # 최대 2번 재시도
+                max_retries=2,  # 최대 2번 재시도
+                http_client=create_llm_http_client()  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
             )
-            self.model = model
         except Exception as e:
             print(f"[경고] OpenAI 클라이언트 초기화 실패: {e}")
-            self.client = None
-            self.model = model
-    
+            return None
+
     def call(self, prompt: str,
              system: str = None,
              max_tokens: int = 4000,
@@ -45,60 +77,106 @@ class OpenAILLM:
             print("[ERROR] OpenAI API 키가 설정되지 않았습니다.")
             return self._fallback_response(prompt)
 
-        # 재시도 로직: 최대 3번 시도
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                messages = []
-                if system:
-                    messages.append({"role": "system", "content": system})
-                messages.append({"role": "user", "content": prompt})
-
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-
-                return response.choices[0].message.content
-
-            except openai.RateLimitError as e:
-                wait_time = (attempt + 1) * 5  # 5초, 10초, 15초
-                print(f"[경고] Rate limit 도달, {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_attempts})")
-                if attempt < max_attempts - 1:
-                    time.sleep(wait_time)
-                else:
-                    print(f"[오류] Rate limit 초과: {e}")
-                    return self._fallback_response(prompt)
+        import openai  # 클라이언트 생성 시 이미 로드됨 (예외 타입 참조용)
 
-            except openai.APITimeoutError as e:
-                wait_time = (attempt + 1) * 3  # 3초, 6초, 9초
-                print(f"[경고] API 타임아웃, {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_attempts})")
-                if attempt < max_attempts - 1:
-                    time.sleep(wait_time)
-                else:
-                    print(f"[오류] API 타임아웃: {e}")
-                    return self._fallback_response(prompt)
+        # 반복 실패로 서킷 브레이커가 열려 있으면 예산 차감/요청 없이 대체 응답
+        breaker = get_breaker('openai')
+        if not breaker.allow_request():
+            print("[CIRCUIT] OpenAI API 일시 차단 중 - 대체 응답 사용")
+            return self._fallback_response(prompt)
 
-            except openai.APIConnectionError as e:
-                wait_time = (attempt + 1) * 2  # 2초, 4초, 6초
-                print(f"[경고] 네트워크 연결 오류, {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_attempts})")
-                if attempt < max_attempts - 1:
-                    time.sleep(wait_time)
-                else:
-                    print(f"[오류] 연결 실패: {e}")
-                    return self._fallback_response(prompt)
+        # 토큰 예산: 예상치(프롬프트 글자 수/4 + 출력 예상) 선차감 후 실제 사용량으로 정산
+        reserved = (len(prompt) + len(system or '')) // 4 + min(max_tokens, EXPECTED_OUTPUT_TOKENS)
+        if not spend(LLM_TOKENS, reserved):
+            print(f"[BUDGET] LLM 토큰 예산 소진 - 호출 생략 ({reserved:,} tokens 예상)")
+            raise BudgetExceededError("LLM 토큰 예산 소진")
 
-            except Exception as e:
-                print(f"[오류] {e}")
-                print(f"[오류] OpenAI API 호출 실패 (시도 {attempt + 1}/{max_attempts}): {e}")
-                if attempt < max_attempts - 1:
-                    time.sleep(2)
-                else:
+        # 응답을 받지 못하고 끝나면(대체 응답/예외) 선차감한 예상치를 모두 환급
+        settled = False
+        try:
+            # 재시도 로직: 최대 3번 시도
+            # 요청 속도는 api.openai.com 속도 제한기가 조절 (429를 받으면 감속 후 Retry-After만큼 대기)
+            limiter = get_host_limiter('api.openai.com')
+            max_attempts = 3
+            for attempt in range(max_attempts):
+                if attempt and not breaker.allow_request():
+                    print("[CIRCUIT] OpenAI API 일시 차단 중 - 재시도 중단")
                     return self._fallback_response(prompt)
+                limiter.acquire()
+                try:
+                    messages = []
+                    if system:
+                        messages.append({"role": "system", "content": system})
+                    messages.append({"role": "user", "content": prompt})
+
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+
+                    limiter.succeeded()
+                    breaker.record_success()
+
+                    # 노드별 LLM 호출/토큰 지표
+                    record('llm_calls')
+                    usage = getattr(response, 'usage', None)
+                    if usage is not None:
+                        record('llm_tokens_in', usage.prompt_tokens or 0)
+                        record('llm_tokens_out', usage.completion_tokens or 0)
+                        adjust(LLM_TOKENS, (usage.prompt_tokens or 0) + (usage.completion_tokens or 0) - reserved)
+                    settled = True
+
+                    return response.choices[0].message.content
 
-        return self._fallback_response(prompt)
+                except openai.RateLimitError as e:
+                    response = getattr(e, 'response', None)
+                    retry_after = parse_retry_after(response.headers.get('retry-after')) if response is not None else None
+                    breaker.record_failure(429, retry_after)
+                    print(f"[경고] Rate limit 도달, 감속 후 재시도... (시도 {attempt + 1}/{max_attempts})")
+                    if attempt < max_attempts - 1:
+                        # Retry-After가 없으면 기존 대기 시간(5초, 10초) 사용, 다음 시도의 acquire()가 대기
+                        limiter.throttled(retry_after or (attempt + 1) * 5)
+                    else:
+                        print(f"[오류] Rate limit 초과: {e}")
+                        return self._fallback_response(prompt)
+
+                except openai.APITimeoutError as e:
+                    breaker.record_failure()
+                    wait_time = (attempt + 1) * 3  # 3초, 6초, 9초
+                    print(f"[경고] API 타임아웃, {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_attempts})")
+                    if attempt < max_attempts - 1:
+                        time.sleep(wait_time)
+                    else:
+                        print(f"[오류] API 타임아웃: {e}")
+                        return self._fallback_response(prompt)
+
+                except openai.APIConnectionError as e:
+                    breaker.record_failure()
+                    wait_time = (attempt + 1) * 2  # 2초, 4초, 6초
+                    print(f"[경고] 네트워크 연결 오류, {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_attempts})")
+                    if attempt < max_attempts - 1:
+                        time.sleep(wait_time)
+                    else:
+                        print(f"[오류] 연결 실패: {e}")
+                        return self._fallback_response(prompt)
+
+                except Exception as e:
+                    status_code = getattr(e, 'status_code', None)  # openai.APIStatusError (401, 5xx 등)
+                    if status_code is not None and is_failure_status(status_code):
+                        breaker.record_failure(status_code)
+                    print(f"[오류] {e}")
+                    print(f"[오류] OpenAI API 호출 실패 (시도 {attempt + 1}/{max_attempts}): {e}")
+                    if attempt < max_attempts - 1:
+                        time.sleep(2)
+                    else:
+                        return self._fallback_response(prompt)
+
+            return self._fallback_response(prompt)
+        finally:
+            if not settled:
+                adjust(LLM_TOKENS, -reserved)
     
     def _fallback_response(self, prompt: str) -> str:
         """API 실패 시 에러 메시지 반환"""
@@ -0,0 +1,175 @@
+"""
+노드 단위 실행 지표 수집
+노드별 wall/CPU 시간, 외부 API 호출 수, 다운로드 바이트, LLM 토큰, 캐시 적중을 기록
+
+- 현재 노드는 contextvar로 전달 (노드 내부 스레드 풀은 bind_context로 전달)
+- 도구 코드는 record()만 호출하면 되고, 수집기가 없으면 아무 일도 하지 않음
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+
+# 집계되는 지표 키 (노드별 dict에 항상 포함)
+METRIC_KEYS = (
+    'wall_time', 'cpu_time',
+    'web_search_calls', 'dart_calls', 'sec_calls', 'yahoo_calls', 'llm_calls',
+    'http_requests', 'bytes_downloaded',
+    'llm_tokens_in', 'llm_tokens_out',
+    'cache_hits', 'cache_misses',
+    'cache_memory_hits', 'cache_memory_misses', 'cache_disk_hits', 'cache_disk_misses',  # 공유 CacheManager 계층별
+    'cache_evictions',  # 네임스페이스 용량 한도로 삭제된 캐시 항목 (tools/cache_manager.py)
+    'cache_stale_hits',  # 만료된 캐시를 반환하고 백그라운드 갱신한 조회 (stale-while-revalidate)
+    'memo_hits', 'memo_misses',  # 노드 출력 메모 복원/실행 (workflow/memo.py)
+    'coalesced_calls',  # 진행 중인 같은 요청에 합쳐져 생략된 호출 (tools/singleflight.py)
+    'hedged_searches',  # Tavily 응답 지연으로 DuckDuckGo를 함께 요청한 검색 (tools/web_tools.py)
+    'circuit_trips', 'circuit_rejected_calls',  # 서킷 브레이커 open 횟수 / 차단된 요청 (tools/circuit_breaker.py)
+    'duplicate_articles'  # 중복으로 제거된 뉴스 기사 (tools/dedup.py)
+)
+
+UNATTRIBUTED = '_unattributed'
+
+_current_collector: contextvars.ContextVar = contextvars.ContextVar('metrics_collector', default=None)
+_current_node: contextvars.ContextVar = contextvars.ContextVar('metrics_node', default=None)
+
+
+def _empty_metrics() -> Dict[str, float]:
+    return {key: 0 for key in METRIC_KEYS}
+
+
+class MetricsCollector:
+    """실행(run) 1건의 노드별 지표"""
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None):
+        self._lock = threading.Lock()
+        self.nodes: Dict[str, Dict[str, float]] = {}
+
+        # 체크포인트 재개 시 건너뛴 노드의 지표 유지
+        for name, values in (initial or {}).get('nodes', {}).items():
+            self.nodes[name] = {**_empty_metrics(), **values}
+
+    def add(self, node: Optional[str], key: str, amount: float = 1) -> None:
+        with self._lock:
+            metrics = self.nodes.setdefault(node or UNATTRIBUTED, _empty_metrics())
+            metrics[key] = metrics.get(key, 0) + amount
+
+    @contextmanager
+    def node(self, name: str):
+        """
+        노드 실행 구간 측정
+        이 블록 안(및 bind_context로 넘긴 스레드)에서 호출된 record()는 name 노드에 집계
+        """
+        with self._lock:
+            # 재실행되는 노드는 이전 값을 지우고 새로 측정
+            self.nodes[name] = _empty_metrics()
+
+        collector_token = _current_collector.set(self)
+        node_token = _current_node.set(name)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(name, 'cpu_time', time.thread_time() - cpu_start)
+            self.add(name, 'wall_time', time.perf_counter() - wall_start)
+            _current_node.reset(node_token)
+            _current_collector.reset(collector_token)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """state['metrics'] / metrics_<timestamp>.json 형식"""
+        with self._lock:
+            nodes = {name: dict(values) for name, values in self.nodes.items()}
+
+        totals = _empty_metrics()
+        for values in nodes.values():
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0) + value
+
+        for values in list(nodes.values()) + [totals]:
+            for key in ('wall_time', 'cpu_time'):
+                values[key] = round(values[key], 4)
+
+        # wall_time 합계는 동시 실행 노드가 겹치므로 실제 경과 시간보다 클 수 있음
+        return {'nodes': nodes, 'totals': totals}
+
+
+def record(key: str, amount: float = 1) -> None:
+    """현재 노드에 지표 누적 (수집 중이 아니면 무시)"""
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.add(_current_node.get(), key, amount)
+
+
+def bind_context(func: Callable) -> Callable:
+    """
+    현재 노드 context를 다른 스레드에서 실행할 함수에 전달
+    해당 스레드의 CPU 시간도 현재 노드에 합산
+    """
+    context = contextvars.copy_context()
+
+    def _timed(*args, **kwargs):
+        cpu_start = time.thread_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record('cpu_time', time.thread_time() - cpu_start)
+
+    def bound(*args, **kwargs):
+        # 같은 Context를 여러 스레드가 동시에 run()할 수 없으므로 호출마다 사본 사용
+        return context.copy().run(_timed, *args, **kwargs)
+
+    return bound
+
+
+def instrument_session(session, provider: str):
+    """
+    requests.Session 응답 훅 등록
+    응답마다 {provider}_calls(지정된 지표만), http_requests, bytes_downloaded 기록
+    """
+    calls_key = f"{provider}_calls"
+
+    def _on_response(response, *args, **kwargs):
+        record('http_requests')
+        if calls_key in METRIC_KEYS:
+            record(calls_key)
+        if kwargs.get('stream'):
+            # stream=True 응답은 읽는 쪽이 기록 (fetch_pipeline.read_capped, 본문 전체를 읽지 않기 위해)
+            return response
+        try:
+            record('bytes_downloaded', len(response.content or b''))
+        except Exception:
+            record('bytes_downloaded', int(response.headers.get('Content-Length', 0) or 0))
+        return response
+
+    session.hooks.setdefault('response', []).append(_on_response)
+    return session
+
+
+def instrument_async_client(client, provider: str):
+    """
+    httpx.AsyncClient 응답 훅 등록 (instrument_session의 비동기 버전)
+    훅은 요청을 보낸 task의 context에서 실행되므로 현재 노드에 집계됨
+    """
+    calls_key = f"{provider}_calls"
+
+    async def _on_response(response):
+        record('http_requests')
+        if calls_key in METRIC_KEYS:
+            record(calls_key)
+        if response.request.extensions.get('capped_download'):
+            # 크기 제한 다운로드는 읽는 쪽이 기록 (fetch_pipeline.adownload)
+            return
+        try:
+            record('bytes_downloaded', len(await response.aread()))
+        except Exception:
+            record('bytes_downloaded', int(response.headers.get('Content-Length', 0) or 0))
+
+    client.event_hooks['response'] = list(client.event_hooks.get('response', [])) + [_on_response]
+    return client
+
+
+__all__ = ['MetricsCollector', 'METRIC_KEYS', 'record', 'bind_context', 'instrument_session',
+           'instrument_async_client']
@@ -0,0 +1,253 @@
+"""
+호스트별 요청 속도 제한 (적응형 토큰 버킷)
+같은 호스트로 가는 모든 스레드/도구 인스턴스/비동기 클라이언트가 하나의 버킷을 공유
+→ 호출 후 고정 대기 없이 제공자가 허용하는 속도까지 요청
+
+- 한도는 HOST_LIMITS (환경변수 <PROVIDER>_REQUESTS_PER_SECOND로 변경, 예: TAVILY_REQUESTS_PER_SECOND=5)
+- 429 응답을 받으면 속도를 절반으로 줄이고 Retry-After 동안 요청을 멈춤
+- 이후 성공 응답마다 조금씩 속도를 올려 설정 한도까지 회복 (AIMD)
+- 한도가 없는 호스트도 429를 받으면 제한을 걸고, 충분히 회복하면 다시 제한 해제
+- HOST_LIMITS에 없는 호스트(기사 본문 등)의 제한기는 최근 사용한 MAX_UNKNOWN_HOSTS개만 유지 (LRU)
+
+requests 세션은 throttle_session(), httpx.AsyncClient는 throttle_async_client()로 연결
+(configure_session/AsyncClientPool이 자동으로 호출하므로 도구 코드는 따로 대기하지 않음)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# 호스트별 한도: 호스트 → (제공자 이름, 초당 요청 수, 버스트)
+# 초당 요청 수 0은 제한 없음 (429를 받으면 적응형으로 제한)
+HOST_LIMITS: Dict[str, Tuple[str, float, int]] = {
+    'data.sec.gov': ('sec', 10.0, 10),  # SEC fair access: 초당 10회
+    'www.sec.gov': ('sec', 10.0, 10),
+    'efts.sec.gov': ('sec', 10.0, 10),
+    'api.tavily.com': ('tavily', 2.0, 4),  # 플랜별 한도 (유료 플랜은 환경변수로 상향)
+    'www.alphavantage.co': ('alpha_vantage', 5 / 60, 1),  # 무료 플랜: 분당 5회
+    'api.duckduckgo.com': ('duckduckgo', 1.0, 1),
+    'gnews.io': ('gnews', 2.0, 1),
+    'api.openai.com': ('openai', 0.0, 1),
+    'opendart.fss.or.kr': ('dart', 0.0, 1),
+    'query1.finance.yahoo.com': ('yahoo', 0.0, 1),
+    'query2.finance.yahoo.com': ('yahoo', 0.0, 1)
+}
+
+# 한도가 없는 호스트가 처음 429를 받았을 때 시작 속도, 이 속도 이상 회복하면 제한 해제
+ADAPTIVE_START_RATE = 4.0
+ADAPTIVE_RELEASE_RATE = 50.0
+MIN_RATE = 1 / 60  # 아무리 줄여도 분당 1회
+RECOVERY_FACTOR = 0.05  # 성공 응답마다 한도의 5%씩 회복
+DEFAULT_RETRY_AFTER = 1.0
+MAX_UNKNOWN_HOSTS = 256  # HOST_LIMITS에 없는 호스트의 제한기 수 (상주 프로세스에서 기사 호스트마다 쌓이지 않도록)
+
+
+class RateLimiter:
+    """
+    적응형 토큰 버킷 속도 제한기 (스레드 안전)
+
+    Args:
+        rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+        burst: 한 번에 연달아 보낼 수 있는 최대 요청 수
+        name: 로그 표시용 이름
+    """
+
+    def __init__(self, rate: float, burst: int = 1, name: str = ''):
+        self.name = name
+        self.max_rate = float(rate) if rate and rate > 0 else None  # 설정 한도 (None: 제한 없음)
+        self.rate = self.max_rate or 0.0  # 현재 속도 (0: 제한 없음)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.throttled_count = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self) -> float:
+        """토큰이 있으면 1개 차감 후 0, 없으면 다음 토큰까지 남은 시간(초)"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self.rate <= 0:
+                return 0.0
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 1개 획득 (없으면 다음 토큰이 생길 때까지 대기)
+
+        Returns:
+            timeout 안에 획득하면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """acquire()의 비동기 버전 (대기 중에도 이벤트 루프를 막지 않음)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """제공자 한도 초과(429 등): 속도를 절반으로 줄이고 retry_after 동안 요청 중지"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            start_rate = self.rate if self.rate > 0 else ADAPTIVE_START_RATE
+            self.rate = max(MIN_RATE, start_rate / 2)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + (retry_after or DEFAULT_RETRY_AFTER))
+            self.throttled_count += 1
+            rate = self.rate
+        print(f"    [RATE] {self.name} 요청 한도 초과 - 초당 {rate:.2f}회로 감속, "
+              f"{retry_after or DEFAULT_RETRY_AFTER:.1f}초 대기")
+
+    def succeeded(self) -> None:
+        """정상 응답: 감속된 상태면 설정 한도까지 조금씩 회복"""
+        with self._lock:
+            if self.rate == (self.max_rate or 0.0):
+                return
+            ceiling = self.max_rate or ADAPTIVE_RELEASE_RATE
+            self.rate = min(ceiling, self.rate + ceiling * RECOVERY_FACTOR)
+            if self.max_rate is None and self.rate >= ADAPTIVE_RELEASE_RATE:
+                self.rate = 0.0  # 한도 없는 호스트는 충분히 회복하면 제한 해제
+
+    def observe(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """응답 상태 코드로 속도 조절"""
+        if status_code == 429:
+            self.throttled(parse_retry_after(retry_after))
+        elif status_code < 400:
+            self.succeeded()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 단위만 지원, HTTP 날짜 형식은 기본 대기)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_unknown_limiters: OrderedDict = OrderedDict()  # HOST_LIMITS에 없는 호스트 → 제한기 (LRU)
+_limiters_lock = threading.Lock()
+
+
+def host_provider(host: str) -> str:
+    """호스트의 제공자 이름 (HOST_LIMITS에 없으면 호스트 이름 그대로)"""
+    host = (host or '').lower()
+    return HOST_LIMITS.get(host, (host,))[0]
+
+
+def _configured_rate(provider: str, rate: float) -> float:
+    """<PROVIDER>_REQUESTS_PER_SECOND 환경변수가 있으면 그 값, 없거나 틀리면 rate"""
+    env_name = f"{provider.upper().replace('.', '_').replace('-', '_')}_REQUESTS_PER_SECOND"
+    env_rate = os.getenv(env_name)
+    if env_rate:
+        try:
+            return float(env_rate)
+        except ValueError:
+            print(f"[WARNING] {env_name} 값이 올바르지 않습니다: {env_rate}")
+    return rate
+
+
+def get_host_limiter(host: str) -> RateLimiter:
+    """
+    호스트별 공유 속도 제한기
+    같은 제공자(HOST_LIMITS의 이름)의 호스트는 하나의 버킷을 공유
+    HOST_LIMITS에 없는 호스트는 최근 사용한 MAX_UNKNOWN_HOSTS개만 유지 (밀려난 호스트는 다음 요청에서 새 제한기)
+    """
+    host = (host or '').lower()
+    if host not in HOST_LIMITS:
+        with _limiters_lock:
+            limiter = _unknown_limiters.get(host)
+            if limiter is None:
+                limiter = RateLimiter(_configured_rate(host, 0.0), 1, name=host)
+                _unknown_limiters[host] = limiter
+                while len(_unknown_limiters) > MAX_UNKNOWN_HOSTS:
+                    _unknown_limiters.popitem(last=False)
+            else:
+                _unknown_limiters.move_to_end(host)
+            return limiter
+
+    provider, rate, burst = HOST_LIMITS[host]
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = RateLimiter(_configured_rate(provider, rate), burst, name=provider)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def get_url_limiter(url: str) -> RateLimiter:
+    return get_host_limiter(urlsplit(url).hostname or '')
+
+
+def throttle_session(session):
+    """
+    requests.Session의 모든 요청(리다이렉트 포함)을 호스트별 속도 제한기에 연결
+    보내기 전 토큰을 얻고, 응답 상태 코드로 속도 조절
+    """
+    if getattr(session, '_rate_limited', False):
+        return session
+
+    send = session.send
+
+    def throttled_send(request, **kwargs):
+        limiter = get_url_limiter(request.url)
+        limiter.acquire()
+        response = send(request, **kwargs)
+        limiter.observe(response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    session.send = throttled_send
+    session._rate_limited = True
+    return session
+
+
+def throttle_async_client(client):
+    """httpx.AsyncClient 요청 훅으로 호스트별 속도 제한 (throttle_session의 비동기 버전)"""
+
+    async def _on_request(request):
+        await get_url_limiter(str(request.url)).acquire_async()
+
+    async def _on_response(response):
+        get_url_limiter(str(response.request.url)).observe(
+            response.status_code, response.headers.get('Retry-After')
+        )
+
+    client.event_hooks['request'] = list(client.event_hooks.get('request', [])) + [_on_request]
+    client.event_hooks['response'] = list(client.event_hooks.get('response', [])) + [_on_response]
+    return client
+
+
+__all__ = ['RateLimiter', 'HOST_LIMITS', 'host_provider', 'get_host_limiter', 'get_url_limiter', 'parse_retry_after',
+           'throttle_session', 'throttle_async_client']
@@ -5,10 +5,13 @@ SEC EDGAR API를 사용한 미국 상장 기업 재무 데이터 수집
 
 import os
 import requests
-import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import json
+from tools.cache_manager import MemoryCache
+from tools.metrics import instrument_session
+from tools.http_transport import configure_session
+from tools.singleflight import coalesce
 
 
 class SECEdgarTool:
@@ -24,14 +27,19 @@ class SECEdgarTool:
         self.user_agent = user_agent or "EVI-Agent/1.0 (evi-agent@example.com)"
         self.base_url = "https://data.sec.gov"
         self.session = requests.Session()
+        instrument_session(self.session, 'sec')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'sec')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
         # Host 헤더는 자동으로 설정되도록 제거 (수동 설정 시 404 발생 가능)
         self.session.headers.update({
             'User-Agent': self.user_agent,
             'Accept-Encoding': 'gzip, deflate'
         })
+        self.response_cache = MemoryCache('sec')  # companyfacts/submissions 응답 캐시 (배치 실행 시 공유, 디스크 캐시로 실행 간 재사용)
         
         print(f"[OK] SEC EDGAR API 초기화 완료 (User-Agent: {self.user_agent})")
     
+    # 동시에 들어온 같은 기업/CIK 조회는 한 번만 호출하고 결과 공유
+    @coalesce(lambda self, company_name: company_name)
     def get_company_financial_data(self, company_name: str) -> Dict[str, Any]:
         """
         미국 상장 기업 재무 데이터 수집
@@ -153,6 +161,7 @@ class SECEdgarTool:
         print(f"   [WARNING] '{company_name}'의 CIK 매핑 없음")
         return None
     
+    @coalesce(lambda self, cik: self._normalize_cik(cik))
     def _get_company_facts(self, cik: str) -> Optional[Dict[str, Any]]:
         """
         회사의 모든 재무 팩트 데이터 조회
@@ -167,6 +176,11 @@ class SECEdgarTool:
             # SEC API 형식: https://data.sec.gov/api/xbrl/companyfacts/CIK0001318605.json
             url = f"{self.base_url}/api/xbrl/companyfacts/CIK{cik_padded}.json"
             
+            # 만료 직후 항목은 바로 반환하고 백그라운드 갱신 (CACHE_STALE_WHILE_REVALIDATE)
+            cached = self.response_cache.get(('companyfacts', cik_padded), revalidate=lambda: self._download_json(url))
+            if cached is not None:
+                return cached
+            
             print(f"   [DEBUG] SEC API 호출: {url}")
             
             response = self.session.get(url, timeout=30)
@@ -174,9 +188,9 @@ class SECEdgarTool:
             
             data = response.json()
             
-            # SEC API는 10초에 10회 제한 (1초 대기)
-            time.sleep(1)
+            # SEC fair access(초당 10회)는 세션의 호스트별 속도 제한기가 조절
             
+            self.response_cache.set(('companyfacts', cik_padded), data)
             return data
             
         except requests.exceptions.HTTPError as e:
@@ -198,6 +212,12 @@ class SECEdgarTool:
             print(f"   ❌ [에러] 회사 팩트 조회 실패: {e}")
             return None
     
+    def _download_json(self, url: str) -> Dict[str, Any]:
+        """JSON 응답 조회 (캐시 백그라운드 갱신용, 실패하면 예외)"""
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.json()
+    
     def _extract_financial_data(self, company_facts: Dict[str, Any]) -> Dict[str, Any]:
         """
         Company Facts에서 재무 데이터 추출
@@ -340,6 +360,7 @@ class SECEdgarTool:
             'industry': 'Electric Vehicles'
         }
     
+    @coalesce(lambda self, cik, form_type='10-K': (self._normalize_cik(cik), form_type))
     def get_recent_filings(self, cik: str, form_type: str = '10-K') -> List[Dict[str, Any]]:
         """
         최근 SEC 제출 서류 조회
@@ -355,14 +376,21 @@ class SECEdgarTool:
             # SEC API 형식: https://data.sec.gov/submissions/CIK0001318605.json
             url = f"{self.base_url}/submissions/CIK{cik_padded}.json"
             
-            print(f"   [DEBUG] SEC Submissions API 호출: {url}")
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            filings = data.get('filings', {}).get('recent', {})
+            # form_type별 호출이 같은 submissions 응답을 공유
+            filings = self.response_cache.get(
+                ('submissions', cik_padded),
+                revalidate=lambda: self._download_json(url).get('filings', {}).get('recent', {})
+            )
+            if filings is None:
+                print(f"   [DEBUG] SEC Submissions API 호출: {url}")
+                
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                filings = data.get('filings', {}).get('recent', {})
+                self.response_cache.set(('submissions', cik_padded), filings)
             
             # 해당 form_type 필터링
             results = []
@@ -383,7 +411,6 @@ class SECEdgarTool:
                         'description': f'{form} filing'
                     })
             
-            time.sleep(1)
             return results[:10]  # 최근 10개만
             
         except requests.exceptions.HTTPError as e:
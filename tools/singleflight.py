@@ -0,0 +1,142 @@
+"""
+동시 요청 합치기 (single-flight)
+같은 키의 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 함께 받음
+→ 동시에 실행되는 에이전트가 같은 검색/공시 조회를 보내도 네트워크 호출과 API 크레딧은 1회
+
+- 진행 중인 호출만 합침 (끝난 결과의 재사용은 각 도구의 응답 캐시 담당)
+- 기다린 호출은 결과 사본을 받으므로 호출 측 수정이 서로에게 영향을 주지 않음
+- 예외도 함께 전달 (기다린 호출도 같은 예외 발생)
+- 합쳐진 호출 수는 노드 지표 coalesced_calls로 기록
+"""
+
+import asyncio
+import copy
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from tools.metrics import record
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별 진행 중 호출 그룹 (스레드/이벤트 루프 공용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """key로 진행 중인 호출이 있으면 기다렸다가 결과 사본 반환, 없으면 func 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            record('coalesced_calls')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._calls.pop(key, None)
+            raise
+        else:
+            # 기다린 호출에는 반환 직후 호출 측이 수정하기 전의 사본을 전달
+            # 결과 저장과 키 제거는 같은 잠금 구간에서 (그 사이에 합류한 호출이 결과 없이 깨어나지 않도록)
+            with self._lock:
+                if call.waiters:
+                    call.result = copy.deepcopy(result)
+                self._calls.pop(key, None)
+            return result
+        finally:
+            call.done.set()
+
+    async def ado(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """do()의 비동기 버전 (func는 코루틴 함수, 같은 이벤트 루프의 호출끼리 합침)"""
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            future = self._async_calls.get(loop_key)
+            leader = future is None
+            if leader:
+                future = asyncio.get_running_loop().create_future()
+                self._async_calls[loop_key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            record('coalesced_calls')
+            return copy.deepcopy(await asyncio.shield(future))
+
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다린 호출이 없어도 "never retrieved" 경고가 나지 않도록
+            raise
+        else:
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._lock:
+                self._async_calls.pop(loop_key, None)
+
+
+_groups_lock = threading.Lock()
+
+
+def _group(instance) -> SingleFlight:
+    """도구 인스턴스별 SingleFlight (첫 사용 시 생성)"""
+    group = instance.__dict__.get('_singleflight')
+    if group is None:
+        with _groups_lock:
+            group = instance.__dict__.setdefault('_singleflight', SingleFlight())
+    return group
+
+
+def coalesce(key_func: Callable[..., Hashable]):
+    """
+    메서드 데코레이터: key_func(self, *args, **kwargs)가 같은 동시 호출을 1회 실행으로 합침
+
+    예:
+        @coalesce(lambda self, query, num_results=10: ('search', query, num_results))
+        def search(self, query, num_results=10): ...
+    """
+    def decorator(method):
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                key = (method.__name__, key_func(self, *args, **kwargs))
+                return await _group(self).ado(key, method, self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, key_func(self, *args, **kwargs))
+            return _group(self).do(key, method, self, *args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+__all__ = ['SingleFlight', 'coalesce']
@@ -4,10 +4,21 @@ Tavily API를 사용한 웹 검색 도구
 """
 
 import os
+import threading
 import requests
-import time
+from collections import deque
 from typing import List, Dict, Any, Optional
-from tools.cache_manager import CacheManager
+from tools.cache_manager import get_cache_manager
+from tools.budget import WEB_SEARCH, spend
+from tools.circuit_breaker import get_breaker
+from tools.fetch_pipeline import adownload, download
+from tools.metrics import instrument_session
+from tools.http_transport import AsyncClientPool, configure_session
+
+
+LATENCY_WINDOW = 50  # 응답 시간 백분위 계산에 쓰는 최근 요청 수
+LATENCY_MIN_SAMPLES = 10
+REQUEST_TIMEOUT = 30
 
 
 class TavilySearchTool:
@@ -21,8 +32,13 @@ class TavilySearchTool:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv('TAVILY_API_KEY')
         self.base_url = "https://api.tavily.com/search"
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         self.session = requests.Session()
+        instrument_session(self.session, 'tavily')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'tavily')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
+        self.async_clients = AsyncClientPool('tavily')  # asearch/afetch용 (httpx, 이벤트 루프별 연결 풀)
+        self._latencies = deque(maxlen=LATENCY_WINDOW)  # 실제 API 요청의 응답 시간 (캐시 적중 제외)
+        self._latencies_lock = threading.Lock()
         
         if not self.api_key:
             print("[WARNING] Tavily API 키가 설정되지 않았습니다.")
@@ -41,73 +57,26 @@ class TavilySearchTool:
         Returns:
             검색 결과 리스트
         """
-        if not self.api_key:
-            print(f"[ERROR] Tavily API 키가 없습니다: '{query}'")
-            return []
-        
-        # 1. 캐시에서 결과 조회
         cache_key = f"tavily_{query}_{num_results}"
-        cached_result = self.cache_manager.get_cached_result(cache_key, num_results)
-        if cached_result is not None:
-            print(f"    [CACHE] Tavily '{query}' 캐시에서 {len(cached_result)}개 결과 조회")
-            return cached_result
+        early = self._before_request(query, cache_key, num_results)
+        if early is not None:
+            return early
         
         try:
             print(f"    [Tavily] '{query}' 검색 중...")
             
-            # Tavily API 호출
-            payload = {
-                "api_key": self.api_key,
-                "query": query,
-                "search_depth": "advanced",  # basic or advanced
-                "max_results": min(num_results, 10),
-                "include_answer": False,
-                "include_raw_content": False,
-                "include_images": False
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
+            # 요청 간격은 세션의 호스트별 속도 제한기가 조절 (TAVILY_REQUESTS_PER_SECOND)
             response = self.session.post(
                 self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=30
+                json=self._build_payload(query, num_results),
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT
             )
-            
-            # 상태 코드 확인
-            if response.status_code == 200:
-                data = response.json()
-                results = self._parse_tavily_results(data)
-                
-                print(f"    [OK] Tavily '{query}' 검색 완료: {len(results)}개 결과")
-                
-                # 2. 결과를 캐시에 저장
-                self.cache_manager.set_cached_result(cache_key, num_results, results)
-                
-                # API 요청 간격 (유료 플랜은 더 많은 요청 가능)
-                time.sleep(0.5)
-                return results
-                
-            elif response.status_code == 429:
-                print(f"    [ERROR] Tavily API 제한 초과 (429): 너무 많은 요청")
-                return []
-                
-            elif response.status_code == 401:
-                print(f"    [ERROR] Tavily API 인증 실패 (401): API 키를 확인하세요")
-                return []
-                
-            elif response.status_code == 432:
-                print(f"    [ERROR] Tavily API 오류 (432): {response.text[:200]}")
-                return []
-                
-            else:
-                print(f"    [ERROR] Tavily API 오류: {response.status_code} - {response.text[:200]}")
-                return []
+            self._observe_response_latency(response)
+            return self._handle_response(response, query, cache_key, num_results)
                 
         except requests.exceptions.Timeout:
+            self._observe_latency(REQUEST_TIMEOUT)
             print(f"    [ERROR] Tavily API 타임아웃: '{query}'")
             return []
             
@@ -119,6 +88,151 @@ class TavilySearchTool:
             print(f"    [ERROR] Tavily 검색 오류: {e}")
             return []
     
+    async def asearch(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        search()의 비동기 버전 (이벤트 루프별 keep-alive 연결 풀 사용)
+        캐시/예산/속도 제한/응답 처리는 search()와 동일
+        """
+        import httpx
+
+        cache_key = f"tavily_{query}_{num_results}"
+        early = self._before_request(query, cache_key, num_results)
+        if early is not None:
+            return early
+        
+        try:
+            print(f"    [Tavily] '{query}' 검색 중... (async)")
+            
+            response = await self.async_clients.get().post(
+                self.base_url,
+                json=self._build_payload(query, num_results),
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT
+            )
+            self._observe_response_latency(response)
+            return self._handle_response(response, query, cache_key, num_results)
+                
+        except httpx.TimeoutException:
+            self._observe_latency(REQUEST_TIMEOUT)
+            print(f"    [ERROR] Tavily API 타임아웃: '{query}'")
+            return []
+            
+        except httpx.HTTPError as e:
+            print(f"    [ERROR] Tavily API 요청 실패: {e}")
+            return []
+            
+        except Exception as e:
+            print(f"    [ERROR] Tavily 검색 오류: {e}")
+            return []
+    
+    def _observe_latency(self, seconds: float) -> None:
+        with self._latencies_lock:
+            self._latencies.append(seconds)
+    
+    def _observe_response_latency(self, response) -> None:
+        """
+        실제 네트워크 응답 시간 기록 (response.elapsed)
+        requests/httpx 모두 속도 제한기 대기(acquire) 이후부터 측정하므로 대기열 시간은 제외됨
+        """
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError):
+            return  # 재생(replay) 응답 등 측정값이 없는 경우
+        self._observe_latency(elapsed)
+    
+    def latency_percentile(self, percentile: float = 95) -> Optional[float]:
+        """최근 API 요청 응답 시간의 백분위 (초), 기록이 LATENCY_MIN_SAMPLES개 미만이면 None"""
+        with self._latencies_lock:
+            samples = sorted(self._latencies)
+        if len(samples) < LATENCY_MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[index]
+    
+    def _before_request(self, query: str, cache_key: str, num_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        요청 전 확인 (API 키, 캐시, 서킷 브레이커, 크레딧 예산)
+        바로 반환할 결과가 있으면 리스트, 요청을 보내야 하면 None
+        """
+        if not self.api_key:
+            print(f"[ERROR] Tavily API 키가 없습니다: '{query}'")
+            return []
+        
+        # 1. 캐시에서 결과 조회 (stale-while-revalidate 사용 시 만료된 결과를 반환하고 백그라운드 갱신)
+        cached_result = self.cache_manager.get_cached_result(
+            cache_key, num_results, revalidate=lambda: self._revalidate(query, num_results)
+        )
+        if cached_result is not None:
+            print(f"    [CACHE] Tavily '{query}' 캐시에서 {len(cached_result)}개 결과 조회")
+            return cached_result
+        
+        # 2. 반복 실패(429/401 등)로 브레이커가 열려 있으면 예산을 쓰지 않고 바로 DuckDuckGo로 대체
+        if get_breaker('tavily').is_open():
+            print(f"    [CIRCUIT] Tavily 일시 차단 중 - '{query}' 생략")
+            return []
+        
+        # 3. 크레딧 예산 확인 (부족하면 빈 결과 → WebSearchTool이 DuckDuckGo로 대체)
+        if not spend(WEB_SEARCH):
+            print(f"    [BUDGET] Tavily 검색 예산 소진 - '{query}' 생략")
+            return []
+        
+        return None
+    
+    def _revalidate(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        """만료된 캐시 항목의 백그라운드 갱신 (저장은 CacheManager가 함, 실패/차단 시 빈 결과 → 기존 값 유지)"""
+        if get_breaker('tavily').is_open() or not spend(WEB_SEARCH):
+            return []
+        response = self.session.post(
+            self.base_url,
+            json=self._build_payload(query, num_results),
+            headers={"Content-Type": "application/json"},
+            timeout=REQUEST_TIMEOUT
+        )
+        self._observe_response_latency(response)
+        return self._handle_response(response, query, None, num_results)
+    
+    def _build_payload(self, query: str, num_results: int) -> Dict[str, Any]:
+        return {
+            "api_key": self.api_key,
+            "query": query,
+            "search_depth": "advanced",  # basic or advanced
+            "max_results": min(num_results, 10),
+            "include_answer": False,
+            "include_raw_content": False,
+            "include_images": False
+        }
+    
+    def _handle_response(self, response, query: str, cache_key: Optional[str],
+                         num_results: int) -> List[Dict[str, Any]]:
+        """응답 처리 (requests.Response / httpx.Response 공용, cache_key가 None이면 캐시에 저장하지 않음)"""
+        # 상태 코드 확인
+        if response.status_code == 200:
+            data = response.json()
+            results = self._parse_tavily_results(data)
+            
+            print(f"    [OK] Tavily '{query}' 검색 완료: {len(results)}개 결과")
+            
+            # 3. 결과를 캐시에 저장
+            if cache_key is not None:
+                self.cache_manager.set_cached_result(cache_key, num_results, results)
+            return results
+            
+        elif response.status_code == 429:
+            print(f"    [ERROR] Tavily API 제한 초과 (429): 너무 많은 요청")
+            return []
+            
+        elif response.status_code == 401:
+            print(f"    [ERROR] Tavily API 인증 실패 (401): API 키를 확인하세요")
+            return []
+            
+        elif response.status_code == 432:
+            print(f"    [ERROR] Tavily API 오류 (432): {response.text[:200]}")
+            return []
+            
+        else:
+            print(f"    [ERROR] Tavily API 오류: {response.status_code} - {response.text[:200]}")
+            return []
+    
     def _parse_tavily_results(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Tavily API 응답을 파싱하여 표준 형식으로 변환
@@ -142,10 +256,21 @@ class TavilySearchTool:
         URL에서 컨텐츠 가져오기
         """
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
+            # 스트리밍으로 MAX_FETCH_BYTES까지만 읽음 (큰 페이지/파일 방지)
+            return download(self.session, url)
+        except Exception as e:
+            print(f"[FAIL] URL 가져오기 실패 {url}: {e}")
+            return ""
+    
+    async def afetch(self, url: str) -> str:
+        """fetch()의 비동기 버전"""
+        try:
+            return await adownload(self.async_clients.get(), url)
         except Exception as e:
             print(f"[FAIL] URL 가져오기 실패 {url}: {e}")
             return ""
+    
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 연결 정리"""
+        await self.async_clients.aclose()
 
@@ -9,7 +9,7 @@ Fixes:
 
 import re
 from collections import Counter
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterable, Tuple
 from datetime import datetime
 
 
@@ -81,6 +81,20 @@ class TrendAnalyzer:
         Returns:
             Dict of category -> [(keyword, count), ...]
         """
+        return self.merge_keyword_counts(
+            (self.count_article_keywords(article) for article in news_articles), top_n=top_n
+        )
+    
+    def count_article_keywords(self, article: Dict[str, Any]) -> Dict[str, Counter]:
+        """
+        Keyword counts of a single article per category (streaming unit of extract_keywords)
+        
+        Args:
+            article: News article dict
+            
+        Returns:
+            Dict of category -> Counter
+        """
         categories = {
             'companies': Counter(),
             'tech': Counter(),
@@ -88,43 +102,70 @@ class TrendAnalyzer:
             'investment': Counter()
         }
         
-        for article in news_articles:
-            title = article.get('title', '')
-            content = article.get('content', '')
-            text = f"{title} {content}"
+        title = article.get('title', '')
+        content = article.get('content', '')
+        text = f"{title} {content}"
+        
+        # Detect language
+        lang = self.detect_language(text)
+        
+        # Extract words
+        words = re.findall(r'\b[A-Za-z가-힣]{2,}\b', text)
+        
+        # Remove stopwords
+        words = self.remove_stopwords(words, language=lang)
+        
+        # Categorize (simplified logic)
+        for word in words:
+            word_lower = word.lower()
             
-            # Detect language
-            lang = self.detect_language(text)
+            # Company names (capitalized or known patterns)
+            if word[0].isupper() or any(term in word_lower for term in ['motor', 'auto', 'energy']):
+                categories['companies'][word] += 1
             
-            # Extract words
-            words = re.findall(r'\b[A-Za-z가-힣]{2,}\b', text)
+            # Tech keywords
+            elif any(term in word_lower for term in ['battery', 'chip', 'software', 'tech', '배터리', '칩', '소프트웨어']):
+                categories['tech'][word] += 1
             
-            # Remove stopwords
-            words = self.remove_stopwords(words, language=lang)
+            # Market keywords
+            elif any(term in word_lower for term in ['market', 'price', 'growth', 'sales', '시장', '가격', '성장', '판매']):
+                categories['market'][word] += 1
             
-            # Categorize (simplified logic)
-            for word in words:
-                word_lower = word.lower()
-                
-                # Company names (capitalized or known patterns)
-                if word[0].isupper() or any(term in word_lower for term in ['motor', 'auto', 'energy']):
-                    categories['companies'][word] += 1
-                
-                # Tech keywords
-                elif any(term in word_lower for term in ['battery', 'chip', 'software', 'tech', '배터리', '칩', '소프트웨어']):
-                    categories['tech'][word] += 1
-                
-                # Market keywords
-                elif any(term in word_lower for term in ['market', 'price', 'growth', 'sales', '시장', '가격', '성장', '판매']):
-                    categories['market'][word] += 1
-                
-                # Investment keywords
-                elif any(term in word_lower for term in ['invest', 'stock', 'fund', 'revenue', '투자', '주식', '펀드', '수익']):
-                    categories['investment'][word] += 1
-                
-                # Default to tech
-                else:
-                    categories['tech'][word] += 1
+            # Investment keywords
+            elif any(term in word_lower for term in ['invest', 'stock', 'fund', 'revenue', '투자', '주식', '펀드', '수익']):
+                categories['investment'][word] += 1
+            
+            # Default to tech
+            else:
+                categories['tech'][word] += 1
+        
+        return categories
+    
+    def merge_keyword_counts(
+        self,
+        article_counts: Iterable[Dict[str, Counter]],
+        top_n: int = 20
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Sum per-article counts (in article order) and return top N per category
+        
+        Args:
+            article_counts: Results of count_article_keywords()
+            top_n: Number of top keywords per category
+            
+        Returns:
+            Dict of category -> [(keyword, count), ...]
+        """
+        categories = {
+            'companies': Counter(),
+            'tech': Counter(),
+            'market': Counter(),
+            'investment': Counter()
+        }
+        
+        for counts in article_counts:
+            for category, counter in counts.items():
+                categories[category].update(counter)
         
         # Return top N per category
         result = {}
@@ -349,7 +390,8 @@ class TrendAnalyzer:
     def analyze_trends_with_fallback(
         self,
         news_articles: List[Dict[str, Any]],
-        clustering_result: List[Dict[str, Any]] = None
+        clustering_result: List[Dict[str, Any]] = None,
+        keywords: Dict[str, List[Tuple[str, int]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Main trend analysis with fallback
@@ -357,6 +399,7 @@ class TrendAnalyzer:
         Args:
             news_articles: List of news articles
             clustering_result: Result from clustering (may be empty)
+            keywords: Precomputed extract_keywords(news_articles, top_n=20) result (recomputed if None)
             
         Returns:
             List of trends (guaranteed min_trends)
@@ -372,7 +415,8 @@ class TrendAnalyzer:
         print(f"   [TREND] Applying backup rules...")
         
         # Step 2: Extract keywords
-        keywords = self.extract_keywords(news_articles, top_n=20)
+        if keywords is None:
+            keywords = self.extract_keywords(news_articles, top_n=20)
         
         # Log keyword stats
         for category, kw_list in keywords.items():
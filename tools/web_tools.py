@@ -1,10 +1,30 @@
 """
 통합 웹 검색 도구
 Tavily API 우선, DuckDuckGo Fallback
+
+헤지 검색 (WEB_SEARCH_HEDGE_DELAY, 기본 off):
+Tavily 응답이 헤지 지연 안에 오지 않으면 DuckDuckGo도 함께 요청하고 먼저 온 유효한 결과 사용
+→ 멈춘 Tavily 요청 하나가 타임아웃(30초)까지 파이프라인을 붙잡지 않음
+- auto: 최근 Tavily 응답 시간(속도 제한 대기 제외)의 p95 (HEDGE_MIN_DELAY~HEDGE_MAX_DELAY, 기록이 적으면 HEDGE_DEFAULT_DELAY)
+- 초 단위 숫자: 고정 지연
+- off: 기존 순차 Fallback (Tavily 실패/타임아웃 후 DuckDuckGo)
+켜면 제공자 부하가 늘어남: 헤지된 검색은 DuckDuckGo도 호출하고,
+동기 검색에서 진 Tavily 요청은 취소되지 않아 Tavily 크레딧/검색 예산도 그대로 사용
 """
 
+import asyncio
 import os
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Any, Iterable, Optional
+from tools.metrics import bind_context, record
+from tools.singleflight import coalesce
+
+
+HEDGE_DEFAULT_DELAY = 3.0
+HEDGE_MIN_DELAY = 0.5
+HEDGE_MAX_DELAY = 5.0
+HEDGE_MAX_WORKERS = 16  # 헤지 검색용 스레드 (멈춘 Tavily 요청은 타임아웃까지 스레드를 점유)
 
 
 class WebSearchTool:
@@ -28,13 +48,27 @@ class WebSearchTool:
         # DuckDuckGo는 항상 Fallback으로 준비
         from tools.duckduckgo_tools import DuckDuckGoSearchTool
         self.duckduckgo = DuckDuckGoSearchTool()
+        
+        self.hedge_delay_setting = os.getenv('WEB_SEARCH_HEDGE_DELAY', 'off').strip().lower()
+        self._hedge_pool = None
+        self._hedge_pool_lock = threading.Lock()
+        self._fetch_pipeline = None
     
+    # 동시에 들어온 같은 검색은 한 번만 호출하고 결과 공유 (예: 같은 기업의 뉴스/전문가 의견 검색)
+    @coalesce(lambda self, query, num_results=10: (query, num_results))
     def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
         """
         웹 검색 실행
         1. Tavily API 시도 (키가 있는 경우)
         2. 실패 시 DuckDuckGo 사용
         """
+        record('web_search_calls')
+        
+        if self.tavily_enabled and self.tavily:
+            delay = self._hedge_delay()
+            if delay is not None:
+                return self._hedged_search(query, num_results, delay)
+        
         # 1. Tavily API 시도
         if self.tavily_enabled and self.tavily:
             try:
@@ -55,6 +89,122 @@ class WebSearchTool:
             print(f"    [ERROR] DuckDuckGo도 실패: {e}")
             return self._fallback_search_results(query)
     
+    def _hedge_delay(self) -> Optional[float]:
+        """DuckDuckGo를 함께 요청하기까지 기다릴 시간 (초), 헤지 검색을 쓰지 않으면 None"""
+        setting = self.hedge_delay_setting
+        if setting in ('off', 'false', 'no', 'none', ''):
+            return None
+        if setting != 'auto':
+            try:
+                delay = float(setting)
+            except ValueError:
+                print(f"[WARNING] WEB_SEARCH_HEDGE_DELAY 값이 올바르지 않습니다: {setting} - auto 사용")
+                self.hedge_delay_setting = setting = 'auto'
+            else:
+                return delay if delay > 0 else None
+        
+        p95 = self.tavily.latency_percentile(95)
+        if p95 is None:
+            return HEDGE_DEFAULT_DELAY
+        return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95))
+    
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        if self._hedge_pool is None:
+            with self._hedge_pool_lock:
+                if self._hedge_pool is None:
+                    self._hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS,
+                                                          thread_name_prefix='web-hedge')
+        return self._hedge_pool
+    
+    def _hedged_search(self, query: str, num_results: int, delay: float) -> List[Dict[str, Any]]:
+        """
+        Tavily를 먼저 요청하고, delay 안에 유효한 결과가 없으면 DuckDuckGo도 요청
+        먼저 도착한 유효한 결과(비어 있지 않은 리스트)를 반환하고 나머지 요청은 취소
+        (이미 실행 중인 요청은 멈출 수 없으므로 결과만 버림, Tavily 결과는 캐시에 저장됨)
+        """
+        pool = self._get_hedge_pool()
+        tavily = pool.submit(bind_context(self.tavily.search), query, num_results)
+        pending = {tavily: 'Tavily'}
+        duckduckgo_failed = False
+        
+        try:
+            done, _ = wait(pending, timeout=delay)
+            if done:
+                # delay 안에 끝났으면 순차 Fallback과 동일
+                results = self._completed_result(pending.pop(tavily), tavily)
+                if results:
+                    return results
+            else:
+                record('hedged_searches')
+                print(f"    [INFO] Tavily 응답 지연 ({delay:.1f}초) - DuckDuckGo 동시 요청")
+            pending[pool.submit(bind_context(self._duckduckgo_search), query, num_results)] = 'DuckDuckGo'
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider = pending.pop(future)
+                    results = self._completed_result(provider, future)
+                    if results:
+                        return results
+                    duckduckgo_failed |= provider == 'DuckDuckGo' and results is None
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        # 순차 Fallback과 동일: 둘 다 결과가 없으면 빈 결과, DuckDuckGo가 실패한 경우에만 대체 결과
+        return self._fallback_search_results(query) if duckduckgo_failed else []
+    
+    async def _ahedged_search(self, query: str, num_results: int, delay: float) -> List[Dict[str, Any]]:
+        """_hedged_search()의 비동기 버전 (진 쪽 요청은 실제로 취소되어 연결 반환)"""
+        tavily = asyncio.ensure_future(self.tavily.asearch(query, num_results))
+        pending = {tavily: 'Tavily'}
+        duckduckgo_failed = False
+        
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                results = self._completed_result(pending.pop(tavily), tavily)
+                if results:
+                    return results
+            else:
+                record('hedged_searches')
+                print(f"    [INFO] Tavily 응답 지연 ({delay:.1f}초) - DuckDuckGo 동시 요청")
+            pending[asyncio.ensure_future(self._aduckduckgo_search(query, num_results))] = 'DuckDuckGo'
+            
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = pending.pop(task)
+                    results = self._completed_result(provider, task)
+                    if results:
+                        return results
+                    duckduckgo_failed |= provider == 'DuckDuckGo' and results is None
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return self._fallback_search_results(query) if duckduckgo_failed else []
+    
+    @staticmethod
+    def _completed_result(provider: str, future) -> Optional[List[Dict[str, Any]]]:
+        """끝난 검색 요청(Future/Task)의 결과, 비어 있으면 빈 리스트, 실패하면 None"""
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"    [WARNING] {provider} 실패: {e}")
+            return None
+        if not results:
+            print(f"    [INFO] {provider} 결과 없음")
+        return results or []
+    
+    def _duckduckgo_search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        print(f"    [DuckDuckGo] '{query}' 검색 중...")
+        return self.duckduckgo.search(query, num_results)
+    
+    async def _aduckduckgo_search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        print(f"    [DuckDuckGo] '{query}' 검색 중... (async)")
+        return await self.duckduckgo.asearch(query, num_results)
+    
     def fetch(self, url: str) -> str:
         """URL에서 컨텐츠 가져오기"""
         if self.tavily:
@@ -64,6 +214,86 @@ class WebSearchTool:
                 pass
         return self.duckduckgo.fetch(url)
     
+    def _get_fetch_pipeline(self):
+        with self._hedge_pool_lock:
+            if self._fetch_pipeline is None:
+                from tools.fetch_pipeline import FetchPipeline
+                self._fetch_pipeline = FetchPipeline()
+            return self._fetch_pipeline
+    
+    def fetch_text(self, url: str) -> str:
+        """URL의 기사 본문 텍스트 (boilerplate 제거, 크기 제한, 캐시)"""
+        return self._get_fetch_pipeline().fetch_text(url)
+    
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """여러 URL의 기사 본문을 동시에 수집 (호스트별 동시 요청 제한)"""
+        return self._get_fetch_pipeline().fetch_many(urls)
+    
+    def enrich_articles(self, articles: List[Dict[str, Any]], max_chars: int = 4000) -> int:
+        """검색 결과 content(스니펫)를 기사 본문으로 교체, 교체된 기사 수 반환"""
+        return self._get_fetch_pipeline().enrich_articles(articles, max_chars)
+    
+    @coalesce(lambda self, query, num_results=10: (query, num_results))
+    async def asearch(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        search()의 비동기 버전 (Tavily → DuckDuckGo 순서 동일)
+        여러 검색을 한 이벤트 루프에서 동시에 await할 수 있고, 제공자별 keep-alive 연결 풀을 공유
+        """
+        record('web_search_calls')
+        
+        if self.tavily_enabled and self.tavily:
+            delay = self._hedge_delay()
+            if delay is not None:
+                return await self._ahedged_search(query, num_results, delay)
+        
+        # 1. Tavily API 시도
+        if self.tavily_enabled and self.tavily:
+            try:
+                results = await self.tavily.asearch(query, num_results)
+                if results:
+                    return results
+                else:
+                    print(f"    [INFO] Tavily 결과 없음 - DuckDuckGo로 재시도")
+            except Exception as e:
+                print(f"    [WARNING] Tavily 실패: {e} - DuckDuckGo로 재시도")
+        
+        # 2. DuckDuckGo Fallback
+        print(f"    [DuckDuckGo] '{query}' 재시도 중...")
+        try:
+            return await self.duckduckgo.asearch(query, num_results)
+        except Exception as e:
+            print(f"    [ERROR] DuckDuckGo도 실패: {e}")
+            return self._fallback_search_results(query)
+    
+    async def afetch(self, url: str) -> str:
+        """fetch()의 비동기 버전"""
+        if self.tavily:
+            try:
+                return await self.tavily.afetch(url)
+            except Exception:
+                pass
+        return await self.duckduckgo.afetch(url)
+    
+    async def asearch_many(self, queries: Iterable[str], num_results: int = 10,
+                           max_concurrency: int = 8) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리를 동시에 검색하고 쿼리 순서대로 결과 반환
+        동시 요청 수는 max_concurrency, 초당 요청 수는 제공자별 속도 제한기가 조절
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def bounded_search(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.asearch(query, num_results)
+        
+        return list(await asyncio.gather(*(bounded_search(query) for query in queries)))
+    
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 연결 정리"""
+        if self.tavily:
+            await self.tavily.aclose()
+        await self.duckduckgo.aclose()
+    
     def _fallback_search_results(self, query: str) -> List[Dict[str, Any]]:
         """
         모든 검색 실패 시 대체 검색 결과
@@ -7,6 +7,9 @@ import json
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import time
+from tools.cache_manager import MemoryCache
+from tools.metrics import instrument_session
+from tools.http_transport import configure_session
 
 
 class YahooFinanceTool:
@@ -17,9 +20,32 @@ class YahooFinanceTool:
     def __init__(self):
         self.base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
         self.session = requests.Session()
+        instrument_session(self.session, 'yahoo')  # 노드별 호출 수/다운로드 바이트 기록
+        configure_session(self.session, 'yahoo')  # HTTP_TRANSPORT_MODE=record/replay 시 응답 기록/재생
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self.response_cache = MemoryCache('yahoo')  # chart/quoteSummary 응답 캐시 (TTL 정책 yahoo_*)
+    
+    def _get_chart(self, symbol: str) -> Dict[str, Any]:
+        """chart API 응답 (기본 정보/주가 조회가 같은 응답 공유)"""
+        cache_key = ('chart', symbol)
+        data = self.response_cache.get(cache_key)
+        if data is None:
+            url = f"{self.base_url}/{symbol}"
+            params = {
+                'range': '1d',
+                'interval': '1d',
+                'includePrePost': 'false'
+            }
+            
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            
+            data = response.json()
+            if data.get('chart', {}).get('result'):
+                self.response_cache.set(cache_key, data)
+        return data
     
     def get_company_financial_data(self, company_name: str) -> Dict[str, Any]:
         """
@@ -133,17 +159,7 @@ class YahooFinanceTool:
            
         """
         try:
-            url = f"{self.base_url}/{symbol}"
-            params = {
-                'range': '1d',
-                'interval': '1d',
-                'includePrePost': 'false'
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_chart(symbol)
             result = data.get('chart', {}).get('result', [])
             
             if not result:
@@ -192,17 +208,7 @@ class YahooFinanceTool:
         """
         try:
             #    
-            url = f"{self.base_url}/{symbol}"
-            params = {
-                'range': '1d',
-                'interval': '1d',
-                'includePrePost': 'false'
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_chart(symbol)
             result = data.get('chart', {}).get('result', [])
             
             if not result:
@@ -248,9 +254,15 @@ class YahooFinanceTool:
                 'modules': 'price,summaryDetail'
             }
             
-            response = self.session.get(summary_url, params=summary_params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self.response_cache.get(('quotesummary', symbol))
+            if data is None:
+                response = self.session.get(summary_url, params=summary_params, timeout=10)
+                if response.status_code == 200:
+                    data = response.json()
+                    if data.get('quoteSummary', {}).get('result'):
+                        self.response_cache.set(('quotesummary', symbol), data)
+            
+            if data is not None:
                 result = data.get('quoteSummary', {}).get('result', [])
                 
                 if result:
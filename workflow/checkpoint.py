@@ -0,0 +1,140 @@
+"""
+노드 단위 체크포인트 저장/복원
+각 노드가 끝날 때마다 ReportState를 압축 JSON으로 저장하고,
+--resume <run-id>로 완료되지 않은 첫 노드부터 다시 실행
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, date
+from typing import Any, Iterable, List, Set, Tuple
+
+from models.citation import Citation, SourceManager, citation_to_dict
+from .state import ReportState
+
+
+CHECKPOINT_DIR = "checkpoints"
+STATE_FILE = "state.json.gz"
+MANIFEST_FILE = "manifest.json"
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps가 처리하지 못하는 값 변환"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, set):
+        return list(value)
+    if isinstance(value, Citation):
+        return citation_to_dict(value)
+    if hasattr(value, 'dict'):
+        return value.dict()
+    return str(value)
+
+
+def serialize_state(state: ReportState) -> bytes:
+    """ReportState → gzip 압축 JSON (SourceManager/Citation 포함)"""
+    data = dict(state)
+    data['source_manager'] = state['source_manager'].to_dict()
+    data['citations'] = {
+        key: citation_to_dict(citation)
+        for key, citation in state.get('citations', {}).items()
+    }
+
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+    return gzip.compress(payload.encode('utf-8'))
+
+
+def deserialize_state(blob: bytes) -> ReportState:
+    """serialize_state() 결과 → ReportState (Citation 객체 복원)"""
+    data = json.loads(gzip.decompress(blob).decode('utf-8'))
+    data['source_manager'] = SourceManager.from_dict(data.get('source_manager', {}))
+    data['citations'] = {
+        key: Citation(**citation_data)
+        for key, citation_data in data.get('citations', {}).items()
+    }
+    data.setdefault('errors', [])
+    data.setdefault('messages', [])
+    return data
+
+
+class CheckpointStore:
+    """
+    실행(run) 단위 체크포인트 저장소
+    checkpoints/<run_id>/state.json.gz  - 마지막으로 완료된 노드 이후의 State
+    checkpoints/<run_id>/manifest.json  - 정상 완료된 노드 목록
+    """
+
+    def __init__(self, run_id: str = None, base_dir: str = CHECKPOINT_DIR):
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.base_dir = base_dir
+        self.run_dir = os.path.join(base_dir, self.run_id)
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.run_dir, STATE_FILE)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.run_dir, MANIFEST_FILE)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.state_path) and os.path.exists(self.manifest_path)
+
+    def save(self, state: ReportState, completed_nodes: Iterable[str]) -> None:
+        """State와 완료 노드 목록 저장 (임시 파일 → rename으로 원자적 교체)"""
+        try:
+            os.makedirs(self.run_dir, exist_ok=True)
+
+            blob = serialize_state(state)
+            self._atomic_write(self.state_path, blob)
+
+            manifest = {
+                'run_id': self.run_id,
+                'completed_nodes': sorted(completed_nodes),
+                'updated_at': datetime.now().isoformat(),
+                'state_bytes': len(blob)
+            }
+            self._atomic_write(
+                self.manifest_path,
+                json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+            )
+
+            print(f"   [CHECKPOINT] {self.run_id}: {len(manifest['completed_nodes'])}개 노드 저장 ({len(blob):,} bytes)")
+
+        except Exception as e:
+            # 체크포인트 실패로 실행 자체를 중단하지 않음
+            print(f"   [WARNING] 체크포인트 저장 실패: {e}")
+
+    def load(self) -> Tuple[ReportState, Set[str]]:
+        """저장된 State와 완료 노드 목록 복원"""
+        if not self.exists():
+            raise FileNotFoundError(f"체크포인트를 찾을 수 없습니다: {self.run_dir}")
+
+        with open(self.state_path, 'rb') as f:
+            state = deserialize_state(f.read())
+
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        return state, set(manifest.get('completed_nodes', []))
+
+    @staticmethod
+    def list_runs(base_dir: str = CHECKPOINT_DIR) -> List[str]:
+        """저장된 run_id 목록 (최신순)"""
+        if not os.path.exists(base_dir):
+            return []
+        runs = [
+            name for name in os.listdir(base_dir)
+            if os.path.exists(os.path.join(base_dir, name, MANIFEST_FILE))
+        ]
+        return sorted(runs, reverse=True)
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+__all__ = ['CheckpointStore', 'serialize_state', 'deserialize_state']
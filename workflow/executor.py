@@ -0,0 +1,270 @@
+"""
+DAG 실행기
+각 노드가 선언한 입력/출력 State 키로 의존성을 계산하고,
+서로 독립적인 노드를 스레드 풀에서 동시에 실행
+"""
+
+import threading
+import traceback
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from models.citation import NodeSourceManager, SourceManager
+from tools.budget import BudgetManager
+from tools.metrics import MetricsCollector
+from .state import ReportState
+
+
+# ReportState에서 operator.add reducer로 누적되는 키
+# 노드마다 빈 리스트를 받고, 완료 후 공유 State에 이어 붙임
+ACCUMULATED_KEYS = ('errors', 'messages')
+
+
+@dataclass
+class Stage:
+    """
+    DAG 노드 정의
+    - inputs: 노드가 읽는 State 키
+    - outputs: 노드가 쓰는 State 키 (완료 후 공유 State에 병합)
+    """
+    name: str
+    func: Callable[[ReportState], ReportState]
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+
+
+class StageExecutionError(RuntimeError):
+    """노드 함수가 처리하지 못한 예외로 실행이 중단된 경우"""
+
+
+class DAGExecutor:
+    """
+    선언된 입력/출력 기반 DAG 실행기
+
+    의존성 규칙 (선언 순서 기준):
+    - 노드가 읽는 키는 앞서 선언된 노드 중 마지막으로 그 키를 쓰는 노드에 의존
+    - 같은 키를 쓰는 노드끼리는 선언 순서를 유지
+    - 어떤 노드도 쓰지 않는 키(config, source_manager 등)는 초기 State에서 읽음
+    따라서 결과는 순차 실행과 같고, 독립적인 노드만 동시에 실행됨
+    """
+
+    def __init__(self, stages: List[Stage], max_workers: int = 4):
+        names = [stage.name for stage in stages]
+        if len(names) != len(set(names)):
+            raise ValueError(f"노드 이름이 중복되었습니다: {names}")
+
+        self.stages = stages
+        self.max_workers = max(1, max_workers)
+        self.dependencies = self._build_dependencies()
+        self._state_lock = threading.Lock()
+
+    def _build_dependencies(self) -> Dict[str, Set[str]]:
+        """노드별 선행 노드 집합 계산"""
+        dependencies: Dict[str, Set[str]] = {}
+        last_writer: Dict[str, str] = {}
+
+        for stage in self.stages:
+            deps = set()
+            for key in list(stage.inputs) + list(stage.outputs):
+                if key in last_writer:
+                    deps.add(last_writer[key])
+            dependencies[stage.name] = deps
+
+            for key in stage.outputs:
+                last_writer[key] = stage.name
+
+        return dependencies
+
+    def get_execution_levels(self) -> List[List[str]]:
+        """동시에 실행 가능한 노드 묶음 (로그/디버깅용)"""
+        levels: List[List[str]] = []
+        done: Set[str] = set()
+        remaining = [stage.name for stage in self.stages]
+
+        while remaining:
+            ready = [name for name in remaining if self.dependencies[name] <= done]
+            levels.append(ready)
+            done.update(ready)
+            remaining = [name for name in remaining if name not in done]
+
+        return levels
+
+    def get_resumable_nodes(self, completed_nodes: Iterable[str]) -> Set[str]:
+        """
+        재실행하지 않아도 되는 노드 계산
+        본인과 모든 선행 노드가 정상 완료된 경우에만 건너뜀
+        """
+        completed_nodes = set(completed_nodes)
+        resumable: Set[str] = set()
+        for stage in self.stages:
+            if stage.name in completed_nodes and self.dependencies[stage.name] <= resumable:
+                resumable.add(stage.name)
+        return resumable
+
+    def run(
+        self,
+        state: ReportState,
+        completed_nodes: Optional[Iterable[str]] = None,
+        on_stage_complete: Optional[Callable[[ReportState, Set[str]], None]] = None
+    ) -> ReportState:
+        """
+        DAG 실행
+
+        Args:
+            state: 초기 State (노드 출력이 이 dict에 병합됨)
+            completed_nodes: 이전 실행에서 정상 완료된 노드 (체크포인트 재개 시)
+            on_stage_complete: 노드 병합 직후 호출 (State 스냅샷, 정상 완료 노드 집합)
+                               스냅샷의 출처는 실행 전부터 있던 것 + 정상 완료 노드가 추가한 것만 포함
+                               (실행 중/실패한 노드의 출처는 재개 시 다시 추가되므로 제외)
+
+        Returns:
+            모든 노드 실행 후의 State (state['metrics']에 노드별 실행 지표 포함)
+        """
+        # 재개 시 건너뛴 노드의 지표는 체크포인트 값 유지
+        metrics = MetricsCollector(state.get('metrics'))
+        # config에 web_search_budget / llm_token_budget이 있으면 노드별 예산 배정
+        budget = BudgetManager.from_config(state.get('config') or {})
+        stage_map = {stage.name: stage for stage in self.stages}
+        # completed: 의존성 스케줄링용 (실행이 끝난 노드)
+        # succeeded: 에러 없이 끝난 노드 (체크포인트 기록용)
+        completed: Set[str] = self.get_resumable_nodes(completed_nodes or [])
+        succeeded: Set[str] = set(completed)
+        pending = [stage.name for stage in self.stages if stage.name not in completed]
+        running = {}
+        failure = None
+        # 노드별 출처 기록 (체크포인트에는 정상 완료 노드의 출처만 저장)
+        node_sources: Dict[str, NodeSourceManager] = {}
+        shared_sources = state.get('source_manager')
+        if not isinstance(shared_sources, SourceManager):
+            shared_sources = None
+        initial_citation_ids = {c.id for c in list(shared_sources.citations)} if shared_sources else set()
+
+        if completed:
+            print(f"[DAG] 완료된 노드 건너뜀: {sorted(completed)}")
+            # 건너뛴 노드의 예산 몫은 처음부터 공용 풀로
+            for name in completed:
+                if budget is not None:
+                    budget.release(name)
+        print(f"[DAG] 실행 순서: {self.get_execution_levels()}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                # 1. 선행 노드가 모두 끝난 노드 제출
+                if failure is None:
+                    for name in list(pending):
+                        if self.dependencies[name] <= completed:
+                            pending.remove(name)
+                            local_state = self._make_local_state(state)
+                            if shared_sources is not None:
+                                node_sources[name] = local_state['source_manager'] = NodeSourceManager(shared_sources)
+                            future = pool.submit(self._run_stage, stage_map[name], local_state, metrics, budget)
+                            running[future] = name
+
+                if not running:
+                    break
+
+                # 2. 하나라도 끝나면 결과 병합
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if budget is not None:
+                        budget.release(name)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"[DAG] [FAIL] {name} 처리되지 않은 예외: {e}")
+                        state['errors'].append({
+                            'agent': name,
+                            'error': str(e),
+                            'traceback': traceback.format_exc(),
+                            'timestamp': datetime.now().isoformat()
+                        })
+                        failure = failure or name
+                        continue
+
+                    # source_manager를 출력으로 선언한 노드도 공유 SourceManager를 그대로 유지
+                    if name in node_sources and result.get('source_manager') is node_sources[name]:
+                        result['source_manager'] = shared_sources
+                    self._merge_outputs(state, stage_map[name], result)
+                    with self._state_lock:
+                        state['metrics'] = self._metrics_dict(metrics, budget)
+                    completed.add(name)
+
+                    # 노드 내부에서 처리된 에러가 있으면 재개 시 다시 실행
+                    if not result.get('errors'):
+                        succeeded.add(name)
+
+                    if on_stage_complete is not None:
+                        # 잠금 안에서는 스냅샷만 만들고, 직렬화/파일 쓰기는 잠금 밖에서
+                        with self._state_lock:
+                            snapshot = self._snapshot(state, succeeded, node_sources, initial_citation_ids)
+                        on_stage_complete(snapshot, set(succeeded))
+
+        state['metrics'] = self._metrics_dict(metrics, budget)
+
+        if failure is not None:
+            raise StageExecutionError(f"{failure} 노드 실행 실패")
+
+        return state
+
+    def _run_stage(self, stage: Stage, local_state: ReportState, metrics: MetricsCollector,
+                   budget: Optional[BudgetManager] = None) -> ReportState:
+        """작업 스레드에서 노드 실행 (지표/예산은 stage.name 노드에 집계)"""
+        with metrics.node(stage.name), (budget.scope(stage.name) if budget is not None else nullcontext()):
+            return stage.func(local_state)
+
+    @staticmethod
+    def _metrics_dict(metrics: MetricsCollector, budget: Optional[BudgetManager]) -> Dict:
+        from tools.circuit_breaker import breaker_states
+
+        result = metrics.to_dict()
+        if budget is not None:
+            result['budget'] = budget.to_dict()
+        breakers = breaker_states()
+        if breakers:
+            result['circuit_breakers'] = breakers
+        return result
+
+    @staticmethod
+    def _snapshot(state: ReportState, succeeded: Set[str], node_sources: Dict[str, NodeSourceManager],
+                  initial_citation_ids: Set[str]) -> ReportState:
+        """체크포인트용 State 사본 (누적 리스트 복사, 출처는 실행 전 + 정상 완료 노드 것만)"""
+        snapshot = dict(state)
+        for key in ACCUMULATED_KEYS:
+            snapshot[key] = list(state.get(key, []))
+
+        shared = state.get('source_manager')
+        if isinstance(shared, SourceManager) and node_sources:
+            allowed = set(initial_citation_ids)
+            for name, view in node_sources.items():
+                if name in succeeded:
+                    allowed.update(citation.id for citation in list(view.added))
+            sources = SourceManager()
+            for citation in list(shared.citations):
+                if citation.id in allowed:
+                    sources.add_existing_citation(citation)
+            snapshot['source_manager'] = sources
+        return snapshot
+
+    def _make_local_state(self, state: ReportState) -> ReportState:
+        """노드에 넘길 State 사본 (누적 리스트는 새로 생성)"""
+        with self._state_lock:
+            local_state = dict(state)
+        for key in ACCUMULATED_KEYS:
+            local_state[key] = []
+        return local_state
+
+    def _merge_outputs(self, state: ReportState, stage: Stage, result: ReportState) -> None:
+        """노드 결과 중 선언된 출력만 공유 State에 병합"""
+        with self._state_lock:
+            for key in stage.outputs:
+                if key in result:
+                    state[key] = result[key]
+            for key in ACCUMULATED_KEYS:
+                state[key].extend(result.get(key, []))
+
+
+__all__ = ['Stage', 'DAGExecutor', 'StageExecutionError', 'ACCUMULATED_KEYS']
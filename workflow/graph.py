@@ -2,28 +2,95 @@
 LangGraph  
 """
 
-from langgraph.graph import StateGraph, END
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 import traceback
 from datetime import datetime
 
 from .state import ReportState
-from agents.market_trend_agent import MarketTrendAgent
-from agents.supplier_matching_agent import SupplierMatchingAgent
-from agents.financial_analyzer_agent import FinancialAnalyzerAgent
-from agents.risk_assessment_agent_improved import RiskAssessmentAgent
-from agents.investment_strategy_agent import InvestmentStrategyAgent
-from agents.report_generator_agent import ReportGeneratorAgent
+from .executor import Stage, DAGExecutor
+from .memo import AgentMemo
 
+# langgraph와 에이전트 모듈은 워크플로우를 만들 때 import (--help, --list-runs 등 시작 시간 단축)
 
-def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None):
+
+# ==========================================
+# 노드별 입력/출력 State 키 선언 (DAG 실행기 의존성 계산용)
+# config_keys: 노드가 실제로 읽는 config 항목 (메모 키에는 config 중 이 항목만 포함
+#              → 보고서 전용 설정(target_audience, language 등)을 바꿔도 앞 단계는 메모에서 복원)
+# ==========================================
+
+NODE_SPECS = [
+    {
+        'name': 'market_trend_node',
+        'inputs': ['config', 'suppliers'],
+        'config_keys': ['days_ago', 'max_news_articles', 'results_per_query', 'relaxed_mode',
+                        'article_store_path', 'article_store_refresh_hours',
+                        'fetch_full_text', 'full_text_max_chars',
+                        'max_disclosures_per_company', 'max_sec_filings_per_company'],
+        'outputs': ['news_articles', 'disclosure_data', 'keywords',
+                    'categorized_keywords', 'market_trends', 'suppliers']
+    },
+    {
+        'name': 'supplier_matching_node',
+        'inputs': ['config', 'categorized_keywords'],
+        'config_keys': [],
+        'outputs': ['suppliers', 'supplier_discovery_summary']
+    },
+    {
+        # 정성 리스크 웹 검색은 suppliers만 필요 → 재무 분석과 동시 실행
+        'name': 'risk_prefetch_node',
+        'inputs': ['config', 'suppliers'],
+        'config_keys': [],
+        'outputs': ['qualitative_risks']
+    },
+    {
+        'name': 'financial_analysis_node',
+        'inputs': ['config', 'suppliers', 'news_articles', 'disclosure_data',
+                   'market_trends', 'categorized_keywords'],
+        'config_keys': ['max_target_companies'],
+        'outputs': ['financial_analysis']
+    },
+    {
+        'name': 'risk_assessment_node',
+        'inputs': ['config', 'suppliers', 'financial_analysis', 'qualitative_risks'],
+        'config_keys': [],
+        'outputs': ['risk_assessment']
+    },
+    {
+        'name': 'investment_strategy_node',
+        'inputs': ['config', 'market_trends', 'financial_analysis', 'risk_assessment'],
+        'config_keys': [],
+        'outputs': ['investment_strategy', 'investment_opportunities',
+                    'portfolio_recommendation']
+    },
+    {
+        'name': 'report_generation_node',
+        'inputs': ['config', 'news_articles', 'disclosure_data', 'categorized_keywords',
+                   'market_trends', 'suppliers', 'financial_analysis',
+                   'risk_assessment', 'investment_strategy', 'source_manager'],
+        'config_keys': [],
+        'outputs': ['final_report', 'glossary', 'investor_guide']
+    },
+]
+
+
+def create_nodes(web_search_tool, llm_tool, dart_tool, sec_tool=None, memo: AgentMemo = None,
+                 gnews_tool=None, yahoo_tool=None) -> Dict[str, Callable]:
     """
-    워크플로우 생성
-    CoT 체인으로 연결된 에이전트 파이프라인
+    노드 함수 생성
+    LangGraph 워크플로우와 DAG 실행기가 같은 노드 함수를 사용
+    memo가 주어지면 NODE_SPECS 입력 슬라이스 기준으로 노드 출력을 메모이제이션
     """
+    from agents.market_trend_agent import MarketTrendAgent
+    from agents.supplier_matching_agent import SupplierMatchingAgent
+    from agents.financial_analyzer_agent import FinancialAnalyzerAgent
+    from agents.risk_assessment_agent_improved import RiskAssessmentAgent
+    from agents.investment_strategy_agent import InvestmentStrategyAgent
+    from agents.report_generator_agent import ReportGeneratorAgent
     
     # Agent 초기화 (순서 중요)
-    market_agent = MarketTrendAgent(web_search_tool, llm_tool, dart_tool)
+    market_agent = MarketTrendAgent(web_search_tool, llm_tool, dart_tool, sec_tool=sec_tool,
+                                    gnews_tool=gnews_tool, yahoo_tool=yahoo_tool)
     supplier_agent = SupplierMatchingAgent(web_search_tool, llm_tool)
     financial_agent = FinancialAnalyzerAgent(web_search_tool, llm_tool, dart_tool, sec_tool=sec_tool)  # 🆕 SEC tool 추가
     risk_agent = RiskAssessmentAgent(web_search_tool, llm_tool)
@@ -56,9 +123,8 @@ def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None):
             #   suppliers  ( suppliers )
             discovered_companies = result.get('discovered_companies', [])
             if discovered_companies:
-                existing_suppliers = state.get('suppliers', [])
-                existing_suppliers.extend(discovered_companies)
-                state['suppliers'] = existing_suppliers
+                # 얕은 복사된 State의 리스트를 수정하지 않도록 새 리스트 생성 (동시 실행 노드/체크포인트 보호)
+                state['suppliers'] = list(state.get('suppliers', [])) + discovered_companies
                 print(f"   [OK]   : {len(discovered_companies)}")
 
             state['messages'].append(
@@ -176,6 +242,27 @@ def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None):
         
         return state
     
+    def risk_prefetch_node(state: ReportState) -> ReportState:
+        """
+        3-1. 정성 리스크 사전 수집 (재무 분석과 동시 실행)
+        """
+        print("\n" + "="*60)
+        print("[RiskAssessmentAgent] 정성 리스크 사전 수집")
+        print("="*60)
+        
+        try:
+            state['qualitative_risks'] = risk_agent.prefetch_qualitative_risks(state)
+            
+            print(f"   [OK] 사전 수집 기업: {len(state['qualitative_risks'])}")
+            print("[OK] \n")
+            
+        except Exception as e:
+            # 사전 수집 실패 시 risk_assessment_node에서 기업별로 다시 수집
+            print(f"[WARNING] 정성 리스크 사전 수집 실패: {str(e)}")
+            state['qualitative_risks'] = {}
+        
+        return state
+    
     def risk_assessment_node(state: ReportState) -> ReportState:
         """
         4.   ( )
@@ -229,6 +316,8 @@ def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None):
             result = strategy_agent.develop_investment_strategy(state)
             
             state['investment_strategy'] = result.get('investment_strategy', {})
+            state['investment_opportunities'] = result.get('investment_opportunities', [])
+            state['portfolio_recommendation'] = result.get('portfolio_recommendation', {})
             
             state['messages'].append(
                 f"[OK] InvestmentStrategyAgent  - {datetime.now().isoformat()}"
@@ -299,36 +388,89 @@ def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None):
         
         return state
     
+    nodes = {
+        'market_trend_node': market_trend_node,
+        'supplier_matching_node': supplier_matching_node,
+        'risk_prefetch_node': risk_prefetch_node,
+        'financial_analysis_node': financial_analysis_node,
+        'risk_assessment_node': risk_assessment_node,
+        'investment_strategy_node': investment_strategy_node,
+        'report_generation_node': report_generation_node,
+    }
+    
+    if memo is not None:
+        # 에이전트 설정/코드가 키에 포함되므로 보고서 템플릿만 바꾸면 보고서 노드만 재실행
+        node_agents = {
+            'market_trend_node': market_agent,
+            'supplier_matching_node': supplier_agent,
+            'risk_prefetch_node': risk_agent,
+            'financial_analysis_node': financial_agent,
+            'risk_assessment_node': risk_agent,
+            'investment_strategy_node': strategy_agent,
+            'report_generation_node': report_agent,
+        }
+        for spec in NODE_SPECS:
+            name = spec['name']
+            nodes[name] = memo.wrap(name, nodes[name], spec['inputs'], spec['outputs'], node_agents[name],
+                                    config_keys=spec.get('config_keys'))
+    
+    return nodes
+
+
+def create_workflow(web_search_tool, llm_tool, dart_tool, sec_tool=None, memo: AgentMemo = None,
+                    gnews_tool=None, yahoo_tool=None):
+    """
+    워크플로우 생성
+    CoT 체인으로 연결된 에이전트 파이프라인
+    """
+    from langgraph.graph import StateGraph, END
+    
+    nodes = create_nodes(web_search_tool, llm_tool, dart_tool, sec_tool=sec_tool, memo=memo,
+                         gnews_tool=gnews_tool, yahoo_tool=yahoo_tool)
+    
     # ==========================================
     #  
     # ==========================================
     
     workflow = StateGraph(ReportState)
     
-    #
-    workflow.add_node("market_trend_node", market_trend_node)
-    workflow.add_node("supplier_matching_node", supplier_matching_node)
-    workflow.add_node("financial_analysis_node", financial_analysis_node)
-    workflow.add_node("risk_assessment_node", risk_assessment_node)
-    workflow.add_node("investment_strategy_node", investment_strategy_node)
-    workflow.add_node("report_generation_node", report_generation_node)
+    # NODE_SPECS 선언 순서대로 노드 추가 및 순차 연결
+    node_names = [spec['name'] for spec in NODE_SPECS]
+    for name in node_names:
+        workflow.add_node(name, nodes[name])
 
-    #   (일부 병렬 처리 가능하도록 개선)
-    # 시작점은 market_trend와 supplier_matching을 병렬로 실행할 수 없음 (supplier가 market 결과 필요)
-    # 하지만 financial_analysis와 risk_assessment는 병렬 실행 불가 (risk가 financial 필요)
-    # 현재 LangGraph 구조상 완전한 병렬화는 어려우므로 순차 유지
-    # 대신 각 에이전트 내부에서 병렬 처리 최적화
-    workflow.set_entry_point("market_trend_node")
+    # LangGraph 버전은 순차 실행 유지
+    # 독립 노드 동시 실행은 create_executor()의 DAG 실행기 사용
+    workflow.set_entry_point(node_names[0])
 
-    workflow.add_edge("market_trend_node", "supplier_matching_node")
-    workflow.add_edge("supplier_matching_node", "financial_analysis_node")
-    workflow.add_edge("financial_analysis_node", "risk_assessment_node")
-    workflow.add_edge("risk_assessment_node", "investment_strategy_node")
-    workflow.add_edge("investment_strategy_node", "report_generation_node")
-    workflow.add_edge("report_generation_node", END)
+    for current_node, next_node in zip(node_names, node_names[1:]):
+        workflow.add_edge(current_node, next_node)
+    workflow.add_edge(node_names[-1], END)
     
     # 그래프 컴파일 (체크포인팅 없이)
     # checkpointer를 명시적으로 제거
     app = workflow.compile()
 
     return app
+
+
+def create_executor(web_search_tool, llm_tool, dart_tool, sec_tool=None, max_workers: int = 4,
+                    memo: AgentMemo = None, gnews_tool=None, yahoo_tool=None) -> DAGExecutor:
+    """
+    DAG 실행기 생성
+    NODE_SPECS의 입력/출력 선언으로 의존성을 계산하여 독립 노드를 동시 실행
+    """
+    nodes = create_nodes(web_search_tool, llm_tool, dart_tool, sec_tool=sec_tool, memo=memo,
+                         gnews_tool=gnews_tool, yahoo_tool=yahoo_tool)
+    
+    stages = [
+        Stage(
+            name=spec['name'],
+            func=nodes[spec['name']],
+            inputs=spec['inputs'],
+            outputs=spec['outputs']
+        )
+        for spec in NODE_SPECS
+    ]
+    
+    return DAGExecutor(stages, max_workers=max_workers)
@@ -0,0 +1,241 @@
+"""
+에이전트 결과 메모이제이션
+노드가 읽는 State 슬라이스 + config + 에이전트 설정/코드의 해시를 키로
+노드 출력 전체를 저장하고, 입력이 같으면 에이전트를 다시 실행하지 않음
+(보고서 문구만 바꾼 경우 데이터 수집/분석 단계는 메모에서 복원)
+"""
+
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from models.citation import Citation, NodeSourceManager, SourceManager, citation_to_dict
+from tools.metrics import record
+from .checkpoint import _json_default
+from .state import ReportState
+
+
+MEMO_DIR = os.path.join("cache", "agent_memo")
+DEFAULT_MEMO_TTL = 86400  # 24시간 (CacheManager와 동일)
+
+# 결과에 영향을 주지 않는 실행 옵션 (노드가 읽는 config 항목을 선언하지 않은 경우 키 계산에서 제외)
+MEMO_IGNORED_CONFIG_KEYS = ('max_workers', 'memo_enabled', 'memo_ttl')
+
+
+def _file_digest(path: Optional[str]) -> str:
+    """소스 파일 내용 해시 (파일이 없으면 빈 문자열)"""
+    if not path or not os.path.exists(path):
+        return ''
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _module_digest(obj: Any) -> str:
+    """객체 클래스가 정의된 모듈의 소스 해시"""
+    module = sys.modules.get(type(obj).__module__)
+    try:
+        return _file_digest(inspect.getsourcefile(module)) if module else ''
+    except TypeError:
+        return ''
+
+
+def agent_fingerprint(agent: Any) -> Dict[str, Any]:
+    """
+    에이전트 설정/코드 지문
+    - 에이전트 모듈 소스 (프롬프트, 보고서 템플릿 등)
+    - JSON으로 표현 가능한 속성 (가중치, 리스크 기준 등)
+    - 에이전트가 들고 있는 tools/agents 객체의 모듈 소스
+    - LLM 모델명
+    """
+    if agent is None:
+        return {}
+
+    settings = {}
+    dependencies = {}
+    for name, value in sorted(vars(agent).items()):
+        try:
+            json.dumps(value, sort_keys=True)
+            settings[name] = value
+            continue
+        except (TypeError, ValueError):
+            pass
+
+        module_name = type(value).__module__
+        if module_name.startswith(('tools.', 'agents.')):
+            dependencies[module_name] = _module_digest(value)
+
+    llm_tool = getattr(agent, 'llm_tool', None)
+
+    return {
+        'agent': f"{type(agent).__module__}.{type(agent).__name__}",
+        'source': _module_digest(agent),
+        'settings': settings,
+        'dependencies': dependencies,
+        'llm_model': getattr(llm_tool, 'model', None)
+    }
+
+
+def _slice_value(key: str, value: Any, config_keys: Optional[List[str]] = None) -> Any:
+    """State 값 → 해시용 값 (config는 config_keys 항목만, 없으면 실행 옵션을 뺀 전체)"""
+    if key == 'config':
+        value = value or {}
+        if config_keys is not None:
+            return {k: value.get(k) for k in config_keys}
+        return {k: v for k, v in value.items() if k not in MEMO_IGNORED_CONFIG_KEYS}
+    if isinstance(value, SourceManager):
+        # 출처 목록은 id 집합으로 비교
+        return sorted(citation.id for citation in value.citations)
+    return value
+
+
+class AgentMemo:
+    """
+    노드 출력 메모 저장소
+    cache/agent_memo/<node_name>/<key>.json.gz
+    - outputs: 노드가 선언한 출력 State 키 값
+    - citations: 노드 실행 중 SourceManager에 추가된 출처 (복원 시 다시 등록)
+    """
+
+    def __init__(self, base_dir: str = MEMO_DIR, ttl: int = DEFAULT_MEMO_TTL):
+        self.base_dir = base_dir
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # hits/misses (노드는 작업 스레드에서 동시에 실행)
+
+    def compute_key(self, name: str, state: ReportState, inputs: List[str], fingerprint: Dict[str, Any],
+                    config_keys: Optional[List[str]] = None) -> str:
+        """노드 이름 + 입력 슬라이스 + 에이전트 지문 해시 (config는 config_keys 항목만)"""
+        payload = {
+            'node': name,
+            'inputs': {key: _slice_value(key, state.get(key), config_keys) for key in inputs},
+            'agent': fingerprint
+        }
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=_json_default)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, name: str, key: str) -> str:
+        return os.path.join(self.base_dir, name, f"{key}.json.gz")
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """메모 조회 (없거나 만료되면 None)"""
+        path = self._entry_path(name, key)
+        try:
+            if not os.path.exists(path):
+                return None
+
+            if self.ttl and time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)  # 만료된 메모 삭제
+                return None
+
+            with open(path, 'rb') as f:
+                return json.loads(gzip.decompress(f.read()).decode('utf-8'))
+
+        except Exception as e:
+            print(f"    [WARNING] 메모 조회 실패 ({name}): {e}")
+            return None
+
+    def set(self, name: str, key: str, outputs: Dict[str, Any], citations: List[Citation]) -> None:
+        """노드 출력 저장"""
+        path = self._entry_path(name, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            entry = {
+                'node': name,
+                'timestamp': datetime.now().isoformat(),
+                'outputs': outputs,
+                'citations': [citation_to_dict(c) for c in citations]
+            }
+            payload = json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(payload.encode('utf-8')))
+            os.replace(tmp_path, path)
+
+        except Exception as e:
+            print(f"    [WARNING] 메모 저장 실패 ({name}): {e}")
+
+    def wrap(
+        self,
+        name: str,
+        func: Callable[[ReportState], ReportState],
+        inputs: List[str],
+        outputs: List[str],
+        agent: Any = None,
+        config_keys: Optional[List[str]] = None
+    ) -> Callable[[ReportState], ReportState]:
+        """
+        노드 함수에 메모 레이어 적용
+        입력 해시가 같으면 저장된 출력/출처를 State에 복원하고 에이전트 실행 생략
+        """
+        fingerprint = agent_fingerprint(agent)
+
+        def memoized_node(state: ReportState) -> ReportState:
+            key = self.compute_key(name, state, inputs, fingerprint, config_keys)
+            entry = self.get(name, key)
+
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                record('memo_hits')
+                source_manager = state['source_manager']
+                for citation_data in entry.get('citations', []):
+                    source_manager.add_existing_citation(Citation(**citation_data))
+                for output_key, value in entry.get('outputs', {}).items():
+                    state[output_key] = value
+
+                print(f"\n[CACHE] {name} 메모에서 복원 ({entry.get('timestamp', '')})")
+                state['messages'].append(f"[CACHE] {name} 메모 복원 - {datetime.now().isoformat()}")
+                return state
+
+            with self._lock:
+                self.misses += 1
+            record('memo_misses')
+            source_manager = state['source_manager']
+            node_sources = NodeSourceManager(source_manager)
+            error_count = len(state['errors'])
+
+            state['source_manager'] = node_sources
+            try:
+                result = func(state)
+            finally:
+                state['source_manager'] = source_manager
+            if result.get('source_manager') is node_sources:
+                result['source_manager'] = source_manager
+
+            # 노드 내부에서 에러를 처리한 경우(fallback 값) 메모하지 않음
+            if len(result.get('errors', [])) > error_count:
+                return result
+
+            self.set(
+                name, key,
+                {output_key: result[output_key] for output_key in outputs if output_key in result},
+                node_sources.added
+            )
+            return result
+
+        memoized_node.__name__ = name
+        return memoized_node
+
+    def clear(self) -> int:
+        """메모 전체 삭제 (삭제한 파일 수 반환)"""
+        removed = 0
+        if not os.path.exists(self.base_dir):
+            return removed
+        for root, _, files in os.walk(self.base_dir):
+            for filename in files:
+                os.remove(os.path.join(root, filename))
+                removed += 1
+        return removed
+
+
+__all__ = ['AgentMemo', 'agent_fingerprint', 'MEMO_DIR', 'DEFAULT_MEMO_TTL']
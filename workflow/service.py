@@ -0,0 +1,221 @@
+"""
+상주 보고서 서비스
+도구(DART 기업 코드, SEC 세션, 응답 캐시)를 메모리에 유지한 채
+로컬 HTTP API로 보고서 작업을 받아 큐 순서대로 실행
+
+    POST /jobs          config override(JSON) 제출 → {"job_id": ...}
+    GET  /jobs          작업 목록
+    GET  /jobs/<id>     작업 상태/결과 요약
+    GET  /health        서비스 상태 (큐 길이 등)
+
+끝난 작업(완료/실패)은 최근 max_finished_jobs건만 보관 (오래된 작업부터 삭제)
+"""
+
+import json
+import queue
+import threading
+import traceback
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+MAX_FINISHED_JOBS = 100  # 상주 프로세스에서 결과를 보관할 끝난 작업 수
+
+
+class ReportService:
+    """
+    보고서 작업 큐 + 워커 스레드
+
+    runner는 (job_id, config override) → 결과 요약 dict를 반환하는 함수
+    도구 인스턴스를 runner 클로저에 묶어두므로 작업 간 콜드 스타트 비용이 없음
+    (테스트에서는 외부 API 대신 로컬 대체 도구로 만든 runner를 넘기면 됨)
+    """
+
+    def __init__(self, runner: Callable[[str, Dict[str, Any]], Dict[str, Any]], num_workers: int = 1,
+                 max_finished_jobs: int = MAX_FINISHED_JOBS):
+        self.runner = runner
+        self.num_workers = max(1, num_workers)
+        self.max_finished_jobs = max(0, max_finished_jobs)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"report-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: float = None) -> None:
+        """실행 중인 작업이 끝나면 워커 종료"""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def submit(self, overrides: Dict[str, Any]) -> str:
+        """작업 등록 후 job_id 반환"""
+        job_id = datetime.now().strftime('%Y%m%d_%H%M%S_') + uuid.uuid4().hex[:6]
+        with self._lock:
+            self.jobs[job_id] = {
+                'job_id': job_id,
+                'status': JOB_QUEUED,
+                'config': overrides,
+                'submitted_at': datetime.now().isoformat(),
+                'started_at': None,
+                'finished_at': None,
+                'result': None,
+                'error': None
+            }
+        self._queue.put(job_id)
+        print(f"[SERVICE] 작업 등록: {job_id} (대기 {self._queue.qsize()}건)")
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {key: job[key] for key in ('job_id', 'status', 'submitted_at', 'finished_at')}
+                for job in self.jobs.values()
+            ]
+
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self.jobs.values():
+                counts[job['status']] = counts.get(job['status'], 0) + 1
+        return {
+            'status': 'ok',
+            'workers': len(self._workers),
+            'queue_size': self._queue.qsize(),
+            'jobs': counts
+        }
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            self.jobs[job_id].update(fields)
+            if fields.get('status') in (JOB_DONE, JOB_FAILED):
+                self._prune_finished()
+
+    def _prune_finished(self) -> None:
+        """끝난 작업이 max_finished_jobs건을 넘으면 오래된 것부터 삭제 (self._lock 안에서 호출)"""
+        finished = [job_id for job_id, job in self.jobs.items() if job['status'] in (JOB_DONE, JOB_FAILED)]
+        excess = len(finished) - self.max_finished_jobs
+        if excess <= 0:
+            return
+        finished.sort(key=lambda job_id: self.jobs[job_id]['finished_at'] or '')
+        for job_id in finished[:excess]:
+            del self.jobs[job_id]
+
+    def _worker_loop(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                break
+
+            job = self.get_job(job_id)
+            self._update(job_id, status=JOB_RUNNING, started_at=datetime.now().isoformat())
+            print(f"[SERVICE] 작업 시작: {job_id}")
+
+            try:
+                result = self.runner(job_id, job['config'])
+                status = JOB_DONE if result is not None else JOB_FAILED
+                self._update(job_id, status=status, result=result, finished_at=datetime.now().isoformat())
+                print(f"[SERVICE] [OK] 작업 완료: {job_id}")
+            except Exception as e:
+                # 작업 하나의 실패로 서비스가 멈추지 않도록 기록만 남김
+                self._update(
+                    job_id, status=JOB_FAILED, error=str(e),
+                    result={'traceback': traceback.format_exc()},
+                    finished_at=datetime.now().isoformat()
+                )
+                print(f"[SERVICE] [FAIL] 작업 실패: {job_id} - {e}")
+
+
+class _ServiceRequestHandler(BaseHTTPRequestHandler):
+    """ReportService용 JSON HTTP 핸들러"""
+
+    service: ReportService = None
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.rstrip('/')
+        if path == '/health':
+            self._send_json(200, self.service.health())
+        elif path == '/jobs':
+            self._send_json(200, self.service.list_jobs())
+        elif path.startswith('/jobs/'):
+            job = self.service.get_job(path[len('/jobs/'):])
+            if job is None:
+                self._send_json(404, {'error': 'job not found'})
+            else:
+                self._send_json(200, job)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            overrides = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(overrides, dict):
+                raise ValueError("config override는 JSON object여야 합니다")
+        except Exception as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        job_id = self.service.submit(overrides)
+        self._send_json(202, {'job_id': job_id, 'status': JOB_QUEUED})
+
+    def log_message(self, format, *args):
+        # 기본 stderr 접근 로그 대신 서비스 로그 형식 사용
+        print(f"[SERVICE] {self.address_string()} {format % args}")
+
+
+def create_server(service: ReportService, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """ReportService를 감싼 HTTP 서버 생성 (serve_forever()로 실행)"""
+    handler = type('ReportServiceHandler', (_ServiceRequestHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(service: ReportService, host: str = '127.0.0.1', port: int = 8765) -> None:
+    """서비스 실행 (Ctrl+C로 종료)"""
+    server = create_server(service, host, port)
+    service.start()
+    print(f"[SERVICE] http://{host}:{port} 대기 중 (워커 {service.num_workers}개)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[SERVICE] 종료 중...")
+    finally:
+        server.server_close()
+        service.stop(timeout=5)
+
+
+__all__ = ['ReportService', 'create_server', 'serve',
+           'JOB_QUEUED', 'JOB_RUNNING', 'JOB_DONE', 'JOB_FAILED']
@@ -45,6 +45,9 @@ class ReportState(TypedDict):
     market_trends: List[Dict[str, Any]]
     """ """
     
+    disclosure_data: List[Dict[str, Any]]
+    """공시/재무 데이터 (DART, SEC, Yahoo Finance)"""
+    
     # ==========================================
     # SupplierMatchingAgent 
     # ==========================================
@@ -55,6 +58,9 @@ class ReportState(TypedDict):
     [{'company': 'LG', 'relationship': {...}, ...}]
     """
     
+    supplier_discovery_summary: Dict[str, Any]
+    """공급업체 발견 요약 (신뢰도별 개수)"""
+    
     # ==========================================
     # FinancialAnalyzerAgent 
     # ==========================================
@@ -72,6 +78,12 @@ class ReportState(TypedDict):
     # RiskAssessmentAgent 
     # ==========================================
     
+    qualitative_risks: Dict[str, Dict[str, Any]]
+    """
+    기업별 정성 리스크 (재무 분석과 동시에 사전 수집)
+    {'Tesla': {'all_risks': [...], 'qualitative_score': 0.2, ...}}
+    """
+    
     risk_assessment: Dict[str, Any]
     """
       
@@ -96,6 +108,12 @@ class ReportState(TypedDict):
     }
     """
     
+    investment_opportunities: List[Dict[str, Any]]
+    """투자 기회 목록"""
+    
+    portfolio_recommendation: Dict[str, Any]
+    """포트폴리오 추천"""
+    
     # ==========================================
     # ReportGeneratorAgent 
     # ==========================================
@@ -113,6 +131,9 @@ class ReportState(TypedDict):
     }
     """
     
+    investor_guide: Dict[str, Any]
+    """투자자 가이드"""
+    
     # ==========================================
     #   
     # ==========================================
@@ -132,6 +153,12 @@ class ReportState(TypedDict):
     
     messages: Annotated[List[str], operator.add]
     """ """
+    
+    metrics: Dict[str, Any]
+    """
+    노드별 실행 지표 (DAG 실행기가 기록)
+    {'nodes': {'market_trend_node': {'wall_time': ..., 'llm_calls': ..., ...}}, 'totals': {...}}
+    """
 
 
 def create_initial_state(config: Dict[str, Any]) -> ReportState:
@@ -146,14 +173,21 @@ def create_initial_state(config: Dict[str, Any]) -> ReportState:
         'keywords': config.get('keywords', []),  # config keywords 
         'categorized_keywords': {},
         'market_trends': [],
+        'disclosure_data': [],
         'suppliers': [],
+        'supplier_discovery_summary': {},
         'financial_analysis': {},
+        'qualitative_risks': {},
         'risk_assessment': {},
         'investment_strategy': {},
+        'investment_opportunities': [],
+        'portfolio_recommendation': {},
         'glossary': {},
         'final_report': {},
+        'investor_guide': {},
         'source_manager': source_manager,
         'citations': {},
         'errors': [],
-        'messages': []
+        'messages': [],
+        'metrics': {}
     }
\ No newline at end of file